@@ -0,0 +1,80 @@
+"""
+Fetches a batch of stories from a local stand-in server that adds a
+fixed latency to every response, one by one with Client and all at once
+with AsyncClient.get_stories::
+
+    python benchmarks/async_bench.py --stories 500 --latency 0.02
+
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, os.pardir))
+sys.path.insert(0, HERE)
+
+from clubhouse.client import AsyncClient, Client  # noqa: E402
+from client_bench import stories  # noqa: E402
+from tests.standin import StandIn  # noqa: E402
+
+
+def sequential(server, ids):
+    with Client('token', api_url=server.url) as client:
+        return client.get_stories(ids)
+
+
+def concurrent(server, ids, concurrency):
+    async def fetch():
+        async with AsyncClient('token', api_url=server.url,
+                               concurrency=concurrency) as client:
+            return await client.get_stories(ids)
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(fetch())
+    finally:
+        loop.close()
+
+
+def measure(server, func, *args):
+    server.reset()
+    start = time.perf_counter()
+    result = func(server, *args)
+    return result, {'seconds': time.perf_counter() - start,
+                    'connections': server.counters['connections']}
+
+
+def main():
+    options = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    options.add_argument('--stories', type=int, default=500)
+    options.add_argument('--latency', type=float, default=0.02)
+    options.add_argument('--concurrency', type=int, default=20)
+    options.add_argument('--seed', type=int, default=0)
+    args = options.parse_args()
+
+    rng = random.Random(args.seed)
+    with StandIn({'stories': stories(args.stories, rng)},
+                 latency=args.latency) as server:
+        ids = list(range(args.stories))
+        expected, client = measure(server, sequential, ids)
+        actual, async_client = measure(server, concurrent, ids,
+                                       args.concurrency)
+    assert expected == actual, 'AsyncClient loaded different stories'
+
+    json.dump({
+        'stories': args.stories,
+        'latency': args.latency,
+        'concurrency': args.concurrency,
+        'client': client,
+        'async_client': async_client,
+        'speedup': client['seconds'] / async_client['seconds'],
+    }, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Re-reads the same projects, workflows, members and labels over and over,
+as a job does, from a local stand-in server with a fixed latency:
+without a cache, with a ResponseCache that revalidates every time, and
+with one that uses them for a minute::
+
+    python benchmarks/cache_bench.py --rounds 20 --latency 0.005
+
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, os.pardir))
+sys.path.insert(0, HERE)
+
+from clubhouse import models  # noqa: E402
+from clubhouse.cache import ResponseCache  # noqa: E402
+from clubhouse.client import Client  # noqa: E402
+from tests.fixtures import synthetic_payload  # noqa: E402
+from tests.standin import StandIn  # noqa: E402
+
+RESOURCES = (
+    ('projects', models.Project, Client.get_project),
+    ('workflows', models.Workflow, Client.get_workflow),
+    ('members', models.Member, Client.get_member),
+    ('labels', models.Label, Client.get_label),
+)
+
+
+def resources(count, rng):
+    rv = {}
+    for name, schema, _ in RESOURCES:
+        rv[name] = {}
+        for resource_id in range(count):
+            rv[name][resource_id] = synthetic_payload(schema, rng)
+    return rv
+
+
+def run(server, args, cache):
+    server.reset()
+    with Client('token', api_url=server.url, cache=cache) as client:
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            loaded = [get(client, resource_id)
+                      for _, _, get in RESOURCES
+                      for resource_id in range(args.count)]
+        elapsed = time.perf_counter() - start
+
+        # a change on the server is picked up on revalidation
+        server.resources['labels'][0]['name'] = 'renamed'
+        renamed = client.get_label(0).name == 'renamed'
+    return loaded, {
+        'seconds': elapsed,
+        'requests': server.counters['requests'],
+        'not_modified': server.counters['not_modified'],
+        'sees_changes': renamed,
+    }
+
+
+def main():
+    options = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    options.add_argument('--rounds', type=int, default=20)
+    options.add_argument('--count', type=int, default=20,
+                         help='resources of each kind')
+    options.add_argument('--latency', type=float, default=0.005)
+    options.add_argument('--seed', type=int, default=0)
+    args = options.parse_args()
+
+    report = {'rounds': args.rounds, 'count': args.count,
+              'latency': args.latency}
+    expected = None
+    for name, cache in (('no_cache', None),
+                        ('revalidate', ResponseCache(ttls=dict.fromkeys(
+                            ('projects', 'workflows', 'members', 'labels'),
+                            0))),
+                        ('ttl', ResponseCache())):
+        data = resources(args.count, random.Random(args.seed))
+        with StandIn(data, latency=args.latency) as server:
+            loaded, report[name] = run(server, args, cache)
+        assert expected is None or loaded == expected
+        expected = loaded
+
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Fetches stories from a local stand-in server with a plain requests.get
+per call, as most callers do today, and with clubhouse.client.Client::
+
+    python benchmarks/client_bench.py --requests 2000
+
+Both load the response into a StoryModel. The stand-in is plain HTTP,
+so the handshake saved by keep-alive is TCP only; against the real API
+every new connection also pays for TLS.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, os.pardir))
+sys.path.insert(0, HERE)
+
+import requests  # noqa: E402
+
+from clubhouse import models  # noqa: E402
+from clubhouse.client import Client  # noqa: E402
+from tests.fixtures import EXAMPLE_STORY, synthetic_payload  # noqa: E402
+from tests.standin import StandIn  # noqa: E402
+
+
+def stories(count, rng):
+    """ Synthesized stories, with the fields the docs don't list that
+    the API sends along. """
+    rv = {}
+    for story_id in range(count):
+        payload = dict(EXAMPLE_STORY, **synthetic_payload(models.Story, rng))
+        payload['id'] = story_id
+        rv[story_id] = payload
+    return rv
+
+
+def unpooled(server, ids):
+    schema = models.Story()
+    for story_id in ids:
+        response = requests.get(
+            '{0}/stories/{1}'.format(server.url, story_id),
+            params={'token': 'token'}, timeout=30)
+        response.raise_for_status()
+        schema.load(response.json())
+
+
+def pooled(server, ids):
+    with Client('token', api_url=server.url) as client:
+        for story_id in ids:
+            client.get_story(story_id)
+
+
+def measure(server, func, ids):
+    server.reset()
+    start = time.perf_counter()
+    func(server, ids)
+    return {'seconds': time.perf_counter() - start,
+            'connections': server.counters['connections']}
+
+
+def main():
+    options = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    options.add_argument('--requests', type=int, default=2000)
+    options.add_argument('--stories', type=int, default=100)
+    options.add_argument('--seed', type=int, default=0)
+    args = options.parse_args()
+
+    rng = random.Random(args.seed)
+    with StandIn({'stories': stories(args.stories, rng)}) as server:
+        ids = [rng.randrange(args.stories) for _ in range(args.requests)]
+        baseline = measure(server, unpooled, ids)
+        client = measure(server, pooled, ids)
+
+    json.dump({
+        'requests': args.requests,
+        'requests_get': baseline,
+        'client': client,
+        'speedup': baseline['seconds'] / client['seconds'],
+    }, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,194 @@
+"""
+Benchmarks for clubhouse/dag.py on synthetic graphs.
+
+Times the common DAG operations on random DAGs, long chains, wide
+fan-outs and layered graphs, records the peak memory of building each
+graph and prints the results as JSON so runs can be diffed across
+commits::
+
+    python benchmarks/dag_bench.py --sizes 1000 10000 100000 > before.json
+
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, 'clubhouse'))
+
+import dag  # noqa: E402
+
+
+def random_dag(n, seed=0, edges_per_node=3):
+    """ Random edges, always from a lower to a higher node. """
+    rng = random.Random(seed)
+    for _ in range(n * edges_per_node):
+        a, b = rng.randrange(n), rng.randrange(n)
+        if a != b:
+            yield min(a, b), max(a, b)
+
+
+def chain(n, seed=0):
+    for i in range(n - 1):
+        yield i, i + 1
+
+
+def fan_out(n, seed=0):
+    for i in range(1, n):
+        yield 0, i
+
+
+def layered(n, seed=0, width=100, edges_per_node=3):
+    """ Layers of ``width`` nodes, each node feeding the next layer. """
+    rng = random.Random(seed)
+    for i in range(n - width):
+        layer_start = (i // width + 1) * width
+        layer_end = min(layer_start + width, n)
+        for _ in range(edges_per_node):
+            yield i, rng.randrange(layer_start, layer_end)
+
+
+SHAPES = {
+    'random': random_dag,
+    'chain': chain,
+    'fan_out': fan_out,
+    'layered': layered,
+}
+
+
+def build_with_add_edge(n, edges):
+    graph = dag.DAG()
+    for node in range(n):
+        graph.add_node(node)
+    for ind_node, dep_node in edges:
+        graph.add_edge(ind_node, dep_node)
+    return graph
+
+
+def build_with_from_dict(n, edges):
+    graph_dict = {node: [] for node in range(n)}
+    for ind_node, dep_node in edges:
+        graph_dict[ind_node].append(dep_node)
+    graph = dag.DAG()
+    graph.from_dict(graph_dict)
+    return graph
+
+
+def build_with_from_edges(n, edges):
+    graph = dag.DAG()
+    graph.from_edges(edges, nodes=range(n))
+    return graph
+
+
+def timed(func, *args):
+    gc.collect()
+    start = time.perf_counter()
+    rv = func(*args)
+    return time.perf_counter() - start, rv
+
+
+def peak_memory(func, *args):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench(shape, n, samples, seed, memory):
+    edges = list(dict.fromkeys(SHAPES[shape](n, seed=seed)))
+    rng = random.Random(seed)
+    sample = [rng.randrange(n) for _ in range(samples)]
+    results = []
+
+    def record(op, seconds, calls=1, peak=None):
+        results.append({
+            'shape': shape,
+            'nodes': n,
+            'edges': len(edges),
+            'op': op,
+            'calls': calls,
+            'seconds': seconds,
+            'peak_bytes': peak,
+        })
+
+    builders = [
+        ('add_edge', build_with_add_edge),
+        ('from_dict', build_with_from_dict),
+        ('from_edges', build_with_from_edges),
+    ]
+    for op, builder in builders:
+        seconds, graph = timed(builder, n, edges)
+        peak = peak_memory(builder, n, edges) if memory else None
+        record(op, seconds, peak=peak)
+
+    seconds, _ = timed(graph.topological_sort)
+    record('topological_sort', seconds)
+    seconds, _ = timed(graph.topological_sort)
+    record('topological_sort (cached)', seconds)
+
+    for op, method in [('all_downstreams', graph.all_downstreams),
+                       ('predecessors', graph.predecessors)]:
+        seconds, _ = timed(lambda: [method(node) for node in sample])
+        record(op, seconds, calls=len(sample))
+
+    seconds, _ = timed(
+        lambda: [graph.delete_node_if_exists(node) for node in sample])
+    record('delete_node', seconds, calls=len(sample))
+    return results
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    options = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    options.add_argument('--sizes', type=int, nargs='+',
+                         default=[1000, 10000, 100000],
+                         help='node counts to benchmark (up to 1000000)')
+    options.add_argument('--shapes', nargs='+', choices=sorted(SHAPES),
+                         default=sorted(SHAPES))
+    options.add_argument('--samples', type=int, default=100,
+                         help='nodes queried/deleted per size')
+    options.add_argument('--seed', type=int, default=0)
+    options.add_argument('--no-memory', dest='memory', action='store_false',
+                         help='skip the (slow) tracemalloc builds')
+    options.add_argument('-o', '--outfile', type=argparse.FileType('w'),
+                         default=sys.stdout)
+    args = options.parse_args()
+
+    results = []
+    for n in args.sizes:
+        for shape in args.shapes:
+            results.extend(bench(shape, n, args.samples, args.seed,
+                                 args.memory))
+
+    report = {
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    with args.outfile as f:
+        json.dump(report, f, indent=2)
+        f.write('\n')
+
+
+if __name__ == '__main__':
+    main()
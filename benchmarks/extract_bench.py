@@ -0,0 +1,78 @@
+"""
+Compares parser.extract against the original per-column XPath version
+on a large synthetic docs page::
+
+    python benchmarks/extract_bench.py --resources 500 --fields 60
+
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, os.pardir, 'clubhouse'))
+sys.path.insert(0, HERE)
+
+from lxml import html  # noqa: E402
+from unidecode import unidecode  # noqa: E402
+
+import fixtures  # noqa: E402
+import parser  # noqa: E402
+
+
+def legacy_extract(table):
+    """ extract() as it was: four string XPath queries zipped together. """
+    table.xpath('thead/tr/th/text()')
+    fields = table.xpath('./tbody/tr/td[strong]')
+    descriptions = table.xpath('./tbody/tr/td[not(strong)]')
+    extracted_fields = [
+        (h.findtext('strong'), h.xpath('string(./span)'))
+        for h in fields
+    ]
+    extracted_descriptions = []
+    for h in descriptions:
+        asbytes = bytes(h.text, parser.ENCODINGS_WITH_SMART_QUOTES[0])
+        extracted_descriptions.append(unidecode(
+            str(asbytes, parser.ENCODINGS_WITH_SMART_QUOTES[2])))
+    return {f[0]: {"type": f[1], "description": d, "args": ''}
+            for f, d in zip(extracted_fields, extracted_descriptions)}
+
+
+def best_of(repeat, func, tables):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [func(table) for table in tables]
+        timings.append(time.perf_counter() - start)
+    return min(timings), results
+
+
+def main():
+    options = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    options.add_argument('--resources', type=int, default=500)
+    options.add_argument('--fields', type=int, default=60)
+    options.add_argument('--repeat', type=int, default=5)
+    args = options.parse_args()
+
+    tree = html.fromstring(
+        fixtures.generate(args.resources, args.fields).encode('utf-8'))
+    tables = tree.xpath('//h1[text()="Resources"]/following-sibling::table')
+
+    legacy_seconds, legacy = best_of(args.repeat, legacy_extract, tables)
+    seconds, current = best_of(args.repeat, parser.extract, tables)
+    assert legacy == current, 'extract() output changed'
+
+    json.dump({
+        'resources': args.resources,
+        'fields': args.fields,
+        'legacy_seconds': legacy_seconds,
+        'seconds': seconds,
+        'speedup': legacy_seconds / seconds,
+    }, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""
+Synthesizes a Clubhouse-style API docs page, so the generator can be
+exercised offline at any size::
+
+    python benchmarks/fixtures.py --resources 200 --fields 40 > docs.html
+    python clubhouse/parser.py docs.html -o /tmp/models.py
+
+Every resource is an ``<h2>`` followed by a field table, after the
+``<h1>Resources</h1>`` heading, just like the real page. Nested fields
+only point at earlier resources, so the dependency graph is acyclic.
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from tests.fixtures import generate  # noqa: E402
+
+
+def add_options(options):
+    options.add_argument('--resources', type=int, default=40)
+    options.add_argument('--fields', type=int, default=20)
+    options.add_argument('--nesting', type=float, default=0.1)
+    options.add_argument('--enums', type=float, default=0.05)
+    options.add_argument('--nullable', type=float, default=0.2)
+    options.add_argument('--non-ascii', type=float, default=0.05)
+    options.add_argument('--seed', type=int, default=0)
+    return options
+
+
+def from_options(args):
+    """ generate() with the options added by add_options(). """
+    return generate(args.resources, args.fields, nesting=args.nesting,
+                    enums=args.enums, nullable=args.nullable,
+                    non_ascii=args.non_ascii, seed=args.seed)
+
+
+def main():
+    options = add_options(
+        argparse.ArgumentParser(description=__doc__.split('\n\n')[0]))
+    args = options.parse_args()
+    sys.stdout.buffer.write(from_options(args).encode('utf-8'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""
+Times parser.py end to end on a synthetic docs page, one stage at a
+time::
+
+    python benchmarks/generator_bench.py --resources 500 --fields 40
+
+For each of parse, munge and build it reports the best wall time of
+``--repeat`` runs and the peak memory traced by tracemalloc in a
+separate run. tracemalloc only sees Python allocations, so libxml2's
+own tree memory is not part of the parse figure; ``max_rss_bytes`` is
+the process high-water mark for the whole run.
+"""
+import argparse
+import copy
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, os.pardir, 'clubhouse'))
+
+from collections import OrderedDict  # noqa: E402
+
+from lxml import html  # noqa: E402
+
+import fixtures  # noqa: E402
+import parser  # noqa: E402
+
+
+def revision():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=HERE,
+            stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def stages(page, stream):
+    """ Returns (name, func) pairs; each func takes the previous result. """
+    def parse(_):
+        if stream:
+            return OrderedDict(parser.parse_stream(io.BytesIO(page)))
+        return parser.parse(html.parse(io.BytesIO(page)))
+
+    def munge(parsed):
+        # munge rewrites the field details in place
+        return parser.munge(copy.deepcopy(parsed))
+
+    def build(munged):
+        return parser.build(munged)
+
+    return [('parse', parse), ('munge', munge), ('build', build)]
+
+
+def run(page, stream, repeat):
+    report = OrderedDict()
+    value = None
+    for name, func in stages(page, stream):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = func(value)
+            timings.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        func(value)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        report[name] = {'seconds': min(timings), 'peak_bytes': peak}
+        value = result
+    return report, value
+
+
+def main():
+    options = fixtures.add_options(
+        argparse.ArgumentParser(description=__doc__.split('\n\n')[0]))
+    options.add_argument('--stream', action='store_true',
+                         help='parse with parse_stream()')
+    options.add_argument('--repeat', type=int, default=3)
+    args = options.parse_args()
+
+    page = fixtures.from_options(args).encode('utf-8')
+    report, rendered = run(page, args.stream, args.repeat)
+
+    json.dump(OrderedDict([
+        ('revision', revision()),
+        ('resources', args.resources),
+        ('fields', args.fields),
+        ('stream', args.stream),
+        ('page_bytes', len(page)),
+        ('output_bytes', len(rendered)),
+        ('stages', report),
+        ('total_seconds', sum(s['seconds'] for s in report.values())),
+        ('max_rss_bytes',
+         resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024),
+    ]), sys.stdout, indent=2)
+    sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Measures what importing the generated models package costs with
+``python -X importtime``, from a bare import up to touching every
+resource (which is what the old single-module models.py always did)::
+
+    python benchmarks/import_bench.py --repeat 5
+
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+
+CLUBHOUSE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, 'clubhouse')
+
+SCENARIOS = [
+    ('interpreter only', 'pass'),
+    ('import models', 'import models'),
+    ('models.Label', 'import models; models.Label'),
+    ('models.Story', 'import models; models.Story'),
+    ('every resource',
+     'import models; [getattr(models, name) for name in models.__all__]'),
+]
+
+_importtime = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)')
+
+
+def importtime(code):
+    """ Returns (total self microseconds, modules imported) for code. """
+    env = dict(os.environ, PYTHONPATH=CLUBHOUSE)
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-W', 'ignore', '-c', code],
+        env=env, stderr=subprocess.PIPE, check=True,
+        universal_newlines=True)
+    total = modules = 0
+    for line in process.stderr.splitlines():
+        match = _importtime.match(line)
+        if match:
+            total += int(match.group(1))
+            modules += 1
+    return total, modules
+
+
+def main():
+    options = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    options.add_argument('--repeat', type=int, default=5)
+    args = options.parse_args()
+
+    results = []
+    for name, code in SCENARIOS:
+        runs = [importtime(code) for _ in range(args.repeat)]
+        results.append({
+            'scenario': name,
+            'microseconds': min(total for total, _ in runs),
+            'modules': runs[0][1],
+        })
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
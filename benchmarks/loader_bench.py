@@ -0,0 +1,62 @@
+"""
+Times the generated load_* functions against the marshmallow schemas
+on a bulk list of stories::
+
+    python benchmarks/loader_bench.py --stories 5000
+
+tests/test_loaders.py checks that both load the same payloads the same
+way.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, os.pardir))
+sys.path.insert(0, os.path.join(HERE, os.pardir, 'clubhouse'))
+
+import models  # noqa: E402
+from tests.fixtures import synthetic_payload  # noqa: E402
+
+
+def best_of(repeat, func, payloads):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(payloads)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    options = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    options.add_argument('--stories', type=int, default=5000)
+    options.add_argument('--repeat', type=int, default=3)
+    options.add_argument('--seed', type=int, default=0)
+    args = options.parse_args()
+
+    rng = random.Random(args.seed)
+    payloads = [synthetic_payload(models.Story, rng)
+                for _ in range(args.stories)]
+
+    schema = models.Story(many=True)
+    marshmallow_seconds = best_of(args.repeat, schema.load, payloads)
+    seconds = best_of(
+        args.repeat,
+        lambda payloads: [models.load_story(p) for p in payloads],
+        payloads)
+
+    json.dump({
+        'stories': args.stories,
+        'marshmallow_seconds': marshmallow_seconds,
+        'seconds': seconds,
+        'speedup': marshmallow_seconds / seconds,
+    }, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
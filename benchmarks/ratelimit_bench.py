@@ -0,0 +1,113 @@
+"""
+Runs bulk worker threads and one interactive thread against a local
+stand-in server that answers 429 over a fixed rate limit::
+
+    python benchmarks/ratelimit_bench.py --limit 20 --workers 8
+
+First every thread backs off on its own, sleeping through Retry-After
+whenever it sees a 429; then all of them share one RateLimiter, which
+starts above the server's limit, with the bulk threads in its BULK lane.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, os.pardir))
+sys.path.insert(0, HERE)
+
+from clubhouse.client import Client, ClubhouseError  # noqa: E402
+from clubhouse.ratelimit import BULK, RateLimiter  # noqa: E402
+from client_bench import stories  # noqa: E402
+from tests.standin import StandIn  # noqa: E402
+
+
+def backing_off(client, story_id):
+    while True:
+        try:
+            return client.get_story(story_id)
+        except ClubhouseError as ex:
+            if ex.status_code != 429:
+                raise
+            time.sleep(1)
+
+
+def run(server, args, limiter):
+    latencies = []
+    with Client('token', api_url=server.url, rate_limiter=limiter,
+                max_retries=100, pool_maxsize=args.workers + 1) as client:
+        fetch = backing_off if limiter is None else type(client).get_story
+        bulk = client.with_priority(BULK)
+
+        def worker():
+            for story_id in range(args.requests):
+                fetch(bulk, story_id % args.stories)
+
+        def interactive():
+            for story_id in range(args.interactive):
+                time.sleep(args.think)
+                start = time.perf_counter()
+                fetch(client, story_id % args.stories)
+                latencies.append(time.perf_counter() - start)
+
+        server.reset()
+        threads = [threading.Thread(target=worker)
+                   for _ in range(args.workers)]
+        threads.append(threading.Thread(target=interactive))
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+    report = {
+        'seconds': elapsed,
+        'requests_per_second':
+            (args.workers * args.requests + args.interactive) / elapsed,
+        'throttled': server.counters['throttled'],
+        'interactive_mean_seconds': sum(latencies) / len(latencies),
+        'interactive_max_seconds': max(latencies),
+    }
+    if limiter is not None:
+        report['limiter'] = limiter.metrics()
+    return report
+
+
+def main():
+    options = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    options.add_argument('--limit', type=float, default=20,
+                         help="the server's requests a second")
+    options.add_argument('--workers', type=int, default=8)
+    options.add_argument('--requests', type=int, default=40,
+                         help='requests per bulk worker')
+    options.add_argument('--interactive', type=int, default=10)
+    options.add_argument('--think', type=float, default=0.5,
+                         help='seconds between interactive requests')
+    options.add_argument('--stories', type=int, default=50)
+    options.add_argument('--seed', type=int, default=0)
+    args = options.parse_args()
+
+    rng = random.Random(args.seed)
+    with StandIn({'stories': stories(args.stories, rng)},
+                 rate_limit=(args.limit, 5)) as server:
+        independent = run(server, args, None)
+        time.sleep(1)
+        shared = run(server, args,
+                     RateLimiter(rate=args.limit * 1.5, burst=5))
+
+    json.dump({
+        'limit': args.limit,
+        'workers': args.workers,
+        'independent_backoff': independent,
+        'rate_limiter': shared,
+    }, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+Pages through a search on a local stand-in server with a fixed latency,
+waiting a little on every result as if writing it somewhere, first by
+fetching every page and then processing the list, then with the
+prefetching Client.search_stories::
+
+    python benchmarks/search_bench.py --results 2000 --latency 0.02
+
+Peak memory is traced with tracemalloc in a separate, untimed run.
+``early_exit_requests`` is the number of requests made when only the
+first result is taken.
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, os.pardir))
+sys.path.insert(0, HERE)
+
+from clubhouse import models  # noqa: E402
+from clubhouse.client import Client  # noqa: E402
+from tests.fixtures import synthetic_payload  # noqa: E402
+from tests.standin import StandIn  # noqa: E402
+
+
+def work(item, seconds):
+    time.sleep(seconds)
+    return item.id
+
+
+def collect(client, page_size, seconds):
+    items = []
+    page = client.search_stories_page('x', page_size=page_size)
+    items.extend(page.data)
+    while page.next:
+        page = client.search_stories_page('x', page.next, page_size)
+        items.extend(page.data)
+    return [work(item, seconds) for item in items]
+
+
+def stream(client, page_size, seconds):
+    return [work(item, seconds)
+            for item in client.search_stories('x', page_size=page_size)]
+
+
+def measure(server, func, page_size, seconds):
+    with Client('token', api_url=server.url) as client:
+        start = time.perf_counter()
+        result = func(client, page_size, seconds)
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        func(client, page_size, 0)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return result, {'seconds': elapsed, 'peak_bytes': peak}
+
+
+def main():
+    options = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    options.add_argument('--results', type=int, default=2000)
+    options.add_argument('--page-size', type=int, default=25)
+    options.add_argument('--latency', type=float, default=0.02)
+    options.add_argument('--work', type=float, default=0.0005,
+                         help='seconds to wait on every result')
+    options.add_argument('--seed', type=int, default=0)
+    args = options.parse_args()
+
+    rng = random.Random(args.seed)
+    results = []
+    for story_id in range(args.results):
+        payload = synthetic_payload(models.StorySearch, rng)
+        payload['id'] = story_id
+        results.append(payload)
+
+    with StandIn({'search/stories': results},
+                 latency=args.latency) as server:
+        expected, collected = measure(server, collect, args.page_size,
+                                      args.work)
+        actual, streamed = measure(server, stream, args.page_size,
+                                   args.work)
+        assert expected == actual == list(range(args.results))
+
+        server.reset()
+        with Client('token', api_url=server.url) as client:
+            search = client.search_stories('x', page_size=args.page_size)
+            list(itertools.islice(search, 1))
+            search.close()
+        time.sleep(args.latency * 2)
+        early_exit_requests = server.counters['requests']
+
+    json.dump({
+        'results': args.results,
+        'page_size': args.page_size,
+        'latency': args.latency,
+        'collect': collected,
+        'search_stories': streamed,
+        'speedup': collected['seconds'] / streamed['seconds'],
+        'early_exit_requests': early_exit_requests,
+    }, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
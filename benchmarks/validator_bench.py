@@ -0,0 +1,97 @@
+"""
+Checks the generated validate_* functions against the marshmallow
+schemas and times them against Schema.validate() and load_* on a batch
+of CreateStoryParams::
+
+    python benchmarks/validator_bench.py --stories 5000
+
+"""
+import argparse
+import json
+import os
+import random
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, os.pardir))
+sys.path.insert(0, os.path.join(HERE, os.pardir, 'clubhouse'))
+sys.path.insert(0, HERE)
+
+import models  # noqa: E402
+import validators  # noqa: E402
+from loader_bench import best_of  # noqa: E402
+from tests.fixtures import synthetic_payload  # noqa: E402
+
+
+def invalid_payloads(payload):
+    """ (copy of payload, fields the copy gets errors for) """
+    yield dict(payload, unknown_field=1), set()
+    yield dict(payload, project_id='not a number'), {'project_id'}
+    yield dict(payload, project_id=None), {'project_id'}
+    yield dict(payload, epic_id=None), set()
+    yield dict(payload, name=1), {'name'}
+    yield dict(payload, story_type='epic'), {'story_type'}
+    yield dict(payload, created_at='yesterday'), {'created_at'}
+    yield dict(payload, created_at='2018-01-01'), {'created_at'}
+    yield dict(payload, created_at='2018-01-01T25:00:00Z'), {'created_at'}
+    yield dict(payload, deadline='2018-01-01T10:00:00Z'), set()
+    yield dict(payload, deadline='2018-01-01'), {'deadline'}
+    yield dict(payload, deadline='2018-02-30T10:00:00Z'), {'deadline'}
+    yield dict(payload, deadline='2018-01-01T10:00:00Zgarbage'), {'deadline'}
+    yield dict(payload, requested_by_id='not a uuid'), {'requested_by_id'}
+    yield dict(payload, follower_ids='not a list'), {'follower_ids'}
+    yield dict(payload, file_ids=[1, 'x']), {'file_ids'}
+    yield dict(payload, labels=[{'name': 1}]), {'labels'}
+    yield dict(payload, labels={'name': 'x'}), {'labels'}
+
+
+def check_compatibility(payloads):
+    schema = models.CreateStoryParams()
+    assert validators.validate_create_story_params('x') == \
+        schema.validate('x')
+    for payload in payloads:
+        assert schema.validate(payload) == {}
+        assert validators.validate_create_story_params(payload) == {}
+        for invalid, fields in invalid_payloads(payload):
+            expected = schema.validate(invalid)
+            actual = validators.validate_create_story_params(invalid)
+            assert set(expected) == set(actual) == fields, (
+                invalid, expected, actual)
+
+
+def main():
+    options = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    options.add_argument('--stories', type=int, default=5000)
+    options.add_argument('--repeat', type=int, default=3)
+    options.add_argument('--seed', type=int, default=0)
+    args = options.parse_args()
+
+    rng = random.Random(args.seed)
+    payloads = [synthetic_payload(models.CreateStoryParams, rng)
+                for _ in range(args.stories)]
+    check_compatibility(payloads[:50])
+
+    schema = models.CreateStoryParams(many=True)
+    marshmallow_seconds = best_of(args.repeat, schema.validate, payloads)
+    load_seconds = best_of(
+        args.repeat,
+        lambda payloads: [models.load_create_story_params(p)
+                          for p in payloads],
+        payloads)
+    validate = validators.validate_create_story_params
+    seconds = best_of(
+        args.repeat, lambda payloads: [validate(p) for p in payloads],
+        payloads)
+
+    json.dump({
+        'stories': args.stories,
+        'marshmallow_seconds': marshmallow_seconds,
+        'load_seconds': load_seconds,
+        'seconds': seconds,
+        'speedup': marshmallow_seconds / seconds,
+    }, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
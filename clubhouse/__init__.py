@@ -0,0 +1,4 @@
+"""
+A client for the Clubhouse REST API (v2), with models generated from the
+API's docs by clubhouse/parser.py. See :mod:`clubhouse.client`.
+"""
@@ -0,0 +1,105 @@
+"""
+A response cache for the clients, holding what a GET was loaded into
+rather than its body::
+
+    client = Client(token, cache=ResponseCache(ttls={'stories': 5}))
+
+An entry younger than its resource's TTL is returned without a request.
+An older one is revalidated with If-None-Match/If-Modified-Since, and a
+304 hands back the model loaded the first time. Cached models are shared
+by every caller, so treat them as read-only.
+
+Clients key their entries by path, parameters and token, so one cache
+can be shared by clients with different tokens. Anything with the get,
+set, invalidate and ttl methods of ResponseCache can be passed to a
+client instead.
+"""
+import threading
+from collections import OrderedDict, namedtuple
+
+__all__ = ['CacheEntry', 'DEFAULT_TTLS', 'ResponseCache']
+
+#: ``expires`` is a time.monotonic() deadline
+CacheEntry = namedtuple('CacheEntry',
+                        ['value', 'etag', 'last_modified', 'expires'])
+
+#: seconds a response is used without revalidating, by the resource its
+#: path returns, so /projects/{id}/stories goes by 'stories'; None is
+#: never cached
+DEFAULT_TTLS = {
+    'categories': 60,
+    'labels': 60,
+    'members': 60,
+    'projects': 60,
+    'search': None,
+    'teams': 60,
+    'workflows': 60,
+}
+
+
+def _resource(path):
+    """ The resource path returns. Paths alternate between resource names
+    and ids, so it is the last name: /projects/{id}/stories is a list of
+    stories and /stories/{id} a story. """
+    parts = path.strip('/').split('/')
+    return parts[(len(parts) - 1) // 2 * 2]
+
+
+class ResponseCache(object):
+    """ An in-memory LRU of at most ``maxsize`` responses.
+
+    ``ttls`` is merged over DEFAULT_TTLS, and any other resource is used
+    for ``ttl`` seconds; with the default of 0 it is revalidated every
+    time.
+    """
+
+    def __init__(self, maxsize=1024, ttl=0, ttls=None):
+        self.maxsize = maxsize
+        self.default_ttl = ttl
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def ttl(self, path):
+        """ Seconds a response for path stays fresh, None to not cache it. """
+        return self.ttls.get(_resource(path), self.default_ttl)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path):
+        """ Drops every response a write to path may have changed, whatever
+        its parameters and token: those for path and the paths it is
+        nested in, and every list of the resource path is in. A PUT to
+        /stories/{id} drops the story, /stories and
+        /projects/{id}/stories; a POST to /stories/{id}/comments drops the
+        story as well.
+
+        Keys are (path, query, token) tuples, as the clients make them.
+        """
+        parts = path.strip('/').split('/')
+        paths = {'/' + '/'.join(parts[:i]) for i in range(1, len(parts) + 1)}
+        resource = _resource(path)
+        with self._lock:
+            for key in [key for key in self._entries
+                        if key[0] in paths or
+                        key[0].rsplit('/', 1)[-1] == resource]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
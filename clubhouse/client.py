@@ -0,0 +1,569 @@
+"""
+Clients for the Clubhouse REST API (v2), loading every response through
+the generated :mod:`clubhouse.models`::
+
+    with Client(token) as client:
+        story = client.get_story(1234)
+        print(story.name)
+
+AsyncClient has the same methods as coroutines, and needs aiohttp::
+
+    async with AsyncClient(token, concurrency=20) as client:
+        stories = await client.get_stories(story_ids)
+
+"""
+import asyncio
+import copy
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+import requests
+from marshmallow import ValidationError
+from requests.adapters import HTTPAdapter
+
+from . import models, validators
+from .cache import CacheEntry
+from .ratelimit import INTERACTIVE, parse_retry_after
+
+try:
+    import aiohttp
+except ImportError:  # AsyncClient is optional
+    aiohttp = None
+
+__all__ = ['API_URL', 'AsyncClient', 'Client', 'ClubhouseError', 'Resources']
+
+API_URL = 'https://api.clubhouse.io/api/v2'
+
+#: sent with every request
+HEADERS = {
+    'Accept': 'application/json',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+}
+
+
+class ClubhouseError(Exception):
+    """ The API answered with an error status. """
+
+    def __init__(self, status_code, reason, body):
+        super().__init__('{0} {1}: {2}'.format(status_code, reason, body))
+        self.status_code = status_code
+        self.reason = reason
+        self.body = body
+
+
+def _load(load, data, many=False):
+    if load is None or data is None:
+        return data
+    if many:
+        return [load(item) for item in data]
+    return load(data)
+
+
+def _cache_key(path, params, token):
+    """ (path, query, token), see ResponseCache.invalidate. """
+    query = urlencode(sorted(params.items())) if params else ''
+    return path, query, token
+
+
+def _conditional_headers(entry):
+    """ Headers asking for a 304 if entry is still current. """
+    headers = {}
+    if entry is not None:
+        if entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+    return headers
+
+
+def _cache_entry(value, headers, ttl, previous=None):
+    """ An entry for a response; a 304 may leave out the validators the
+    previous one came with. """
+    etag = headers.get('ETag')
+    last_modified = headers.get('Last-Modified')
+    if previous is not None:
+        etag = etag or previous.etag
+        last_modified = last_modified or previous.last_modified
+    return CacheEntry(value, etag, last_modified, time.monotonic() + ttl)
+
+
+def _next_token(next_):
+    """ SearchResults.next is either the bare token or the path to the
+    next page, which carries it as its ``next`` parameter. """
+    if '?' not in next_:
+        return next_
+    return parse_qs(urlsplit(next_).query)['next'][0]
+
+
+def _validated(validate, params):
+    errors = validate(params)
+    if errors:
+        raise ValidationError(errors)
+    return params
+
+
+class Resources(object):
+    """ The typed API surface, shared by the clients.
+
+    Every method hands the request to ``_call``, which the client
+    implements, so a method returns whatever ``_call`` returns: the
+    loaded model(s) for Client, a coroutine for AsyncClient. The
+    get_*s(ids) batch methods collect their calls with ``_gather``.
+    Create methods check their parameters with :mod:`clubhouse.validators`
+    first and raise marshmallow.ValidationError without sending anything
+    when they are invalid.
+    """
+
+    def _call(self, method, path, load=None, many=False, params=None,
+              body=None):
+        raise NotImplementedError
+
+    def _gather(self, calls):
+        raise NotImplementedError
+
+    def with_priority(self, priority):
+        """ A copy of the client, sharing its connections and rate limiter,
+        whose requests wait in the rate limiter's ``priority`` lane. """
+        clone = copy.copy(self)
+        clone.priority = priority
+        return clone
+
+    # stories
+
+    def get_story(self, story_id):
+        return self._call('GET', '/stories/{0}'.format(story_id),
+                          models.load_story)
+
+    def search_stories_page(self, query, next_=None, page_size=25):
+        """ One page of search results, see search_stories for them all. """
+        params = {'query': query, 'page_size': page_size}
+        if next_:
+            params['next'] = _next_token(next_)
+        return self._call('GET', '/search/stories',
+                          models.load_search_results, params=params)
+
+    def get_stories(self, story_ids):
+        return self._gather(self.get_story(story_id)
+                            for story_id in story_ids)
+
+    def create_story(self, params):
+        return self._call(
+            'POST', '/stories', models.load_story,
+            body=_validated(validators.validate_create_story_params, params))
+
+    def update_story(self, story_id, params):
+        return self._call('PUT', '/stories/{0}'.format(story_id),
+                          models.load_story, body=params)
+
+    def delete_story(self, story_id):
+        return self._call('DELETE', '/stories/{0}'.format(story_id))
+
+    def list_project_stories(self, project_id):
+        return self._call('GET', '/projects/{0}/stories'.format(project_id),
+                          models.load_story, many=True)
+
+    def create_comment(self, story_id, params):
+        return self._call(
+            'POST', '/stories/{0}/comments'.format(story_id),
+            models.load_comment,
+            body=_validated(validators.validate_create_comment_params,
+                            params))
+
+    def create_task(self, story_id, params):
+        return self._call(
+            'POST', '/stories/{0}/tasks'.format(story_id), models.load_task,
+            body=_validated(validators.validate_create_task_params, params))
+
+    def create_story_link(self, params):
+        return self._call(
+            'POST', '/story-links', models.load_story_link,
+            body=_validated(validators.validate_create_story_link_params,
+                            params))
+
+    # epics, projects and milestones
+
+    def get_epic(self, epic_id):
+        return self._call('GET', '/epics/{0}'.format(epic_id),
+                          models.load_epic)
+
+    def get_epics(self, epic_ids):
+        return self._gather(self.get_epic(epic_id) for epic_id in epic_ids)
+
+    def list_epics(self):
+        return self._call('GET', '/epics', models.load_epic, many=True)
+
+    def get_project(self, project_id):
+        return self._call('GET', '/projects/{0}'.format(project_id),
+                          models.load_project)
+
+    def get_projects(self, project_ids):
+        return self._gather(self.get_project(project_id)
+                            for project_id in project_ids)
+
+    def list_projects(self):
+        return self._call('GET', '/projects', models.load_project, many=True)
+
+    def get_milestone(self, milestone_id):
+        return self._call('GET', '/milestones/{0}'.format(milestone_id),
+                          models.load_milestone)
+
+    def list_milestones(self):
+        return self._call('GET', '/milestones', models.load_milestone,
+                          many=True)
+
+    # organization
+
+    def get_member(self, member_id):
+        return self._call('GET', '/members/{0}'.format(member_id),
+                          models.load_member)
+
+    def list_members(self):
+        return self._call('GET', '/members', models.load_member, many=True)
+
+    def get_team(self, team_id):
+        return self._call('GET', '/teams/{0}'.format(team_id),
+                          models.load_team)
+
+    def list_teams(self):
+        return self._call('GET', '/teams', models.load_team, many=True)
+
+    def get_workflow(self, workflow_id):
+        return self._call('GET', '/workflows/{0}'.format(workflow_id),
+                          models.load_workflow)
+
+    def list_workflows(self):
+        return self._call('GET', '/workflows', models.load_workflow,
+                          many=True)
+
+    def get_label(self, label_id):
+        return self._call('GET', '/labels/{0}'.format(label_id),
+                          models.load_label)
+
+    def list_labels(self):
+        return self._call('GET', '/labels', models.load_label, many=True)
+
+    def create_label(self, params):
+        return self._call(
+            'POST', '/labels', models.load_label,
+            body=_validated(validators.validate_create_label_params, params))
+
+    def get_category(self, category_id):
+        return self._call('GET', '/categories/{0}'.format(category_id),
+                          models.load_category)
+
+    def list_categories(self):
+        return self._call('GET', '/categories', models.load_category,
+                          many=True)
+
+    def create_category(self, params):
+        return self._call(
+            'POST', '/categories', models.load_category,
+            body=_validated(validators.validate_create_category_params,
+                            params))
+
+    # files and repositories
+
+    def get_file(self, file_id):
+        return self._call('GET', '/files/{0}'.format(file_id),
+                          models.load_file)
+
+    def list_files(self):
+        return self._call('GET', '/files', models.load_file, many=True)
+
+    def get_linked_file(self, linked_file_id):
+        return self._call('GET', '/linked-files/{0}'.format(linked_file_id),
+                          models.load_linked_file)
+
+    def list_linked_files(self):
+        return self._call('GET', '/linked-files', models.load_linked_file,
+                          many=True)
+
+    def get_repository(self, repository_id):
+        return self._call('GET', '/repositories/{0}'.format(repository_id),
+                          models.load_repository)
+
+    def list_repositories(self):
+        return self._call('GET', '/repositories', models.load_repository,
+                          many=True)
+
+
+class Client(Resources):
+    """ A blocking client on one keep-alive requests.Session.
+
+    Connections are pooled per host by the session's adapter:
+    ``pool_connections`` is the number of hosts to keep pools for and
+    ``pool_maxsize`` the connections kept open per host, which should be
+    at least the number of threads sharing the client.
+
+    With a :class:`~clubhouse.ratelimit.RateLimiter` every request first
+    waits for it, and a 429 is reported to it and retried up to
+    ``max_retries`` times.
+
+    With a :class:`~clubhouse.cache.ResponseCache` GETs are answered
+    from it while fresh and revalidated after, and anything else sent to
+    a path drops the cached responses it may have changed.
+    """
+
+    def __init__(self, token, api_url=API_URL, pool_connections=10,
+                 pool_maxsize=10, timeout=30, session=None,
+                 rate_limiter=None, max_retries=3, priority=INTERACTIVE,
+                 cache=None):
+        self.api_url = api_url.rstrip('/')
+        self.token = token
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.max_retries = max_retries
+        self.priority = priority
+        self.session = requests.Session() if session is None else session
+        adapter = HTTPAdapter(pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update(HEADERS)
+        self.session.params['token'] = token
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.session.close()
+
+    def request(self, method, path, params=None, body=None):
+        """ Returns the decoded JSON of the response, None when empty. """
+        return self._send(method, path, params, body)[2]
+
+    def _send(self, method, path, params=None, body=None, headers=None):
+        """ Returns (status, headers, decoded JSON or None). """
+        limiter = self.rate_limiter
+        for _ in range(self.max_retries + 1):
+            if limiter is not None:
+                limiter.acquire(self.priority)
+            response = self.session.request(
+                method, self.api_url + path, params=params, json=body,
+                headers=headers, timeout=self.timeout)
+            if limiter is None:
+                break
+            if response.status_code != 429:
+                limiter.succeeded()
+                break
+            limiter.throttled(
+                parse_retry_after(response.headers.get('Retry-After')))
+        if response.status_code >= 400:
+            raise ClubhouseError(response.status_code, response.reason,
+                                 response.text)
+        data = response.json() if response.content else None
+        return response.status_code, response.headers, data
+
+    def _call(self, method, path, load=None, many=False, params=None,
+              body=None):
+        cache = self.cache
+        ttl = None
+        if cache is not None and method == 'GET':
+            ttl = cache.ttl(path)
+        if ttl is None:
+            value = _load(load, self.request(method, path, params=params,
+                                             body=body), many)
+            if cache is not None and method != 'GET':
+                cache.invalidate(path)
+            return value
+
+        key = _cache_key(path, params, self.token)
+        entry = cache.get(key)
+        if entry is not None and entry.expires > time.monotonic():
+            return entry.value
+        status, headers, data = self._send(
+            method, path, params, body, _conditional_headers(entry))
+        if status == 304 and entry is not None:
+            value = entry.value
+        else:
+            value = _load(load, data, many)
+        cache.set(key, _cache_entry(value, headers, ttl, entry))
+        return value
+
+    def _gather(self, calls):
+        return list(calls)
+
+    def search_stories(self, query, page_size=25):
+        """ Yields the StorySearch results for query one at a time.
+
+        The next page is fetched on a background thread while the current
+        one is consumed, so no more than two pages are held at once.
+        Closing the generator stops the paging; a page that is already
+        being fetched is discarded.
+        """
+        executor = ThreadPoolExecutor(max_workers=1)
+        pending = None
+        try:
+            page = self.search_stories_page(query, page_size=page_size)
+            while page is not None:
+                if page.next:
+                    pending = executor.submit(
+                        self.search_stories_page, query, page.next,
+                        page_size)
+                items, page = page.data or [], None
+                for item in items:
+                    yield item
+                # let go of this page before the next one is loaded
+                items = None
+                if pending is not None:
+                    page, pending = pending.result(), None
+        finally:
+            if pending is not None:
+                pending.cancel()
+            executor.shutdown(wait=False)
+
+
+class AsyncClient(Resources):
+    """ An asyncio client on one aiohttp.ClientSession.
+
+    At most ``concurrency`` requests are in flight at once, the rest wait
+    on a semaphore; ``pool_maxsize`` caps the connections the session's
+    connector keeps. The get_*s(ids) methods send their requests
+    concurrently and return the models in the order of the ids; the
+    first failure is raised.
+
+    A rate limiter and a cache are used as by Client, and can be the same
+    ones a Client uses. with_priority() should be called from a coroutine,
+    as the session it shares is made then.
+    """
+
+    def __init__(self, token, api_url=API_URL, concurrency=10,
+                 pool_maxsize=100, timeout=30, session=None,
+                 rate_limiter=None, max_retries=3, priority=INTERACTIVE,
+                 cache=None):
+        if aiohttp is None:
+            raise ImportError('AsyncClient needs aiohttp to be installed')
+        self.api_url = api_url.rstrip('/')
+        self.token = token
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.max_retries = max_retries
+        self.priority = priority
+        self.concurrency = concurrency
+        self.pool_maxsize = pool_maxsize
+        self.timeout = timeout
+        self.session = session
+        # both bind to the running loop, so they are made on first use
+        self._semaphore = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+
+    def _session(self):
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_maxsize),
+                headers=HEADERS,
+                timeout=aiohttp.ClientTimeout(total=self.timeout))
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self.session
+
+    def with_priority(self, priority):
+        # make the session and semaphore now so that the copy shares them
+        self._session()
+        return super().with_priority(priority)
+
+    async def request(self, method, path, params=None, body=None):
+        """ Returns the decoded JSON of the response, None when empty. """
+        return (await self._send(method, path, params, body))[2]
+
+    async def _send(self, method, path, params=None, body=None,
+                    headers=None):
+        """ Returns (status, headers, decoded JSON or None). """
+        session = self._session()
+        limiter = self.rate_limiter
+        params = dict(params or (), token=self.token)
+        for _ in range(self.max_retries + 1):
+            if limiter is not None:
+                await limiter.acquire_async(self.priority)
+            async with self._semaphore:
+                async with session.request(
+                        method, self.api_url + path, params=params,
+                        json=body, headers=headers) as response:
+                    status = response.status
+                    if status >= 400:
+                        reason = response.reason
+                        data = await response.text()
+                    else:
+                        data = await response.read()
+                    response_headers = response.headers
+            if limiter is None:
+                break
+            if status != 429:
+                limiter.succeeded()
+                break
+            limiter.throttled(parse_retry_after(
+                response_headers.get('Retry-After')))
+        if status >= 400:
+            raise ClubhouseError(status, reason, data)
+        data = json.loads(data.decode('utf-8')) if data else None
+        return status, response_headers, data
+
+    async def _call(self, method, path, load=None, many=False, params=None,
+                    body=None):
+        cache = self.cache
+        ttl = None
+        if cache is not None and method == 'GET':
+            ttl = cache.ttl(path)
+        if ttl is None:
+            value = _load(load, await self.request(
+                method, path, params=params, body=body), many)
+            if cache is not None and method != 'GET':
+                cache.invalidate(path)
+            return value
+
+        key = _cache_key(path, params, self.token)
+        entry = cache.get(key)
+        if entry is not None and entry.expires > time.monotonic():
+            return entry.value
+        status, headers, data = await self._send(
+            method, path, params, body, _conditional_headers(entry))
+        if status == 304 and entry is not None:
+            value = entry.value
+        else:
+            value = _load(load, data, many)
+        cache.set(key, _cache_entry(value, headers, ttl, entry))
+        return value
+
+    async def _gather(self, calls):
+        return list(await asyncio.gather(*calls))
+
+    async def search_stories(self, query, page_size=25):
+        """ Yields the StorySearch results for query one at a time.
+
+        The next page is fetched in a task while the current one is
+        consumed, so no more than two pages are held at once. Closing
+        the generator (aclose) cancels a page still being fetched.
+        """
+        pending = None
+        try:
+            page = await self.search_stories_page(query, page_size=page_size)
+            while page is not None:
+                if page.next:
+                    pending = asyncio.ensure_future(self.search_stories_page(
+                        query, page.next, page_size))
+                items, page = page.data or [], None
+                for item in items:
+                    yield item
+                # let go of this page before the next one is loaded
+                items = None
+                if pending is not None:
+                    page, pending = await pending, None
+        finally:
+            if pending is not None:
+                pending.cancel()
@@ -4,18 +4,38 @@ Shamelessly stolen from @thieman https://github.com/thieman/py-dag
 A few modifications made for this library.
 """
 
-from copy import copy, deepcopy
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from copy import copy
 from collections import deque
 
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
 
 
 class DAGValidationError(Exception):
     pass
 
 
+#: result of DAG.critical_path: the heaviest path, its total weight and
+#: {node: slack}, i.e. how much a node's weight can grow before it
+#: lengthens the critical path.
+CriticalPath = namedtuple('CriticalPath', ['path', 'total', 'slack'])
+
+
 class DAG(object):
-    """ Directed acyclic graph implementation. """
+    """ Directed acyclic graph implementation.
+
+    Alongside ``graph`` (node -> set of downstream nodes) the DAG keeps a
+    reverse index of predecessors and the set of independent nodes, so
+    that neither has to be recomputed by scanning every node. The indexes
+    only describe ``self.graph``; methods called with an explicit
+    ``graph`` argument fall back to scanning it.
+
+    Every mutation of ``self.graph`` bumps a generation counter. The
+    topological order (and each node's rank in it) is cached against that
+    counter, so repeated sorts and ``all_downstreams`` queries on an
+    unchanged graph do not re-sort it.
+    """
 
     def __init__(self):
         """ Construct a new DAG with no nodes or edges. """
@@ -28,6 +48,11 @@ class DAG(object):
         if node_name in graph:
             raise KeyError('node %s already exists' % node_name)
         graph[node_name] = set()
+        if graph is self.graph:
+            self._predecessors[node_name] = set()
+            self._ind_nodes[node_name] = None
+            self._generation += 1
+            self._added[node_name] = self._generation
 
     def add_node_if_not_exists(self, node_name, graph=None):
         try:
@@ -41,11 +66,21 @@ class DAG(object):
             graph = self.graph
         if node_name not in graph:
             raise KeyError('node %s does not exist' % node_name)
-        graph.pop(node_name)
-
-        for node, edges in graph.items():
-            if node_name in edges:
-                edges.remove(node_name)
+        edges = graph.pop(node_name)
+
+        if graph is not self.graph:
+            for node, edges in graph.items():
+                if node_name in edges:
+                    edges.remove(node_name)
+            return
+
+        for node in self._predecessors.pop(node_name):
+            graph[node].remove(node_name)
+        for node in edges:
+            self._remove_predecessor(node, node_name)
+        self._ind_nodes.pop(node_name, None)
+        del self._added[node_name]
+        self._generation += 1
 
     def delete_node_if_exists(self, node_name, graph=None):
         try:
@@ -67,13 +102,53 @@ class DAG(object):
                 'dependent node "{}" does not exist in graph'
                 .format(dep_node))
 
-        test_graph = deepcopy(graph)
-        test_graph[ind_node].add(dep_node)
-        is_valid, message = self.validate(test_graph)
-        if is_valid:
-            graph[ind_node].add(dep_node)
+        if dep_node in graph[ind_node]:
+            return
+        # the new edge can only close a cycle through nodes that are
+        # already downstream of dep_node, so that is all we search.
+        if self._path_exists(dep_node, ind_node, graph):
+            raise DAGValidationError(
+                'failed topological sort: graph is not acyclic')
+        if graph is self.graph:
+            self._insert_edge(ind_node, dep_node)
         else:
-            raise DAGValidationError(message)
+            graph[ind_node].add(dep_node)
+
+    def _insert_edge(self, ind_node, dep_node):
+        """ Add an edge to self.graph that is known not to close a cycle. """
+        self.graph[ind_node].add(dep_node)
+        self._predecessors[dep_node].add(ind_node)
+        self._ind_nodes.pop(dep_node, None)
+        self._generation += 1
+
+    def _remove_predecessor(self, node, predecessor):
+        """ Drop predecessor from the index of node's predecessors. """
+        predecessors = self._predecessors[node]
+        predecessors.remove(predecessor)
+        if not predecessors:
+            # appended out of graph order; ind_nodes() sorts it back
+            self._ind_nodes[node] = None
+            self._ind_nodes_ordered = False
+        self._generation += 1
+
+    def _path_exists(self, start_node, end_node, graph):
+        """ Returns whether end_node is reachable from start_node.
+
+        Iterative depth-first search, so it only touches the nodes
+        downstream of start_node and cannot blow the recursion limit.
+        """
+        if start_node == end_node:
+            return True
+        nodes_seen = {start_node}
+        stack = [start_node]
+        while stack:
+            for downstream_node in graph[stack.pop()]:
+                if downstream_node == end_node:
+                    return True
+                if downstream_node not in nodes_seen:
+                    nodes_seen.add(downstream_node)
+                    stack.append(downstream_node)
+        return False
 
     def delete_edge(self, ind_node, dep_node, graph=None):
         """ Delete an edge from the graph. """
@@ -82,12 +157,33 @@ class DAG(object):
         if dep_node not in graph.get(ind_node, []):
             raise KeyError('this edge does not exist in graph')
         graph[ind_node].remove(dep_node)
+        if graph is self.graph:
+            self._remove_predecessor(dep_node, ind_node)
 
     def rename_edges(self, old_task_name, new_task_name, graph=None):
         """ Change references to a task in existing edges. """
         if not graph:
             graph = self.graph
-        for node, edges in graph.items():
+
+        if graph is self.graph:
+            edges = graph.pop(old_task_name)
+            graph[new_task_name] = edges
+            predecessors = self._predecessors.pop(old_task_name)
+            self._predecessors[new_task_name] = predecessors
+            for node in predecessors:
+                graph[node].remove(old_task_name)
+                graph[node].add(new_task_name)
+            for node in edges:
+                self._predecessors[node].remove(old_task_name)
+                self._predecessors[node].add(new_task_name)
+            if self._ind_nodes.pop(old_task_name, False) is None:
+                self._ind_nodes[new_task_name] = None
+            del self._added[old_task_name]
+            self._generation += 1
+            self._added[new_task_name] = self._generation
+            return
+
+        for node, edges in list(graph.items()):
 
             if node == old_task_name:
                 graph[new_task_name] = copy(edges)
@@ -102,6 +198,8 @@ class DAG(object):
         """ Returns a list of all predecessors of the given node """
         if graph is None:
             graph = self.graph
+        if graph is self.graph:
+            return list(self._predecessors.get(node, ()))
         return [key for key in graph if node in graph[key]]
 
     def downstream(self, node, graph=None):
@@ -128,6 +226,9 @@ class DAG(object):
                     nodes_seen.add(downstream_node)
                     nodes.append(downstream_node)
             i += 1
+        if graph is self.graph:
+            _, rank = self._topological_index()
+            return sorted(nodes_seen, key=rank.__getitem__)
         return list(
             filter(
                 lambda node: node in nodes_seen,
@@ -147,23 +248,85 @@ class DAG(object):
         The dictionary takes the form of {node_name: [directed edges]}
         """
 
+        def edges():
+            for ind_node, dep_nodes in graph_dict.items():
+                if not isinstance(dep_nodes, list):
+                    raise TypeError('dict values must be lists')
+                for dep_node in dep_nodes:
+                    if dep_node not in graph_dict:
+                        raise KeyError(
+                            'dependent node "{}" does not exist in graph'
+                            .format(dep_node))
+                    yield ind_node, dep_node
+
+        self.from_edges(edges(), nodes=graph_dict.keys())
+
+    def from_edges(self, edges, nodes=()):
+        """ Reset the graph and build it from (ind_node, dep_node) pairs.
+
+        ``edges`` is consumed exactly once, so it can be a generator (e.g.
+        fed straight from an API pager). Nodes are created the first time
+        they are seen; ``nodes`` may name extra nodes without any edges.
+
+        All edges are inserted first and acyclicity is checked with a
+        single topological sort at the end. If a cycle is found the graph
+        is reset and a DAGValidationError is raised.
+        """
         self.reset_graph()
-        for new_node in graph_dict.keys():
-            self.add_node(new_node)
-        for ind_node, dep_nodes in graph_dict.items():
-            if not isinstance(dep_nodes, list):
-                raise TypeError('dict values must be lists')
-            for dep_node in dep_nodes:
-                self.add_edge(ind_node, dep_node)
+        graph = self.graph
+        predecessors = self._predecessors
+        for node in nodes:
+            self.add_node_if_not_exists(node)
+        for ind_node, dep_node in edges:
+            if ind_node not in graph:
+                self.add_node(ind_node)
+            if dep_node not in graph:
+                self.add_node(dep_node)
+            graph[ind_node].add(dep_node)
+            predecessors[dep_node].add(ind_node)
+            self._ind_nodes.pop(dep_node, None)
+        self._generation += 1
+
+        ordered = self._kahn(graph)
+        if len(ordered) != len(graph):
+            # only nodes on or downstream of a cycle are left unsorted,
+            # and their edges stay among themselves.
+            ordered = set(ordered)
+            unsorted = OrderedDict(
+                (node, edges) for node, edges in graph.items()
+                if node not in ordered)
+            self.reset_graph()
+            raise DAGValidationError(
+                'failed topological sort: graph is not acyclic, '
+                'cycles: {}'.format(find_cycles(unsorted)))
 
     def reset_graph(self):
         """ Restore the graph to an empty state. """
         self.graph = OrderedDict()
+        self._predecessors = {}
+        #: ordered set of the nodes without predecessors
+        self._ind_nodes = OrderedDict()
+        #: whether _ind_nodes is in graph order
+        self._ind_nodes_ordered = True
+        #: node -> the generation it was added in, which orders nodes the
+        #: way self.graph does
+        self._added = {}
+        # keeps counting across resets, so that anything cached against a
+        # generation of the old graph can never match the new one
+        self._generation = getattr(self, '_generation', -1) + 1
+        #: (generation, topological order, node -> rank in that order)
+        self._topological_cache = None
 
     def ind_nodes(self, graph=None):
         """ Returns a list of all nodes in the graph with no dependencies. """
         if graph is None:
             graph = self.graph
+        if graph is self.graph:
+            if not self._ind_nodes_ordered:
+                self._ind_nodes = OrderedDict.fromkeys(
+                    sorted(self._ind_nodes, key=self._added.__getitem__))
+                self._ind_nodes_ordered = True
+            return list(self._ind_nodes)
 
         dependent_nodes = set(
             node for dependents in graph.values() for node in dependents
@@ -188,33 +351,564 @@ class DAG(object):
         """
         if graph is None:
             graph = self.graph
+        if graph is self.graph:
+            order, _ = self._topological_index()
+            return list(order)
+
+        l = self._kahn(graph)
+        if len(l) == len(graph):
+            return l
+        else:
+            raise ValueError('graph is not acyclic')
+
+    def _topological_index(self):
+        """ Returns the cached (order, rank) of self.graph.
 
+        They are recomputed only when the graph changed since last time.
+        """
+        cache = self._topological_cache
+        if cache is None or cache[0] != self._generation:
+            order = self._kahn(self.graph)
+            if len(order) != len(self.graph):
+                raise ValueError('graph is not acyclic')
+            rank = {node: i for i, node in enumerate(order)}
+            cache = self._topological_cache = (self._generation, order, rank)
+        return cache[1], cache[2]
+
+    def _kahn(self, graph):
+        """ Kahn's algorithm; returns as much of the order as possible.
+
+        Ready nodes are taken first in, first out, and the ones a node
+        makes ready are queued in the order they were inserted into the
+        graph, so the order only depends on the graph's insertion order
+        and not on how its edge sets iterate (which changes with string
+        hash randomization). Only those small batches are sorted, which
+        keeps this O(V + E) for graphs of bounded out-degree.
+
+        Nodes on (or downstream of) a cycle are left out of the result.
+        """
+        position = {}
         in_degree = {}
-        for u in graph:
+        for i, u in enumerate(graph):
+            position[u] = i
             in_degree[u] = 0
 
         for u in graph:
             for v in graph[u]:
                 in_degree[v] += 1
 
-        queue = deque()
-        for u in in_degree:
-            if in_degree[u] == 0:
-                queue.appendleft(u)
+        queue = deque(u for u in graph if in_degree[u] == 0)
+        key = position.__getitem__
 
-        l = []
+        order = []
         while queue:
-            u = queue.pop()
-            l.append(u)
+            u = queue.popleft()
+            order.append(u)
+            ready = []
             for v in graph[u]:
                 in_degree[v] -= 1
                 if in_degree[v] == 0:
-                    queue.appendleft(v)
+                    ready.append(v)
+            if len(ready) > 1:
+                ready.sort(key=key)
+            queue.extend(ready)
+        return order
+
+    def topological_generations(self, graph=None):
+        """ Yields lists of nodes whose upstreams are all in earlier lists.
+
+        Nodes within a generation do not depend on each other, so each
+        generation can be processed in parallel. Each one is in the order
+        its nodes were inserted into the graph.
+        """
+        if graph is None:
+            graph = self.graph
 
-        if len(l) == len(graph):
-            return l
-        else:
+        position = {u: i for i, u in enumerate(graph)}
+        in_degree = dict.fromkeys(graph, 0)
+        for u in graph:
+            for v in graph[u]:
+                in_degree[v] += 1
+
+        generation = [u for u in graph if in_degree[u] == 0]
+        seen = 0
+        while generation:
+            yield generation
+            seen += len(generation)
+            next_generation = []
+            for u in generation:
+                for v in graph[u]:
+                    in_degree[v] -= 1
+                    if in_degree[v] == 0:
+                        next_generation.append(v)
+            generation = sorted(next_generation, key=position.__getitem__)
+
+        if seen != len(graph):
             raise ValueError('graph is not acyclic')
 
+    def run_parallel(self, func, max_workers=None, executor=None):
+        """ Calls func(node) for every node in dependency order.
+
+        Each node is submitted as soon as all of its upstreams have
+        finished, rather than waiting for a whole generation. At most
+        ``max_workers`` calls are in flight at once. ``executor`` may be
+        any concurrent.futures executor (e.g. a ProcessPoolExecutor, in
+        which case func and the node names must be picklable); by default
+        a ThreadPoolExecutor is created and shut down here.
+
+        Returns a dict of {node: func(node)}. If a call raises, nothing
+        further is submitted, calls that have not started are cancelled
+        and the exception is re-raised.
+        """
+        graph = self.graph
+        own_executor = executor is None
+        if own_executor:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        in_degree = {node: len(self._predecessors[node]) for node in graph}
+        ready = deque(self.ind_nodes())
+        pending = {}
+        results = {}
+        try:
+            while ready or pending:
+                while ready and (max_workers is None or
+                                 len(pending) < max_workers):
+                    node = ready.popleft()
+                    pending[executor.submit(func, node)] = node
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node = pending.pop(future)
+                    results[node] = future.result()
+                    for downstream_node in graph[node]:
+                        in_degree[downstream_node] -= 1
+                        if in_degree[downstream_node] == 0:
+                            ready.append(downstream_node)
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+        finally:
+            if own_executor:
+                executor.shutdown(wait=True)
+        return results
+
+    def critical_path(self, weights, graph=None):
+        """ Returns the CriticalPath (heaviest path) through the DAG.
+
+        ``weights`` maps nodes to their weight (e.g. Story.estimate);
+        missing nodes and None weights count as 0. Runs in O(V + E): one
+        forward pass over the topological order for the earliest finish
+        of each node and one backward pass for the latest finish.
+        """
+        if graph is None:
+            graph = self.graph
+        order = self.topological_sort(graph=graph)
+        if not order:
+            return CriticalPath([], 0, {})
+
+        def weight(node):
+            return weights.get(node) or 0
+
+        finish = {}
+        previous = {}
+        for u in order:
+            finish.setdefault(u, 0)
+            finish[u] += weight(u)
+            for v in graph[u]:
+                if v not in finish or finish[u] > finish[v]:
+                    finish[v] = finish[u]
+                    previous[v] = u
+
+        total = max(finish.values())
+        latest_finish = {}
+        for u in reversed(order):
+            latest = total
+            for v in graph[u]:
+                latest = min(latest, latest_finish[v] - weight(v))
+            latest_finish[u] = latest
+        slack = {u: latest_finish[u] - finish[u] for u in order}
+
+        node = max(order, key=finish.__getitem__)
+        path = [node]
+        while node in previous:
+            node = previous[node]
+            path.append(node)
+        path.reverse()
+        return CriticalPath(path, total, slack)
+
     def size(self):
         return len(self.graph)
+
+    def freeze(self):
+        """ Returns a read-only CompactDAG snapshot of this graph. """
+        return CompactDAG(self.graph)
+
+
+class CompactDAG(object):
+    """ Read-only, integer-indexed DAG.
+
+    Node names are interned to dense ints (their position in ``names``)
+    and adjacency is stored in compressed sparse row form: the successors
+    of node ``i`` are ``succ_targets[succ_offsets[i]:succ_offsets[i + 1]]``,
+    and likewise for predecessors. All of these are ``array('i')``, so a
+    graph costs a few machine words per node and per edge instead of a
+    Python set per node, and traversals never hash node names.
+
+    The public methods mirror DAG's read-only API and take and return
+    node names.
+    """
+
+    def __init__(self, graph):
+        """ Build from a mapping of {node_name: iterable of downstreams}. """
+        self.names = list(graph)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        index = self.index
+
+        self.succ_offsets = array('i', [0])
+        self.succ_targets = array('i')
+        in_degree = array('i', [0]) * len(self.names)
+        for name in self.names:
+            for downstream_node in graph[name]:
+                target = index[downstream_node]
+                self.succ_targets.append(target)
+                in_degree[target] += 1
+            self.succ_offsets.append(len(self.succ_targets))
+
+        self.pred_offsets = array('i', [0])
+        for degree in in_degree:
+            self.pred_offsets.append(self.pred_offsets[-1] + degree)
+        self.pred_targets = array('i', [0]) * len(self.succ_targets)
+        fill = array('i', self.pred_offsets[:-1])
+        for source in range(len(self.names)):
+            for j in range(self.succ_offsets[source],
+                           self.succ_offsets[source + 1]):
+                target = self.succ_targets[j]
+                self.pred_targets[fill[target]] = source
+                fill[target] += 1
+
+        self._order = None
+        self._rank = None
+
+    def size(self):
+        return len(self.names)
+
+    def _successors(self, i):
+        return self.succ_targets[self.succ_offsets[i]:self.succ_offsets[i + 1]]
+
+    def _predecessors(self, i):
+        return self.pred_targets[self.pred_offsets[i]:self.pred_offsets[i + 1]]
+
+    def _node_index(self, node):
+        try:
+            return self.index[node]
+        except KeyError:
+            raise KeyError('node %s is not in graph' % node)
+
+    def downstream(self, node):
+        """ Returns a list of all nodes this node has edges towards. """
+        names = self.names
+        return [names[j] for j in self._successors(self._node_index(node))]
+
+    def predecessors(self, node):
+        """ Returns a list of all predecessors of the given node """
+        if node not in self.index:
+            return []
+        names = self.names
+        return [names[j] for j in self._predecessors(self.index[node])]
+
+    def all_downstreams(self, node):
+        """Returns a list of all nodes ultimately downstream
+        of the given node in the dependency graph, in
+        topological order."""
+        succ_offsets, succ_targets = self.succ_offsets, self.succ_targets
+        seen = bytearray(len(self.names))
+        stack = [self._node_index(node)]
+        found = []
+        while stack:
+            i = stack.pop()
+            for j in range(succ_offsets[i], succ_offsets[i + 1]):
+                target = succ_targets[j]
+                if not seen[target]:
+                    seen[target] = 1
+                    found.append(target)
+                    stack.append(target)
+        rank = self._topological_rank()
+        names = self.names
+        return [names[i] for i in sorted(found, key=rank.__getitem__)]
+
+    def all_leaves(self):
+        """ Return a list of all leaves (nodes with no downstreams) """
+        offsets = self.succ_offsets
+        return [name for i, name in enumerate(self.names)
+                if offsets[i] == offsets[i + 1]]
+
+    def ind_nodes(self):
+        """ Returns a list of all nodes in the graph with no dependencies. """
+        offsets = self.pred_offsets
+        return [name for i, name in enumerate(self.names)
+                if offsets[i] == offsets[i + 1]]
+
+    def topological_sort(self):
+        """ Returns a topological ordering of the DAG.
+
+        Raises an error if this is not possible (graph is not valid).
+        """
+        names = self.names
+        return [names[i] for i in self._topological_order()]
+
+    def _topological_order(self):
+        if self._order is not None:
+            return self._order
+        succ_offsets, succ_targets = self.succ_offsets, self.succ_targets
+        pred_offsets = self.pred_offsets
+        in_degree = array('i', (pred_offsets[i + 1] - pred_offsets[i]
+                                for i in range(len(self.names))))
+        # first in, first out, with each batch of newly ready nodes
+        # queued lowest index first: the same order DAG gives
+        queue = deque(i for i in range(len(self.names)) if not in_degree[i])
+        order = array('i')
+        while queue:
+            i = queue.popleft()
+            order.append(i)
+            ready = []
+            for j in range(succ_offsets[i], succ_offsets[i + 1]):
+                target = succ_targets[j]
+                in_degree[target] -= 1
+                if not in_degree[target]:
+                    ready.append(target)
+            if len(ready) > 1:
+                ready.sort()
+            queue.extend(ready)
+        if len(order) != len(self.names):
+            raise ValueError('graph is not acyclic')
+        self._order = order
+        return order
+
+    def _topological_rank(self):
+        if self._rank is None:
+            order = self._topological_order()
+            rank = array('i', [0]) * len(order)
+            for position, i in enumerate(order):
+                rank[i] = position
+            self._rank = rank
+        return self._rank
+
+
+class ReachabilityIndex(object):
+    """ Transitive closure of a DAG for constant-time reachability queries.
+
+    Nodes are numbered in topological order and every node keeps two
+    bitsets (plain Python ints): the nodes it reaches and the nodes that
+    reach it. The closure costs O(V^2 / 8) bytes, so it is meant for
+    graphs of up to a few tens of thousands of nodes.
+
+    Edges and nodes added through the index update it incrementally. If
+    the underlying DAG is changed any other way, the index is rebuilt on
+    the next query. An added edge can point from a later node to an
+    earlier one; from then on the numbering is no longer topological and
+    listings are sorted by the DAG's cached order instead.
+    """
+
+    def __init__(self, dag):
+        self.dag = dag
+        self.rebuild()
+
+    def rebuild(self):
+        """ Recompute the closure from scratch. """
+        graph = self.dag.graph
+        self.names = self.dag.topological_sort()
+        self.index = index = {name: i for i, name in enumerate(self.names)}
+        self.descendants = descendants = [0] * len(self.names)
+        self.ancestors = ancestors = [0] * len(self.names)
+        for i in range(len(self.names) - 1, -1, -1):
+            bits = 0
+            for downstream_node in graph[self.names[i]]:
+                j = index[downstream_node]
+                bits |= descendants[j] | (1 << j)
+            descendants[i] = bits
+        for i, name in enumerate(self.names):
+            bits = 0
+            for upstream_node in self.dag.predecessors(name):
+                j = index[upstream_node]
+                bits |= ancestors[j] | (1 << j)
+            ancestors[i] = bits
+        self._graph = graph
+        self._generation = self.dag._generation
+        #: whether the numbering is still a topological order
+        self._topological = True
+
+    def _sync(self):
+        if (self._generation != self.dag._generation or
+                self._graph is not self.dag.graph):
+            self.rebuild()
+
+    def _node_index(self, node):
+        try:
+            return self.index[node]
+        except KeyError:
+            raise KeyError('node %s is not in graph' % node)
+
+    def _indexes_from_bits(self, bits):
+        digits = bin(bits)[:1:-1]
+        i = digits.find('1')
+        while i != -1:
+            yield i
+            i = digits.find('1', i + 1)
+
+    def _names_from_bits(self, bits):
+        names = self.names
+        found = [names[i] for i in self._indexes_from_bits(bits)]
+        if not self._topological:
+            _, rank = self.dag._topological_index()
+            found.sort(key=rank.__getitem__)
+        return found
+
+    def reaches(self, ind_node, dep_node):
+        """ Returns whether dep_node is downstream of ind_node. """
+        self._sync()
+        i = self._node_index(ind_node)
+        j = self._node_index(dep_node)
+        return bool(self.descendants[i] >> j & 1)
+
+    def all_downstreams(self, node):
+        """ Returns a list of all nodes ultimately downstream of node,
+        in topological order. """
+        self._sync()
+        return self._names_from_bits(self.descendants[self._node_index(node)])
+
+    def all_upstreams(self, node):
+        """ Returns a list of all nodes node is ultimately downstream of,
+        in topological order. """
+        self._sync()
+        return self._names_from_bits(self.ancestors[self._node_index(node)])
+
+    def add_node(self, node_name):
+        """ Add a node to the DAG and the index. """
+        self._sync()
+        self.dag.add_node(node_name)
+        self.index[node_name] = len(self.names)
+        self.names.append(node_name)
+        self.descendants.append(0)
+        self.ancestors.append(0)
+        self._generation = self.dag._generation
+
+    def add_edge(self, ind_node, dep_node):
+        """ Add an edge to the DAG and fold it into the closure.
+
+        Cycles are rejected with a bit test, which stands in for the
+        search DAG.add_edge would do, before the DAG is touched.
+        """
+        self._sync()
+        i = self._node_index(ind_node)
+        j = self._node_index(dep_node)
+        if i == j or self.descendants[j] >> i & 1:
+            raise DAGValidationError(
+                'failed topological sort: graph is not acyclic')
+        if dep_node in self.dag.graph[ind_node]:
+            return
+        self.dag._insert_edge(ind_node, dep_node)
+        if i > j:
+            self._topological = False
+
+        new_descendants = self.descendants[j] | (1 << j)
+        new_ancestors = self.ancestors[i] | (1 << i)
+        for k in self._indexes_from_bits(new_ancestors):
+            self.descendants[k] |= new_descendants
+        for k in self._indexes_from_bits(new_descendants):
+            self.ancestors[k] |= new_ancestors
+        self._generation = self.dag._generation
+
+
+def strongly_connected_components(graph):
+    """ Returns the strongly connected components of a (cyclic) graph.
+
+    ``graph`` maps nodes to iterables of downstream nodes, as in
+    DAG.graph; nodes that only appear as edge targets are allowed.
+    Components are lists of nodes and come back in topological order of
+    the condensed graph. This is Tarjan's algorithm with an explicit
+    stack, so deep graphs cannot hit the recursion limit.
+    """
+    index = {}
+    lowlink = {}
+    stack = []
+    on_stack = set()
+    components = []
+
+    for root in graph:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph.get(root, ())))]
+        while work:
+            node, downstreams = work[-1]
+            for downstream_node in downstreams:
+                if downstream_node not in index:
+                    index[downstream_node] = lowlink[downstream_node] = \
+                        len(index)
+                    stack.append(downstream_node)
+                    on_stack.add(downstream_node)
+                    work.append((
+                        downstream_node,
+                        iter(graph.get(downstream_node, ()))))
+                    break
+                elif downstream_node in on_stack:
+                    lowlink[node] = min(lowlink[node], index[downstream_node])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.remove(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    component.reverse()
+                    components.append(component)
+
+    components.reverse()
+    return components
+
+
+def find_cycles(graph, components=None):
+    """ Returns the components of graph that contain a cycle. """
+    if components is None:
+        components = strongly_connected_components(graph)
+    return [
+        component for component in components
+        if len(component) > 1 or component[0] in graph.get(component[0], ())
+    ]
+
+
+def condense(graph):
+    """ Collapses every cycle of graph into a single node.
+
+    Returns (dag, cycles): a DAG whose nodes are tuples of the original
+    nodes, one per strongly connected component, and the list of
+    components that contain a cycle. Ordering the DAG then orders the
+    original graph with each cycle kept together.
+    """
+    components = strongly_connected_components(graph)
+    component_of = {}
+    for component in components:
+        name = tuple(component)
+        for node in component:
+            component_of[node] = name
+
+    def edges():
+        for node, downstreams in graph.items():
+            for downstream_node in downstreams:
+                ind_node = component_of[node]
+                dep_node = component_of[downstream_node]
+                if ind_node != dep_node:
+                    yield ind_node, dep_node
+
+    condensed = DAG()
+    condensed.from_edges(
+        edges(), nodes=(tuple(component) for component in components))
+    return condensed, find_cycles(graph, components)
@@ -0,0 +1,144 @@
+"""
+Generated from https://clubhouse.io/api/rest/v2/ by clubhouse/parser.py.
+
+Every resource lives in its own submodule, which is only imported (along
+with marshmallow and the resources it nests) the first time one of its
+names is looked up on this package.
+"""
+import importlib
+import sys
+
+#: public name -> submodule defining it
+_modules = {
+    'PullRequest': 'pull_request',
+    'PullRequestModel': 'pull_request',
+    'load_pull_request': 'pull_request',
+    'Category': 'category',
+    'CategoryModel': 'category',
+    'load_category': 'category',
+    'Comment': 'comment',
+    'CommentModel': 'comment',
+    'load_comment': 'comment',
+    'Identity': 'identity',
+    'IdentityModel': 'identity',
+    'load_identity': 'identity',
+    'CreateCategoryParams': 'create_category_params',
+    'CreateCategoryParamsModel': 'create_category_params',
+    'load_create_category_params': 'create_category_params',
+    'CreateCommentParams': 'create_comment_params',
+    'CreateCommentParamsModel': 'create_comment_params',
+    'load_create_comment_params': 'create_comment_params',
+    'CreateLabelParams': 'create_label_params',
+    'CreateLabelParamsModel': 'create_label_params',
+    'load_create_label_params': 'create_label_params',
+    'CreateStoryLinkParams': 'create_story_link_params',
+    'CreateStoryLinkParamsModel': 'create_story_link_params',
+    'load_create_story_link_params': 'create_story_link_params',
+    'CreateTaskParams': 'create_task_params',
+    'CreateTaskParamsModel': 'create_task_params',
+    'load_create_task_params': 'create_task_params',
+    'ThreadedComment': 'threaded_comment',
+    'ThreadedCommentModel': 'threaded_comment',
+    'load_threaded_comment': 'threaded_comment',
+    'EpicStats': 'epic_stats',
+    'EpicStatsModel': 'epic_stats',
+    'load_epic_stats': 'epic_stats',
+    'File': 'file',
+    'FileModel': 'file',
+    'load_file': 'file',
+    'Icon': 'icon',
+    'IconModel': 'icon',
+    'load_icon': 'icon',
+    'LabelStats': 'label_stats',
+    'LabelStatsModel': 'label_stats',
+    'load_label_stats': 'label_stats',
+    'LinkedFile': 'linked_file',
+    'LinkedFileModel': 'linked_file',
+    'load_linked_file': 'linked_file',
+    'ProjectStats': 'project_stats',
+    'ProjectStatsModel': 'project_stats',
+    'load_project_stats': 'project_stats',
+    'Repository': 'repository',
+    'RepositoryModel': 'repository',
+    'load_repository': 'repository',
+    'TypedStoryLink': 'typed_story_link',
+    'TypedStoryLinkModel': 'typed_story_link',
+    'load_typed_story_link': 'typed_story_link',
+    'Task': 'task',
+    'TaskModel': 'task',
+    'load_task': 'task',
+    'StoryLink': 'story_link',
+    'StoryLinkModel': 'story_link',
+    'load_story_link': 'story_link',
+    'WorkflowState': 'workflow_state',
+    'WorkflowStateModel': 'workflow_state',
+    'load_workflow_state': 'workflow_state',
+    'Branch': 'branch',
+    'BranchModel': 'branch',
+    'load_branch': 'branch',
+    'Milestone': 'milestone',
+    'MilestoneModel': 'milestone',
+    'load_milestone': 'milestone',
+    'Commit': 'commit',
+    'CommitModel': 'commit',
+    'load_commit': 'commit',
+    'CreateStoryParams': 'create_story_params',
+    'CreateStoryParamsModel': 'create_story_params',
+    'load_create_story_params': 'create_story_params',
+    'Profile': 'profile',
+    'ProfileModel': 'profile',
+    'load_profile': 'profile',
+    'Label': 'label',
+    'LabelModel': 'label',
+    'load_label': 'label',
+    'Project': 'project',
+    'ProjectModel': 'project',
+    'load_project': 'project',
+    'Workflow': 'workflow',
+    'WorkflowModel': 'workflow',
+    'load_workflow': 'workflow',
+    'Member': 'member',
+    'MemberModel': 'member',
+    'load_member': 'member',
+    'Story': 'story',
+    'StoryModel': 'story',
+    'load_story': 'story',
+    'StorySlim': 'story_slim',
+    'StorySlimModel': 'story_slim',
+    'load_story_slim': 'story_slim',
+    'StorySearch': 'story_search',
+    'StorySearchModel': 'story_search',
+    'load_story_search': 'story_search',
+    'Epic': 'epic',
+    'EpicModel': 'epic',
+    'load_epic': 'epic',
+    'Team': 'team',
+    'TeamModel': 'team',
+    'load_team': 'team',
+    'SearchResults': 'search_results',
+    'SearchResultsModel': 'search_results',
+    'load_search_results': 'search_results',
+}
+
+__all__ = sorted(_modules)
+
+
+def __getattr__(name):
+    try:
+        module = _modules[name]
+    except KeyError:
+        raise AttributeError(
+            'module {0!r} has no attribute {1!r}'.format(__name__, name))
+    value = getattr(importlib.import_module('.' + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_modules))
+
+
+if sys.version_info < (3, 7):
+    # module level __getattr__ (PEP 562) needs 3.7, load everything now
+    for _name in __all__:
+        __getattr__(_name)
\ No newline at end of file
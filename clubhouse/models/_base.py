@@ -0,0 +1,155 @@
+import uuid
+from collections.abc import Mapping
+
+import attr
+from marshmallow import (
+    Schema, ValidationError, fields, post_load, pprint, utils, validate,
+)
+
+#: stands in for a key that is absent from the data being loaded
+_missing = object()
+
+
+def _invalid(name, message):
+    return ValidationError({name: message if isinstance(message, (dict, list)) else [message]})
+
+
+def _check_mapping(data):
+    if not isinstance(data, Mapping):
+        raise ValidationError({'_schema': ['Invalid input type.']})
+
+
+def _null(name, allow_none):
+    if not allow_none:
+        raise _invalid(name, 'Field may not be null.')
+    return None
+
+
+def _integer(value, name, allow_none=False):
+    if type(value) is int:
+        return value
+    if value is _missing:
+        return None
+    if value is None:
+        return _null(name, allow_none)
+    if value is True or value is False:
+        raise _invalid(name, 'Not a valid integer.')
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        raise _invalid(name, 'Not a valid integer.')
+
+
+def _string(value, name, allow_none=False):
+    if type(value) is str:
+        return value
+    if value is _missing:
+        return None
+    if value is None:
+        return _null(name, allow_none)
+    if not isinstance(value, (str, bytes)):
+        raise _invalid(name, 'Not a valid string.')
+    try:
+        return utils.ensure_text_type(value)
+    except UnicodeDecodeError:
+        raise _invalid(name, 'Not a valid utf-8 string.')
+
+
+def _boolean(value, name, allow_none=False):
+    if value is True or value is False:
+        return value
+    if value is _missing:
+        return None
+    if value is None:
+        return _null(name, allow_none)
+    try:
+        if value in fields.Boolean.truthy:
+            return True
+        if value in fields.Boolean.falsy:
+            return False
+    except TypeError:
+        pass
+    raise _invalid(name, 'Not a valid boolean.')
+
+
+def _uuid(value, name, allow_none=False):
+    if isinstance(value, uuid.UUID):
+        return value
+    if value is _missing:
+        return None
+    if value is None:
+        return _null(name, allow_none)
+    try:
+        if isinstance(value, bytes) and len(value) == 16:
+            return uuid.UUID(bytes=value)
+        return uuid.UUID(value)
+    except (ValueError, AttributeError, TypeError):
+        raise _invalid(name, 'Not a valid UUID.')
+
+
+def _date(value, name, allow_none=False):
+    if value is _missing:
+        return None
+    if value is None:
+        return _null(name, allow_none)
+    if not value:
+        raise _invalid(name, 'Not a valid date.')
+    try:
+        return utils.from_iso_date(value)
+    except (AttributeError, TypeError, ValueError):
+        raise _invalid(name, 'Not a valid date.')
+
+
+def _datetime(value, name, allow_none=False):
+    if value is _missing:
+        return None
+    if value is None:
+        return _null(name, allow_none)
+    if not value:
+        raise _invalid(name, 'Not a valid datetime.')
+    try:
+        return utils.from_iso_datetime(value)
+    except (AttributeError, TypeError, ValueError):
+        raise _invalid(name, 'Not a valid datetime.')
+
+
+def _list(load_item, value, name, allow_none=False):
+    if value is _missing:
+        return None
+    if value is None:
+        return _null(name, allow_none)
+    if not utils.is_collection(value):
+        raise _invalid(name, 'Not a valid list.')
+    return [load_item(item, name) for item in value]
+
+
+def _nested(load, value, name, allow_none=False, many=False):
+    if value is _missing:
+        return None
+    if value is None:
+        return _null(name, allow_none)
+    try:
+        if not many:
+            return load(value)
+        if not utils.is_collection(value):
+            raise ValidationError({'_schema': ['Invalid input type.']})
+        return [load(item) for item in value]
+    except ValidationError as ex:
+        raise _invalid(name, ex.messages)
+
+
+def _deserialize(field, value, name):
+    if value is _missing:
+        return None
+    try:
+        return field.deserialize(value)
+    except ValidationError as ex:
+        raise _invalid(name, ex.messages)
+
+
+def _one_of(value, name, choices):
+    if value is not None and value not in choices:
+        raise _invalid(
+            name, 'Must be one of: {0}.'.format(', '.join(choices)))
+    return value
+
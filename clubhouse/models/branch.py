@@ -0,0 +1,85 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+from .pull_request import PullRequest, load_pull_request
+
+@attr.s(slots=True)
+class BranchModel(object):
+    created_at = attr.ib(default=None)
+    deleted = attr.ib(default=None)
+    entity_type = attr.ib(default=None)
+    id = attr.ib(default=None)
+    merged_branch_ids = attr.ib(default=None)
+    name = attr.ib(default=None)
+    persistent = attr.ib(default=None)
+    pull_requests = attr.ib(default=None)
+    repository_id = attr.ib(default=None)
+    updated_at = attr.ib(default=None)
+    url = attr.ib(default=None)
+
+class Branch(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: The time/date the Branch was created.
+    created_at = fields.DateTime(allow_none=True)
+
+    #: A true/false boolean indicating if the Branch has been deleted.
+    deleted = fields.Boolean()
+
+    #: A string description of this resource.
+    entity_type = fields.String()
+
+    #: The unique identifier of the Branch.
+    id = fields.Integer(allow_none=True)
+
+    #: The IDs of the Branches the Branch has been merged into.
+    merged_branch_ids = fields.List(fields.Integer())
+
+    #: The name of the Branch.
+    name = fields.String()
+
+    #: A true/false boolean indicating if the Branch is persistent; e.g. master.
+    persistent = fields.Boolean()
+
+    #: An array of PullRequests attached to the Branch (there is usually only
+    #: one).
+    pull_requests = fields.Nested(PullRequest, many=True)
+
+    #: The ID of the Repository that contains the Branch.
+    repository_id = fields.Integer(allow_none=True)
+
+    #: The time/date the Branch was updated.
+    updated_at = fields.DateTime(allow_none=True)
+
+    #: The URL of the Branch.
+    url = fields.String()
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return BranchModel(**data)
+
+
+def load_branch(data):
+    """ Branch().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return BranchModel(
+        created_at=_datetime(get('created_at', _missing), 'created_at', True),
+        deleted=_boolean(get('deleted', _missing), 'deleted'),
+        entity_type=_string(get('entity_type', _missing), 'entity_type'),
+        id=_integer(get('id', _missing), 'id', True),
+        merged_branch_ids=_list(_integer, get('merged_branch_ids', _missing), 'merged_branch_ids'),
+        name=_string(get('name', _missing), 'name'),
+        persistent=_boolean(get('persistent', _missing), 'persistent'),
+        pull_requests=_nested(load_pull_request, get('pull_requests', _missing), 'pull_requests', False, True),
+        repository_id=_integer(get('repository_id', _missing), 'repository_id', True),
+        updated_at=_datetime(get('updated_at', _missing), 'updated_at', True),
+        url=_string(get('url', _missing), 'url'),
+    )
+
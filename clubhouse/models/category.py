@@ -0,0 +1,76 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+
+@attr.s(slots=True)
+class CategoryModel(object):
+    archived = attr.ib(default=None)
+    color = attr.ib(default=None)
+    created_at = attr.ib(default=None)
+    entity_type = attr.ib(default=None)
+    external_id = attr.ib(default=None)
+    id = attr.ib(default=None)
+    name = attr.ib(default=None)
+    type = attr.ib(default=None)
+    updated_at = attr.ib(default=None)
+
+class Category(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: A true/false boolean indicating if the Category has been archived.
+    archived = fields.Boolean()
+
+    #: The hex color to be displayed with the Category (for example, #ff0000).
+    color = fields.String(allow_none=True)
+
+    #: The time/date that the Category was created.
+    created_at = fields.DateTime()
+
+    #: A string description of this resource.
+    entity_type = fields.String()
+
+    #: This field can be set to another unique ID. In the case that the Category
+    #: has been imported from another tool, the ID in the other tool can be
+    #: indicated here.
+    external_id = fields.String(allow_none=True)
+
+    #: The unique ID of the Category.
+    id = fields.Integer()
+
+    #: The name of the Category.
+    name = fields.String()
+
+    #: The type of entity this Category is associated with; currently Milestone
+    #: is the only type of Category.
+    type = fields.String()
+
+    #: The time/date that the Category was updated.
+    updated_at = fields.DateTime()
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return CategoryModel(**data)
+
+
+def load_category(data):
+    """ Category().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return CategoryModel(
+        archived=_boolean(get('archived', _missing), 'archived'),
+        color=_string(get('color', _missing), 'color', True),
+        created_at=_datetime(get('created_at', _missing), 'created_at'),
+        entity_type=_string(get('entity_type', _missing), 'entity_type'),
+        external_id=_string(get('external_id', _missing), 'external_id', True),
+        id=_integer(get('id', _missing), 'id'),
+        name=_string(get('name', _missing), 'name'),
+        type=_string(get('type', _missing), 'type'),
+        updated_at=_datetime(get('updated_at', _missing), 'updated_at'),
+    )
+
@@ -0,0 +1,80 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+
+@attr.s(slots=True)
+class CommentModel(object):
+    author_id = attr.ib(default=None)
+    created_at = attr.ib(default=None)
+    entity_type = attr.ib(default=None)
+    external_id = attr.ib(default=None)
+    id = attr.ib(default=None)
+    mention_ids = attr.ib(default=None)
+    position = attr.ib(default=None)
+    story_id = attr.ib(default=None)
+    text = attr.ib(default=None)
+    updated_at = attr.ib(default=None)
+
+class Comment(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: The unique ID of the Member who is the Comments author.
+    author_id = fields.UUID(allow_none=True)
+
+    #: The time/date when the Comment was created.
+    created_at = fields.DateTime()
+
+    #: A string description of this resource.
+    entity_type = fields.String()
+
+    #: This field can be set to another unique ID. In the case that the Comment
+    #: has been imported from another tool, the ID in the other tool can be
+    #: indicated here.
+    external_id = fields.String(allow_none=True)
+
+    #: The unique ID of the Comment.
+    id = fields.Integer()
+
+    #: The unique IDs of the Member who are mentioned in the Comment.
+    mention_ids = fields.List(fields.UUID())
+
+    #: The Comments numerical position in the list from oldest to newest.
+    position = fields.Integer()
+
+    #: The ID of the Story on which the Comment appears.
+    story_id = fields.Integer()
+
+    #: The text of the Comment.
+    text = fields.String()
+
+    #: The time/date when the Comment was updated.
+    updated_at = fields.DateTime(allow_none=True)
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return CommentModel(**data)
+
+
+def load_comment(data):
+    """ Comment().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return CommentModel(
+        author_id=_uuid(get('author_id', _missing), 'author_id', True),
+        created_at=_datetime(get('created_at', _missing), 'created_at'),
+        entity_type=_string(get('entity_type', _missing), 'entity_type'),
+        external_id=_string(get('external_id', _missing), 'external_id', True),
+        id=_integer(get('id', _missing), 'id'),
+        mention_ids=_list(_uuid, get('mention_ids', _missing), 'mention_ids'),
+        position=_integer(get('position', _missing), 'position'),
+        story_id=_integer(get('story_id', _missing), 'story_id'),
+        text=_string(get('text', _missing), 'text'),
+        updated_at=_datetime(get('updated_at', _missing), 'updated_at', True),
+    )
+
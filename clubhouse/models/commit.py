@@ -0,0 +1,94 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+from .identity import Identity, load_identity
+
+@attr.s(slots=True)
+class CommitModel(object):
+    author_email = attr.ib(default=None)
+    author_id = attr.ib(default=None)
+    author_identity = attr.ib(default=None)
+    created_at = attr.ib(default=None)
+    entity_type = attr.ib(default=None)
+    hash = attr.ib(default=None)
+    id = attr.ib(default=None)
+    merged_branch_ids = attr.ib(default=None)
+    message = attr.ib(default=None)
+    repository_id = attr.ib(default=None)
+    timestamp = attr.ib(default=None)
+    updated_at = attr.ib(default=None)
+    url = attr.ib(default=None)
+
+class Commit(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: The email address of the GitHub user that authored the Commit.
+    author_email = fields.String()
+
+    #: The ID of the Member that authored the Commit, if known.
+    author_id = fields.UUID(allow_none=True)
+
+    #: The Identity of the GitHub user that authored the Commit.
+    author_identity = fields.Nested(Identity, many=False)
+
+    #: The time/date the Commit was created.
+    created_at = fields.DateTime()
+
+    #: A string description of this resource.
+    entity_type = fields.String()
+
+    #: The Commit hash.
+    hash = fields.String()
+
+    #: The unique identifier of the Commit.
+    id = fields.Integer(allow_none=True)
+
+    #: The IDs of the Branches the Commit has been merged into.
+    merged_branch_ids = fields.List(fields.Integer())
+
+    #: The Commit message.
+    message = fields.String()
+
+    #: The ID of the Repository that contains the Commit.
+    repository_id = fields.Integer(allow_none=True)
+
+    #: The time/date the Commit was pushed.
+    timestamp = fields.DateTime()
+
+    #: The time/date the Commit was updated.
+    updated_at = fields.DateTime(allow_none=True)
+
+    #: The URL of the Commit.
+    url = fields.String()
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return CommitModel(**data)
+
+
+def load_commit(data):
+    """ Commit().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return CommitModel(
+        author_email=_string(get('author_email', _missing), 'author_email'),
+        author_id=_uuid(get('author_id', _missing), 'author_id', True),
+        author_identity=_nested(load_identity, get('author_identity', _missing), 'author_identity', False, False),
+        created_at=_datetime(get('created_at', _missing), 'created_at'),
+        entity_type=_string(get('entity_type', _missing), 'entity_type'),
+        hash=_string(get('hash', _missing), 'hash'),
+        id=_integer(get('id', _missing), 'id', True),
+        merged_branch_ids=_list(_integer, get('merged_branch_ids', _missing), 'merged_branch_ids'),
+        message=_string(get('message', _missing), 'message'),
+        repository_id=_integer(get('repository_id', _missing), 'repository_id', True),
+        timestamp=_datetime(get('timestamp', _missing), 'timestamp'),
+        updated_at=_datetime(get('updated_at', _missing), 'updated_at', True),
+        url=_string(get('url', _missing), 'url'),
+    )
+
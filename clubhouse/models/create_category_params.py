@@ -0,0 +1,45 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+
+@attr.s(slots=True)
+class CreateCategoryParamsModel(object):
+    color = attr.ib(default=None)
+    external_id = attr.ib(default=None)
+    name = attr.ib(default=None)
+
+class CreateCategoryParams(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: The hex color to be displayed with the Category (for example, #ff0000).
+    color = fields.String()
+
+    #: This field can be set to another unique ID. In the case that the Category
+    #: has been imported from another tool, the ID in the other tool can be
+    #: indicated here.
+    external_id = fields.String()
+
+    #: The name of the Category.
+    name = fields.String()
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return CreateCategoryParamsModel(**data)
+
+
+def load_create_category_params(data):
+    """ CreateCategoryParams().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return CreateCategoryParamsModel(
+        color=_string(get('color', _missing), 'color'),
+        external_id=_string(get('external_id', _missing), 'external_id'),
+        name=_string(get('name', _missing), 'name'),
+    )
+
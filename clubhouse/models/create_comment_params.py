@@ -0,0 +1,54 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+
+@attr.s(slots=True)
+class CreateCommentParamsModel(object):
+    author_id = attr.ib(default=None)
+    created_at = attr.ib(default=None)
+    external_id = attr.ib(default=None)
+    text = attr.ib(default=None)
+    updated_at = attr.ib(default=None)
+
+class CreateCommentParams(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: The unique ID of the Member who is the Comments author.
+    author_id = fields.UUID()
+
+    #: The time/date when the Comment was created.
+    created_at = fields.DateTime()
+
+    #: An optional user-defined ID perhaps associating Comment with an outside
+    #: tool.
+    external_id = fields.String()
+
+    #: The text of the Comment.
+    text = fields.String()
+
+    #: The time/date when the Comment was updated.
+    updated_at = fields.DateTime()
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return CreateCommentParamsModel(**data)
+
+
+def load_create_comment_params(data):
+    """ CreateCommentParams().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return CreateCommentParamsModel(
+        author_id=_uuid(get('author_id', _missing), 'author_id'),
+        created_at=_datetime(get('created_at', _missing), 'created_at'),
+        external_id=_string(get('external_id', _missing), 'external_id'),
+        text=_string(get('text', _missing), 'text'),
+        updated_at=_datetime(get('updated_at', _missing), 'updated_at'),
+    )
+
@@ -0,0 +1,44 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+
+@attr.s(slots=True)
+class CreateLabelParamsModel(object):
+    color = attr.ib(default=None)
+    external_id = attr.ib(default=None)
+    name = attr.ib(default=None)
+
+class CreateLabelParams(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: The hex color to be displayed with the Label (for example, #ff0000).
+    color = fields.String()
+
+    #: An optional user-defined ID perhaps associating the Epic with an outside
+    #: tool.
+    external_id = fields.String()
+
+    #: The Label name.
+    name = fields.String()
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return CreateLabelParamsModel(**data)
+
+
+def load_create_label_params(data):
+    """ CreateLabelParams().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return CreateLabelParamsModel(
+        color=_string(get('color', _missing), 'color'),
+        external_id=_string(get('external_id', _missing), 'external_id'),
+        name=_string(get('name', _missing), 'name'),
+    )
+
@@ -0,0 +1,44 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+
+@attr.s(slots=True)
+class CreateStoryLinkParamsModel(object):
+    object_id = attr.ib(default=None)
+    subject_id = attr.ib(default=None)
+    verb = attr.ib(default=None)
+
+class CreateStoryLinkParams(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: The unique ID of the Story defined as object.
+    object_id = fields.Integer()
+
+    #: The unique ID of the Story defined as subject.
+    subject_id = fields.Integer()
+
+    #: How the subject Story acts on the object Story.  This can be blocks,
+    #: duplicates, or relates to.
+    verb = fields.String(validate=validate.OneOf(["blocks", "duplicates", "relates to"]))
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return CreateStoryLinkParamsModel(**data)
+
+
+def load_create_story_link_params(data):
+    """ CreateStoryLinkParams().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return CreateStoryLinkParamsModel(
+        object_id=_integer(get('object_id', _missing), 'object_id'),
+        subject_id=_integer(get('subject_id', _missing), 'subject_id'),
+        verb=_one_of(_string(get('verb', _missing), 'verb'), 'verb', ["blocks", "duplicates", "relates to"]),
+    )
+
@@ -0,0 +1,144 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+from .create_comment_params import CreateCommentParams, load_create_comment_params
+from .create_label_params import CreateLabelParams, load_create_label_params
+from .create_story_link_params import CreateStoryLinkParams, load_create_story_link_params
+from .create_task_params import CreateTaskParams, load_create_task_params
+
+@attr.s(slots=True)
+class CreateStoryParamsModel(object):
+    comments = attr.ib(default=None)
+    completed_at_override = attr.ib(default=None)
+    created_at = attr.ib(default=None)
+    deadline = attr.ib(default=None)
+    description = attr.ib(default=None)
+    epic_id = attr.ib(default=None)
+    estimate = attr.ib(default=None)
+    external_id = attr.ib(default=None)
+    file_ids = attr.ib(default=None)
+    follower_ids = attr.ib(default=None)
+    labels = attr.ib(default=None)
+    linked_file_ids = attr.ib(default=None)
+    name = attr.ib(default=None)
+    owner_ids = attr.ib(default=None)
+    project_id = attr.ib(default=None)
+    requested_by_id = attr.ib(default=None)
+    started_at_override = attr.ib(default=None)
+    story_links = attr.ib(default=None)
+    story_type = attr.ib(default=None)
+    tasks = attr.ib(default=None)
+    updated_at = attr.ib(default=None)
+    workflow_state_id = attr.ib(default=None)
+
+class CreateStoryParams(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: An array of comments to add to the story.
+    comments = fields.Nested(CreateCommentParams, many=True)
+
+    #: A manual override for the time/date the Story was completed.
+    completed_at_override = fields.DateTime()
+
+    #: The time/date the Story was created.
+    created_at = fields.DateTime()
+
+    #: The due date of the story.
+    deadline = fields.DateTime(allow_none=True)
+
+    #: The description of the story.
+    description = fields.String()
+
+    #: The ID of the epic the story belongs to.
+    epic_id = fields.Integer(allow_none=True)
+
+    #: The numeric point estimate of the story. Can also be null, which means
+    #: unestimated.
+    estimate = fields.Integer(allow_none=True)
+
+    #: An optional user-defined ID perhaps associating Task with an outside
+    #: tool.
+    external_id = fields.String()
+
+    #: An array of IDs of files attached to the story.
+    file_ids = fields.List(fields.Integer())
+
+    #: An array of UUIDs of the followers of this story.
+    follower_ids = fields.List(fields.UUID())
+
+    #: An array of labels attached to the story.
+    labels = fields.Nested(CreateLabelParams, many=True)
+
+    #: An array of IDs of linked files attached to the story.
+    linked_file_ids = fields.List(fields.Integer())
+
+    #: The name of the story.
+    name = fields.String()
+
+    #: An array of UUIDs of the owners of this story.
+    owner_ids = fields.List(fields.UUID())
+
+    #: The ID of the project the story belongs to.
+    project_id = fields.Integer()
+
+    #: The ID of the member that requested the story.
+    requested_by_id = fields.UUID()
+
+    #: A manual override for the time/date the Story was started.
+    started_at_override = fields.DateTime()
+
+    #: An array of story links attached to the story.
+    story_links = fields.Nested(CreateStoryLinkParams, many=True)
+
+    #: The type of story (feature, bug, chore).
+    story_type = fields.String(validate=validate.OneOf(["bug", "chore", "feature"]))
+
+    #: An array of tasks connected to the story.
+    tasks = fields.Nested(CreateTaskParams, many=True)
+
+    #: The time/date the Story was updated.
+    updated_at = fields.DateTime()
+
+    #: The ID of the workflow state the story is currently in.
+    workflow_state_id = fields.Integer()
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return CreateStoryParamsModel(**data)
+
+
+def load_create_story_params(data):
+    """ CreateStoryParams().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return CreateStoryParamsModel(
+        comments=_nested(load_create_comment_params, get('comments', _missing), 'comments', False, True),
+        completed_at_override=_datetime(get('completed_at_override', _missing), 'completed_at_override'),
+        created_at=_datetime(get('created_at', _missing), 'created_at'),
+        deadline=_datetime(get('deadline', _missing), 'deadline', True),
+        description=_string(get('description', _missing), 'description'),
+        epic_id=_integer(get('epic_id', _missing), 'epic_id', True),
+        estimate=_integer(get('estimate', _missing), 'estimate', True),
+        external_id=_string(get('external_id', _missing), 'external_id'),
+        file_ids=_list(_integer, get('file_ids', _missing), 'file_ids'),
+        follower_ids=_list(_uuid, get('follower_ids', _missing), 'follower_ids'),
+        labels=_nested(load_create_label_params, get('labels', _missing), 'labels', False, True),
+        linked_file_ids=_list(_integer, get('linked_file_ids', _missing), 'linked_file_ids'),
+        name=_string(get('name', _missing), 'name'),
+        owner_ids=_list(_uuid, get('owner_ids', _missing), 'owner_ids'),
+        project_id=_integer(get('project_id', _missing), 'project_id'),
+        requested_by_id=_uuid(get('requested_by_id', _missing), 'requested_by_id'),
+        started_at_override=_datetime(get('started_at_override', _missing), 'started_at_override'),
+        story_links=_nested(load_create_story_link_params, get('story_links', _missing), 'story_links', False, True),
+        story_type=_one_of(_string(get('story_type', _missing), 'story_type'), 'story_type', ["bug", "chore", "feature"]),
+        tasks=_nested(load_create_task_params, get('tasks', _missing), 'tasks', False, True),
+        updated_at=_datetime(get('updated_at', _missing), 'updated_at'),
+        workflow_state_id=_integer(get('workflow_state_id', _missing), 'workflow_state_id'),
+    )
+
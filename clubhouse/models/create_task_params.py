@@ -0,0 +1,59 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+
+@attr.s(slots=True)
+class CreateTaskParamsModel(object):
+    complete = attr.ib(default=None)
+    created_at = attr.ib(default=None)
+    description = attr.ib(default=None)
+    external_id = attr.ib(default=None)
+    owner_ids = attr.ib(default=None)
+    updated_at = attr.ib(default=None)
+
+class CreateTaskParams(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: A true/false boolean indicating whether the Task is complete.
+    complete = fields.Boolean()
+
+    #: The time/date that the Task was created.
+    created_at = fields.DateTime()
+
+    #: The Task description.
+    description = fields.String()
+
+    #: An optional user-defined ID perhaps associating Task with an outside
+    #: tool.
+    external_id = fields.String()
+
+    #: An array of unique IDs associated with the Members that own the Task.
+    owner_ids = fields.List(fields.UUID())
+
+    #: The time/date that the Task was updated.
+    updated_at = fields.DateTime()
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return CreateTaskParamsModel(**data)
+
+
+def load_create_task_params(data):
+    """ CreateTaskParams().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return CreateTaskParamsModel(
+        complete=_boolean(get('complete', _missing), 'complete'),
+        created_at=_datetime(get('created_at', _missing), 'created_at'),
+        description=_string(get('description', _missing), 'description'),
+        external_id=_string(get('external_id', _missing), 'external_id'),
+        owner_ids=_list(_uuid, get('owner_ids', _missing), 'owner_ids'),
+        updated_at=_datetime(get('updated_at', _missing), 'updated_at'),
+    )
+
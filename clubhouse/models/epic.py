@@ -0,0 +1,160 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+from .epic_stats import EpicStats, load_epic_stats
+from .label import Label, load_label
+from .threaded_comment import ThreadedComment, load_threaded_comment
+
+@attr.s(slots=True)
+class EpicModel(object):
+    archived = attr.ib(default=None)
+    comments = attr.ib(default=None)
+    completed = attr.ib(default=None)
+    completed_at = attr.ib(default=None)
+    completed_at_override = attr.ib(default=None)
+    created_at = attr.ib(default=None)
+    deadline = attr.ib(default=None)
+    description = attr.ib(default=None)
+    entity_type = attr.ib(default=None)
+    external_id = attr.ib(default=None)
+    follower_ids = attr.ib(default=None)
+    id = attr.ib(default=None)
+    labels = attr.ib(default=None)
+    milestone_id = attr.ib(default=None)
+    name = attr.ib(default=None)
+    owner_ids = attr.ib(default=None)
+    position = attr.ib(default=None)
+    project_ids = attr.ib(default=None)
+    requested_by_id = attr.ib(default=None)
+    started = attr.ib(default=None)
+    started_at = attr.ib(default=None)
+    started_at_override = attr.ib(default=None)
+    state = attr.ib(default=None)
+    stats = attr.ib(default=None)
+    updated_at = attr.ib(default=None)
+
+class Epic(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: True/false boolean that indicates whether the Epic is archived or not.
+    archived = fields.Boolean()
+
+    #: A nested array of threaded comments.
+    comments = fields.Nested(ThreadedComment, many=True)
+
+    #: A true/false boolean indicating if the Epic has been completed.
+    completed = fields.Boolean()
+
+    #: The time/date the Epic was completed.
+    completed_at = fields.DateTime(allow_none=True)
+
+    #: A manual override for the time/date the Epic was completed.
+    completed_at_override = fields.DateTime(allow_none=True)
+
+    #: The time/date the Epic was created.
+    created_at = fields.DateTime(allow_none=True)
+
+    #: The Epics deadline.
+    deadline = fields.DateTime(allow_none=True)
+
+    #: The Epics description.
+    description = fields.String()
+
+    #: A string description of this resource.
+    entity_type = fields.String()
+
+    #: This field can be set to another unique ID. In the case that the Epic has
+    #: been imported from another tool, the ID in the other tool can be
+    #: indicated here.
+    external_id = fields.String(allow_none=True)
+
+    #: An array of UUIDs for any Members you want to add as Followers on this
+    #: Epic.
+    follower_ids = fields.List(fields.UUID())
+
+    #: The unique ID of the Epic.
+    id = fields.Integer()
+
+    #: An array of Labels attached to the Epic.
+    labels = fields.Nested(Label, many=True)
+
+    #: The ID of the Milestone this Epic is related to.
+    milestone_id = fields.Integer(allow_none=True)
+
+    #: The name of the Epic.
+    name = fields.String()
+
+    #: An array of UUIDs for any members you want to add as Owners on this new
+    #: Epic.
+    owner_ids = fields.List(fields.UUID())
+
+    #: The Epics relative position in the Epic workflow state.
+    position = fields.Integer()
+
+    #: The IDs of Projects related to this Epic.
+    project_ids = fields.List(fields.Integer())
+
+    #: The ID of the member that requested the epic.
+    requested_by_id = fields.UUID()
+
+    #: A true/false boolean indicating if the Epic has been started.
+    started = fields.Boolean()
+
+    #: The time/date the Epic was started.
+    started_at = fields.DateTime(allow_none=True)
+
+    #: A manual override for the time/date the Epic was started.
+    started_at_override = fields.DateTime(allow_none=True)
+
+    #: The workflow state that the Epic is in.
+    state = fields.String()
+
+    #: A group of calculated values for this Epic.
+    stats = fields.Nested(EpicStats, many=False)
+
+    #: The time/date the Epic was updated.
+    updated_at = fields.DateTime(allow_none=True)
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return EpicModel(**data)
+
+
+def load_epic(data):
+    """ Epic().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return EpicModel(
+        archived=_boolean(get('archived', _missing), 'archived'),
+        comments=_nested(load_threaded_comment, get('comments', _missing), 'comments', False, True),
+        completed=_boolean(get('completed', _missing), 'completed'),
+        completed_at=_datetime(get('completed_at', _missing), 'completed_at', True),
+        completed_at_override=_datetime(get('completed_at_override', _missing), 'completed_at_override', True),
+        created_at=_datetime(get('created_at', _missing), 'created_at', True),
+        deadline=_datetime(get('deadline', _missing), 'deadline', True),
+        description=_string(get('description', _missing), 'description'),
+        entity_type=_string(get('entity_type', _missing), 'entity_type'),
+        external_id=_string(get('external_id', _missing), 'external_id', True),
+        follower_ids=_list(_uuid, get('follower_ids', _missing), 'follower_ids'),
+        id=_integer(get('id', _missing), 'id'),
+        labels=_nested(load_label, get('labels', _missing), 'labels', False, True),
+        milestone_id=_integer(get('milestone_id', _missing), 'milestone_id', True),
+        name=_string(get('name', _missing), 'name'),
+        owner_ids=_list(_uuid, get('owner_ids', _missing), 'owner_ids'),
+        position=_integer(get('position', _missing), 'position'),
+        project_ids=_list(_integer, get('project_ids', _missing), 'project_ids'),
+        requested_by_id=_uuid(get('requested_by_id', _missing), 'requested_by_id'),
+        started=_boolean(get('started', _missing), 'started'),
+        started_at=_datetime(get('started_at', _missing), 'started_at', True),
+        started_at_override=_datetime(get('started_at_override', _missing), 'started_at_override', True),
+        state=_string(get('state', _missing), 'state'),
+        stats=_nested(load_epic_stats, get('stats', _missing), 'stats', False, False),
+        updated_at=_datetime(get('updated_at', _missing), 'updated_at', True),
+    )
+
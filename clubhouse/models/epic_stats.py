@@ -0,0 +1,73 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+
+@attr.s(slots=True)
+class EpicStatsModel(object):
+    last_story_update = attr.ib(default=None)
+    num_points = attr.ib(default=None)
+    num_points_done = attr.ib(default=None)
+    num_points_started = attr.ib(default=None)
+    num_points_unstarted = attr.ib(default=None)
+    num_stories_done = attr.ib(default=None)
+    num_stories_started = attr.ib(default=None)
+    num_stories_unestimated = attr.ib(default=None)
+    num_stories_unstarted = attr.ib(default=None)
+
+class EpicStats(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: The date of the last update of a Story in this Epic.
+    last_story_update = fields.DateTime(allow_none=True)
+
+    #: The total number of points in this Epic.
+    num_points = fields.Integer()
+
+    #: The total number of completed points in this Epic.
+    num_points_done = fields.Integer()
+
+    #: The total number of started points in this Epic.
+    num_points_started = fields.Integer()
+
+    #: The total number of unstarted points in this Epic.
+    num_points_unstarted = fields.Integer()
+
+    #: The total number of done Stories in this Epic.
+    num_stories_done = fields.Integer()
+
+    #: The total number of started Stories in this Epic.
+    num_stories_started = fields.Integer()
+
+    #: The total number of Stories with no point estimate.
+    num_stories_unestimated = fields.Integer()
+
+    #: The total number of unstarted Stories in this Epic.
+    num_stories_unstarted = fields.Integer()
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return EpicStatsModel(**data)
+
+
+def load_epic_stats(data):
+    """ EpicStats().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return EpicStatsModel(
+        last_story_update=_datetime(get('last_story_update', _missing), 'last_story_update', True),
+        num_points=_integer(get('num_points', _missing), 'num_points'),
+        num_points_done=_integer(get('num_points_done', _missing), 'num_points_done'),
+        num_points_started=_integer(get('num_points_started', _missing), 'num_points_started'),
+        num_points_unstarted=_integer(get('num_points_unstarted', _missing), 'num_points_unstarted'),
+        num_stories_done=_integer(get('num_stories_done', _missing), 'num_stories_done'),
+        num_stories_started=_integer(get('num_stories_started', _missing), 'num_stories_started'),
+        num_stories_unestimated=_integer(get('num_stories_unestimated', _missing), 'num_stories_unestimated'),
+        num_stories_unstarted=_integer(get('num_stories_unstarted', _missing), 'num_stories_unstarted'),
+    )
+
@@ -0,0 +1,105 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+
+@attr.s(slots=True)
+class FileModel(object):
+    content_type = attr.ib(default=None)
+    created_at = attr.ib(default=None)
+    description = attr.ib(default=None)
+    entity_type = attr.ib(default=None)
+    external_id = attr.ib(default=None)
+    filename = attr.ib(default=None)
+    id = attr.ib(default=None)
+    mention_ids = attr.ib(default=None)
+    name = attr.ib(default=None)
+    size = attr.ib(default=None)
+    story_ids = attr.ib(default=None)
+    thumbnail_url = attr.ib(default=None)
+    updated_at = attr.ib(default=None)
+    uploader_id = attr.ib(default=None)
+    url = attr.ib(default=None)
+
+class File(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: Free form string corresponding to a text or image file.
+    content_type = fields.String()
+
+    #: The time/date that the file was created.
+    created_at = fields.DateTime()
+
+    #: The description of the file.
+    description = fields.String(allow_none=True)
+
+    #: A string description of this resource.
+    entity_type = fields.String()
+
+    #: This field can be set to another unique ID. In the case that the File has
+    #: been imported from another tool, the ID in the other tool can be
+    #: indicated here.
+    external_id = fields.String(allow_none=True)
+
+    #: The name assigned to the file in Clubhouse upon upload.
+    filename = fields.String()
+
+    #: The unique ID for the file.
+    id = fields.Integer()
+
+    #: The unique IDs of the Members who are mentioned in the file description.
+    mention_ids = fields.List(fields.UUID())
+
+    #: The optional User-specified name of the file.
+    name = fields.String()
+
+    #: The size of the file.
+    size = fields.Integer()
+
+    #: The unique IDs of the Stories associated with this file.
+    story_ids = fields.List(fields.Integer())
+
+    #: The url where the thumbnail of the file can be found in Clubhouse.
+    thumbnail_url = fields.String(allow_none=True)
+
+    #: The time/date that the file was updated.
+    updated_at = fields.DateTime(allow_none=True)
+
+    #: The unique ID of the Member who uploaded the file.
+    uploader_id = fields.UUID()
+
+    #: The URL for the file.
+    url = fields.String(allow_none=True)
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return FileModel(**data)
+
+
+def load_file(data):
+    """ File().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return FileModel(
+        content_type=_string(get('content_type', _missing), 'content_type'),
+        created_at=_datetime(get('created_at', _missing), 'created_at'),
+        description=_string(get('description', _missing), 'description', True),
+        entity_type=_string(get('entity_type', _missing), 'entity_type'),
+        external_id=_string(get('external_id', _missing), 'external_id', True),
+        filename=_string(get('filename', _missing), 'filename'),
+        id=_integer(get('id', _missing), 'id'),
+        mention_ids=_list(_uuid, get('mention_ids', _missing), 'mention_ids'),
+        name=_string(get('name', _missing), 'name'),
+        size=_integer(get('size', _missing), 'size'),
+        story_ids=_list(_integer, get('story_ids', _missing), 'story_ids'),
+        thumbnail_url=_string(get('thumbnail_url', _missing), 'thumbnail_url', True),
+        updated_at=_datetime(get('updated_at', _missing), 'updated_at', True),
+        uploader_id=_uuid(get('uploader_id', _missing), 'uploader_id'),
+        url=_string(get('url', _missing), 'url', True),
+    )
+
@@ -0,0 +1,53 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+
+@attr.s(slots=True)
+class IconModel(object):
+    created_at = attr.ib(default=None)
+    entity_type = attr.ib(default=None)
+    id = attr.ib(default=None)
+    updated_at = attr.ib(default=None)
+    url = attr.ib(default=None)
+
+class Icon(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: The time/date that the Icon was created.
+    created_at = fields.DateTime()
+
+    #: A string description of this resource.
+    entity_type = fields.String()
+
+    #: The unique ID of the Icon.
+    id = fields.UUID()
+
+    #: The time/date that the Icon was updated.
+    updated_at = fields.DateTime()
+
+    #: The URL of the Icon.
+    url = fields.String()
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return IconModel(**data)
+
+
+def load_icon(data):
+    """ Icon().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return IconModel(
+        created_at=_datetime(get('created_at', _missing), 'created_at'),
+        entity_type=_string(get('entity_type', _missing), 'entity_type'),
+        id=_uuid(get('id', _missing), 'id'),
+        updated_at=_datetime(get('updated_at', _missing), 'updated_at'),
+        url=_string(get('url', _missing), 'url'),
+    )
+
@@ -0,0 +1,43 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+
+@attr.s(slots=True)
+class IdentityModel(object):
+    entity_type = attr.ib(default=None)
+    name = attr.ib(default=None)
+    type = attr.ib(default=None)
+
+class Identity(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: A string description of this resource.
+    entity_type = fields.String()
+
+    #: This is your login in GitHub.
+    name = fields.String(allow_none=True)
+
+    #: The type of Identity; currently only type is github.
+    type = fields.String(allow_none=True)
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return IdentityModel(**data)
+
+
+def load_identity(data):
+    """ Identity().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return IdentityModel(
+        entity_type=_string(get('entity_type', _missing), 'entity_type'),
+        name=_string(get('name', _missing), 'name', True),
+        type=_string(get('type', _missing), 'type', True),
+    )
+
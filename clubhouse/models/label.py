@@ -0,0 +1,76 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+from .label_stats import LabelStats, load_label_stats
+
+@attr.s(slots=True)
+class LabelModel(object):
+    archived = attr.ib(default=None)
+    color = attr.ib(default=None)
+    created_at = attr.ib(default=None)
+    entity_type = attr.ib(default=None)
+    external_id = attr.ib(default=None)
+    id = attr.ib(default=None)
+    name = attr.ib(default=None)
+    stats = attr.ib(default=None)
+    updated_at = attr.ib(default=None)
+
+class Label(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: A true/false boolean indicating if the Label has been archived.
+    archived = fields.Boolean()
+
+    #: The hex color to be displayed with the Label (for example, #ff0000).
+    color = fields.String(allow_none=True)
+
+    #: The time/date that the Label was created.
+    created_at = fields.DateTime(allow_none=True)
+
+    #: A string description of this resource.
+    entity_type = fields.String()
+
+    #: This field can be set to another unique ID. In the case that the Label
+    #: has been imported from another tool, the ID in the other tool can be
+    #: indicated here.
+    external_id = fields.String(allow_none=True)
+
+    #: The unique ID of the Label.
+    id = fields.Integer()
+
+    #: The name of the Label.
+    name = fields.String()
+
+    #: A group of calculated values for this Label.
+    stats = fields.Nested(LabelStats, many=False)
+
+    #: The time/date that the Label was updated.
+    updated_at = fields.DateTime(allow_none=True)
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return LabelModel(**data)
+
+
+def load_label(data):
+    """ Label().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return LabelModel(
+        archived=_boolean(get('archived', _missing), 'archived'),
+        color=_string(get('color', _missing), 'color', True),
+        created_at=_datetime(get('created_at', _missing), 'created_at', True),
+        entity_type=_string(get('entity_type', _missing), 'entity_type'),
+        external_id=_string(get('external_id', _missing), 'external_id', True),
+        id=_integer(get('id', _missing), 'id'),
+        name=_string(get('name', _missing), 'name'),
+        stats=_nested(load_label_stats, get('stats', _missing), 'stats', False, False),
+        updated_at=_datetime(get('updated_at', _missing), 'updated_at', True),
+    )
+
@@ -0,0 +1,68 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+
+@attr.s(slots=True)
+class LabelStatsModel(object):
+    num_epics = attr.ib(default=None)
+    num_points_completed = attr.ib(default=None)
+    num_points_in_progress = attr.ib(default=None)
+    num_points_total = attr.ib(default=None)
+    num_stories_completed = attr.ib(default=None)
+    num_stories_in_progress = attr.ib(default=None)
+    num_stories_total = attr.ib(default=None)
+    num_stories_unestimated = attr.ib(default=None)
+
+class LabelStats(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: The total number of Epics with this Label.
+    num_epics = fields.Integer()
+
+    #: The total number of completed points with this Label.
+    num_points_completed = fields.Integer()
+
+    #: The total number of in-progress points with this Label.
+    num_points_in_progress = fields.Integer()
+
+    #: The total number of points with this Label.
+    num_points_total = fields.Integer()
+
+    #: The total number of completed Stories with this Label.
+    num_stories_completed = fields.Integer()
+
+    #: The total number of in-progress Stories with this Label.
+    num_stories_in_progress = fields.Integer()
+
+    #: The total number of Stories with this Label.
+    num_stories_total = fields.Integer()
+
+    #: The total number of Stories with no point estimate with this Label.
+    num_stories_unestimated = fields.Integer()
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return LabelStatsModel(**data)
+
+
+def load_label_stats(data):
+    """ LabelStats().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return LabelStatsModel(
+        num_epics=_integer(get('num_epics', _missing), 'num_epics'),
+        num_points_completed=_integer(get('num_points_completed', _missing), 'num_points_completed'),
+        num_points_in_progress=_integer(get('num_points_in_progress', _missing), 'num_points_in_progress'),
+        num_points_total=_integer(get('num_points_total', _missing), 'num_points_total'),
+        num_stories_completed=_integer(get('num_stories_completed', _missing), 'num_stories_completed'),
+        num_stories_in_progress=_integer(get('num_stories_in_progress', _missing), 'num_stories_in_progress'),
+        num_stories_total=_integer(get('num_stories_total', _missing), 'num_stories_total'),
+        num_stories_unestimated=_integer(get('num_stories_unestimated', _missing), 'num_stories_unestimated'),
+    )
+
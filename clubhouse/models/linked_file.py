@@ -0,0 +1,98 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+
+@attr.s(slots=True)
+class LinkedFileModel(object):
+    content_type = attr.ib(default=None)
+    created_at = attr.ib(default=None)
+    description = attr.ib(default=None)
+    entity_type = attr.ib(default=None)
+    id = attr.ib(default=None)
+    mention_ids = attr.ib(default=None)
+    name = attr.ib(default=None)
+    size = attr.ib(default=None)
+    story_ids = attr.ib(default=None)
+    thumbnail_url = attr.ib(default=None)
+    type = attr.ib(default=None)
+    updated_at = attr.ib(default=None)
+    uploader_id = attr.ib(default=None)
+    url = attr.ib(default=None)
+
+class LinkedFile(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: The content type of the image (e.g. txt/plain).
+    content_type = fields.String(allow_none=True)
+
+    #: The time/date the LinkedFile was created.
+    created_at = fields.DateTime()
+
+    #: The description of the file.
+    description = fields.String(allow_none=True)
+
+    #: A string description of this resource.
+    entity_type = fields.String()
+
+    #: The unique identified of the file.
+    id = fields.Integer()
+
+    #: The members that are mentioned in the description of the file.
+    mention_ids = fields.List(fields.UUID())
+
+    #: The name of the linked file.
+    name = fields.String()
+
+    #: The filesize, if the integration provided it.
+    size = fields.Integer(allow_none=True)
+
+    #: The IDs of the stories this file is attached to.
+    story_ids = fields.List(fields.Integer())
+
+    #: The URL of the file thumbnail, if the integration provided it.
+    thumbnail_url = fields.String(allow_none=True)
+
+    #: The integration type (e.g. google, dropbox, box).
+    type = fields.String()
+
+    #: The time/date the LinkedFile was updated.
+    updated_at = fields.DateTime()
+
+    #: The UUID of the member that uploaded the file.
+    uploader_id = fields.UUID()
+
+    #: The URL of the file.
+    url = fields.String()
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return LinkedFileModel(**data)
+
+
+def load_linked_file(data):
+    """ LinkedFile().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return LinkedFileModel(
+        content_type=_string(get('content_type', _missing), 'content_type', True),
+        created_at=_datetime(get('created_at', _missing), 'created_at'),
+        description=_string(get('description', _missing), 'description', True),
+        entity_type=_string(get('entity_type', _missing), 'entity_type'),
+        id=_integer(get('id', _missing), 'id'),
+        mention_ids=_list(_uuid, get('mention_ids', _missing), 'mention_ids'),
+        name=_string(get('name', _missing), 'name'),
+        size=_integer(get('size', _missing), 'size', True),
+        story_ids=_list(_integer, get('story_ids', _missing), 'story_ids'),
+        thumbnail_url=_string(get('thumbnail_url', _missing), 'thumbnail_url', True),
+        type=_string(get('type', _missing), 'type'),
+        updated_at=_datetime(get('updated_at', _missing), 'updated_at'),
+        uploader_id=_uuid(get('uploader_id', _missing), 'uploader_id'),
+        url=_string(get('url', _missing), 'url'),
+    )
+
@@ -0,0 +1,65 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+from .profile import Profile, load_profile
+
+@attr.s(slots=True)
+class MemberModel(object):
+    created_at = attr.ib(default=None)
+    disabled = attr.ib(default=None)
+    entity_type = attr.ib(default=None)
+    id = attr.ib(default=None)
+    profile = attr.ib(default=None)
+    role = attr.ib(default=None)
+    updated_at = attr.ib(default=None)
+
+class Member(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: The time/date the Member was created.
+    created_at = fields.DateTime(allow_none=True)
+
+    #: True/false boolean indicating whether the Member has been disabled within
+    #: this Organization.
+    disabled = fields.Boolean()
+
+    #: A string description of this resource.
+    entity_type = fields.String()
+
+    #: The Members ID in Clubhouse.
+    id = fields.UUID()
+
+    #: A group of Member profile details.
+    profile = fields.Nested(Profile, many=False)
+
+    #: The Members role in the Clubhouse organization.
+    role = fields.String()
+
+    #: The time/date the Member was last updated.
+    updated_at = fields.DateTime(allow_none=True)
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return MemberModel(**data)
+
+
+def load_member(data):
+    """ Member().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return MemberModel(
+        created_at=_datetime(get('created_at', _missing), 'created_at', True),
+        disabled=_boolean(get('disabled', _missing), 'disabled'),
+        entity_type=_string(get('entity_type', _missing), 'entity_type'),
+        id=_uuid(get('id', _missing), 'id'),
+        profile=_nested(load_profile, get('profile', _missing), 'profile', False, False),
+        role=_string(get('role', _missing), 'role'),
+        updated_at=_datetime(get('updated_at', _missing), 'updated_at', True),
+    )
+
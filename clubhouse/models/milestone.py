@@ -0,0 +1,105 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+from .category import Category, load_category
+
+@attr.s(slots=True)
+class MilestoneModel(object):
+    categories = attr.ib(default=None)
+    completed = attr.ib(default=None)
+    completed_at = attr.ib(default=None)
+    completed_at_override = attr.ib(default=None)
+    created_at = attr.ib(default=None)
+    description = attr.ib(default=None)
+    entity_type = attr.ib(default=None)
+    id = attr.ib(default=None)
+    name = attr.ib(default=None)
+    position = attr.ib(default=None)
+    started = attr.ib(default=None)
+    started_at = attr.ib(default=None)
+    started_at_override = attr.ib(default=None)
+    state = attr.ib(default=None)
+    updated_at = attr.ib(default=None)
+
+class Milestone(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: An array of Categories attached to the Milestone.
+    categories = fields.Nested(Category, many=True)
+
+    #: A true/false boolean indicating if the Milestone has been completed.
+    completed = fields.Boolean()
+
+    #: The time/date the Milestone was completed.
+    completed_at = fields.DateTime(allow_none=True)
+
+    #: A manual override for the time/date the Milestone was completed.
+    completed_at_override = fields.DateTime(allow_none=True)
+
+    #: The time/date the Milestone was created.
+    created_at = fields.DateTime()
+
+    #: The Milestones description.
+    description = fields.String()
+
+    #: A string description of this resource.
+    entity_type = fields.String()
+
+    #: The unique ID of the Milestone.
+    id = fields.Integer()
+
+    #: The name of the Milestone.
+    name = fields.String()
+
+    #: A number representing the position of the Milestone in relation to every
+    #: other Milestone within the Organization.
+    position = fields.Integer()
+
+    #: A true/false boolean indicating if the Milestone has been started.
+    started = fields.Boolean()
+
+    #: The time/date the Milestone was started.
+    started_at = fields.DateTime(allow_none=True)
+
+    #: A manual override for the time/date the Milestone was started.
+    started_at_override = fields.DateTime(allow_none=True)
+
+    #: The workflow state that the Milestone is in.
+    state = fields.String()
+
+    #: The time/date the Milestone was updated.
+    updated_at = fields.DateTime()
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return MilestoneModel(**data)
+
+
+def load_milestone(data):
+    """ Milestone().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return MilestoneModel(
+        categories=_nested(load_category, get('categories', _missing), 'categories', False, True),
+        completed=_boolean(get('completed', _missing), 'completed'),
+        completed_at=_datetime(get('completed_at', _missing), 'completed_at', True),
+        completed_at_override=_datetime(get('completed_at_override', _missing), 'completed_at_override', True),
+        created_at=_datetime(get('created_at', _missing), 'created_at'),
+        description=_string(get('description', _missing), 'description'),
+        entity_type=_string(get('entity_type', _missing), 'entity_type'),
+        id=_integer(get('id', _missing), 'id'),
+        name=_string(get('name', _missing), 'name'),
+        position=_integer(get('position', _missing), 'position'),
+        started=_boolean(get('started', _missing), 'started'),
+        started_at=_datetime(get('started_at', _missing), 'started_at', True),
+        started_at_override=_datetime(get('started_at_override', _missing), 'started_at_override', True),
+        state=_string(get('state', _missing), 'state'),
+        updated_at=_datetime(get('updated_at', _missing), 'updated_at'),
+    )
+
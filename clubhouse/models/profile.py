@@ -0,0 +1,75 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+from .icon import Icon, load_icon
+
+@attr.s(slots=True)
+class ProfileModel(object):
+    deactivated = attr.ib(default=None)
+    display_icon = attr.ib(default=None)
+    email_address = attr.ib(default=None)
+    entity_type = attr.ib(default=None)
+    gravatar_hash = attr.ib(default=None)
+    id = attr.ib(default=None)
+    mention_name = attr.ib(default=None)
+    name = attr.ib(default=None)
+    two_factor_auth_activated = attr.ib(default=None)
+
+class Profile(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: A true/false boolean indicating whether the Member has been deactivated
+    #: within Clubhouse.
+    deactivated = fields.Boolean()
+
+    #: The Members avatar Icon.
+    display_icon = fields.Nested(Icon, many=False)
+
+    #: The primary email address of the Member with the Organization.
+    email_address = fields.String(allow_none=True)
+
+    #: A string description of this resource.
+    entity_type = fields.String()
+
+    #: This is the gravatar hash associated with email_address.
+    gravatar_hash = fields.String(allow_none=True)
+
+    #: The unique identifier of the profile.
+    id = fields.UUID()
+
+    #: The Members username within the Organization.
+    mention_name = fields.String()
+
+    #: The Members name within the Organization.
+    name = fields.String()
+
+    #: If Two Factor Authentication is activated for this User.
+    two_factor_auth_activated = fields.Boolean()
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return ProfileModel(**data)
+
+
+def load_profile(data):
+    """ Profile().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return ProfileModel(
+        deactivated=_boolean(get('deactivated', _missing), 'deactivated'),
+        display_icon=_nested(load_icon, get('display_icon', _missing), 'display_icon', False, False),
+        email_address=_string(get('email_address', _missing), 'email_address', True),
+        entity_type=_string(get('entity_type', _missing), 'entity_type'),
+        gravatar_hash=_string(get('gravatar_hash', _missing), 'gravatar_hash', True),
+        id=_uuid(get('id', _missing), 'id'),
+        mention_name=_string(get('mention_name', _missing), 'mention_name'),
+        name=_string(get('name', _missing), 'name'),
+        two_factor_auth_activated=_boolean(get('two_factor_auth_activated', _missing), 'two_factor_auth_activated'),
+    )
+
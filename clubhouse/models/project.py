@@ -0,0 +1,118 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+from .project_stats import ProjectStats, load_project_stats
+
+@attr.s(slots=True)
+class ProjectModel(object):
+    abbreviation = attr.ib(default=None)
+    archived = attr.ib(default=None)
+    color = attr.ib(default=None)
+    created_at = attr.ib(default=None)
+    days_to_thermometer = attr.ib(default=None)
+    description = attr.ib(default=None)
+    entity_type = attr.ib(default=None)
+    external_id = attr.ib(default=None)
+    follower_ids = attr.ib(default=None)
+    id = attr.ib(default=None)
+    iteration_length = attr.ib(default=None)
+    name = attr.ib(default=None)
+    show_thermometer = attr.ib(default=None)
+    start_time = attr.ib(default=None)
+    stats = attr.ib(default=None)
+    team_id = attr.ib(default=None)
+    updated_at = attr.ib(default=None)
+
+class Project(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: The Project abbreviation used in Story summaries. Should be kept to 3
+    #: characters at most.
+    abbreviation = fields.String(allow_none=True)
+
+    #: True/false boolean indicating whether the Project is in an Archived
+    #: state.
+    archived = fields.Boolean()
+
+    #: The color associated with the Project in the Clubhouse member interface.
+    color = fields.String(allow_none=True)
+
+    #: The time/date that the Project was created.
+    created_at = fields.DateTime(allow_none=True)
+
+    #: The number of days before the thermometer appears in the Story summary.
+    days_to_thermometer = fields.Integer()
+
+    #: The description of the Project.
+    description = fields.String(allow_none=True)
+
+    #: A string description of this resource.
+    entity_type = fields.String()
+
+    #: This field can be set to another unique ID. In the case that the Project
+    #: has been imported from another tool, the ID in the other tool can be
+    #: indicated here.
+    external_id = fields.String(allow_none=True)
+
+    #: An array of UUIDs for any Members listed as Followers.
+    follower_ids = fields.List(fields.UUID())
+
+    #: The unique ID of the Project.
+    id = fields.Integer()
+
+    #: The number of weeks per iteration in this Project.
+    iteration_length = fields.Integer()
+
+    #: The name of the Project
+    name = fields.String()
+
+    #: Configuration to enable or disable thermometers in the Story summary.
+    show_thermometer = fields.Boolean()
+
+    #: The date at which the Project was started.
+    start_time = fields.DateTime()
+
+    #: A group of calculated values for this Project.
+    stats = fields.Nested(ProjectStats, many=False)
+
+    #: The ID of the team the project belongs to.
+    team_id = fields.Integer()
+
+    #: The time/date that the Project was last updated.
+    updated_at = fields.DateTime(allow_none=True)
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return ProjectModel(**data)
+
+
+def load_project(data):
+    """ Project().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return ProjectModel(
+        abbreviation=_string(get('abbreviation', _missing), 'abbreviation', True),
+        archived=_boolean(get('archived', _missing), 'archived'),
+        color=_string(get('color', _missing), 'color', True),
+        created_at=_datetime(get('created_at', _missing), 'created_at', True),
+        days_to_thermometer=_integer(get('days_to_thermometer', _missing), 'days_to_thermometer'),
+        description=_string(get('description', _missing), 'description', True),
+        entity_type=_string(get('entity_type', _missing), 'entity_type'),
+        external_id=_string(get('external_id', _missing), 'external_id', True),
+        follower_ids=_list(_uuid, get('follower_ids', _missing), 'follower_ids'),
+        id=_integer(get('id', _missing), 'id'),
+        iteration_length=_integer(get('iteration_length', _missing), 'iteration_length'),
+        name=_string(get('name', _missing), 'name'),
+        show_thermometer=_boolean(get('show_thermometer', _missing), 'show_thermometer'),
+        start_time=_datetime(get('start_time', _missing), 'start_time'),
+        stats=_nested(load_project_stats, get('stats', _missing), 'stats', False, False),
+        team_id=_integer(get('team_id', _missing), 'team_id'),
+        updated_at=_datetime(get('updated_at', _missing), 'updated_at', True),
+    )
+
@@ -0,0 +1,38 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+
+@attr.s(slots=True)
+class ProjectStatsModel(object):
+    num_points = attr.ib(default=None)
+    num_stories = attr.ib(default=None)
+
+class ProjectStats(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: The total number of points in this Project.
+    num_points = fields.Integer()
+
+    #: The total number of stories in this Project.
+    num_stories = fields.Integer()
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return ProjectStatsModel(**data)
+
+
+def load_project_stats(data):
+    """ ProjectStats().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return ProjectStatsModel(
+        num_points=_integer(get('num_points', _missing), 'num_points'),
+        num_stories=_integer(get('num_stories', _missing), 'num_stories'),
+    )
+
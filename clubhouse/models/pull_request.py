@@ -0,0 +1,99 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+
+@attr.s(slots=True)
+class PullRequestModel(object):
+    branch_id = attr.ib(default=None)
+    closed = attr.ib(default=None)
+    created_at = attr.ib(default=None)
+    entity_type = attr.ib(default=None)
+    id = attr.ib(default=None)
+    num_added = attr.ib(default=None)
+    num_commits = attr.ib(default=None)
+    num_modified = attr.ib(default=None)
+    num_removed = attr.ib(default=None)
+    number = attr.ib(default=None)
+    target_branch_id = attr.ib(default=None)
+    title = attr.ib(default=None)
+    updated_at = attr.ib(default=None)
+    url = attr.ib(default=None)
+
+class PullRequest(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: The ID of the branch for the particular pull request.
+    branch_id = fields.Integer()
+
+    #: True/False boolean indicating whether the GitHub pull request has been
+    #: closed.
+    closed = fields.Boolean()
+
+    #: The time/date the pull request was created.
+    created_at = fields.DateTime()
+
+    #: A string description of this resource.
+    entity_type = fields.String()
+
+    #: The unique ID associated with the pull request in Clubhouse.
+    id = fields.Integer()
+
+    #: Number of lines added in the pull request, according to GitHub.
+    num_added = fields.Integer()
+
+    #: The number of commits on the pull request.
+    num_commits = fields.Integer()
+
+    #: Number of lines modified in the pull request, according to GitHub.
+    num_modified = fields.Integer()
+
+    #: Number of lines removed in the pull request, according to GitHub.
+    num_removed = fields.Integer()
+
+    #: The pull requests unique number ID in GitHub.
+    number = fields.Integer()
+
+    #: The ID of the target branch for the particular pull request.
+    target_branch_id = fields.Integer()
+
+    #: The title of the pull request.
+    title = fields.String()
+
+    #: The time/date the pull request was created.
+    updated_at = fields.DateTime()
+
+    #: The URL for the pull request.
+    url = fields.String()
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return PullRequestModel(**data)
+
+
+def load_pull_request(data):
+    """ PullRequest().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return PullRequestModel(
+        branch_id=_integer(get('branch_id', _missing), 'branch_id'),
+        closed=_boolean(get('closed', _missing), 'closed'),
+        created_at=_datetime(get('created_at', _missing), 'created_at'),
+        entity_type=_string(get('entity_type', _missing), 'entity_type'),
+        id=_integer(get('id', _missing), 'id'),
+        num_added=_integer(get('num_added', _missing), 'num_added'),
+        num_commits=_integer(get('num_commits', _missing), 'num_commits'),
+        num_modified=_integer(get('num_modified', _missing), 'num_modified'),
+        num_removed=_integer(get('num_removed', _missing), 'num_removed'),
+        number=_integer(get('number', _missing), 'number'),
+        target_branch_id=_integer(get('target_branch_id', _missing), 'target_branch_id'),
+        title=_string(get('title', _missing), 'title'),
+        updated_at=_datetime(get('updated_at', _missing), 'updated_at'),
+        url=_string(get('url', _missing), 'url'),
+    )
+
@@ -0,0 +1,73 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+
+@attr.s(slots=True)
+class RepositoryModel(object):
+    created_at = attr.ib(default=None)
+    entity_type = attr.ib(default=None)
+    external_id = attr.ib(default=None)
+    full_name = attr.ib(default=None)
+    id = attr.ib(default=None)
+    name = attr.ib(default=None)
+    type = attr.ib(default=None)
+    updated_at = attr.ib(default=None)
+    url = attr.ib(default=None)
+
+class Repository(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: The time/date the Repository was created.
+    created_at = fields.DateTime(allow_none=True)
+
+    #: A string description of this resource.
+    entity_type = fields.String()
+
+    #: The GitHub unique identifier for the Repository.
+    external_id = fields.String(allow_none=True)
+
+    #: The full name of the GitHub repository.
+    full_name = fields.String(allow_none=True)
+
+    #: The ID associated to the GitHub repository in Clubhouse.
+    id = fields.Integer(allow_none=True)
+
+    #: The shorthand name of the GitHub repository.
+    name = fields.String(allow_none=True)
+
+    #: The type of Repository. Currently this can only be github.
+    type = fields.String()
+
+    #: The time/date the Repository was updated.
+    updated_at = fields.DateTime(allow_none=True)
+
+    #: The URL of the Repository.
+    url = fields.String(allow_none=True)
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return RepositoryModel(**data)
+
+
+def load_repository(data):
+    """ Repository().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return RepositoryModel(
+        created_at=_datetime(get('created_at', _missing), 'created_at', True),
+        entity_type=_string(get('entity_type', _missing), 'entity_type'),
+        external_id=_string(get('external_id', _missing), 'external_id', True),
+        full_name=_string(get('full_name', _missing), 'full_name', True),
+        id=_integer(get('id', _missing), 'id', True),
+        name=_string(get('name', _missing), 'name', True),
+        type=_string(get('type', _missing), 'type'),
+        updated_at=_datetime(get('updated_at', _missing), 'updated_at', True),
+        url=_string(get('url', _missing), 'url', True),
+    )
+
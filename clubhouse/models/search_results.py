@@ -0,0 +1,44 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+from .story_search import StorySearch, load_story_search
+
+@attr.s(slots=True)
+class SearchResultsModel(object):
+    data = attr.ib(default=None)
+    next = attr.ib(default=None)
+    total = attr.ib(default=None)
+
+class SearchResults(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: A list of search results.
+    data = fields.Nested(StorySearch, many=True)
+
+    #: The next page token.
+    next = fields.String()
+
+    #: The total number of matches for the search query.
+    total = fields.Integer()
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return SearchResultsModel(**data)
+
+
+def load_search_results(data):
+    """ SearchResults().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return SearchResultsModel(
+        data=_nested(load_story_search, get('data', _missing), 'data', False, True),
+        next=_string(get('next', _missing), 'next'),
+        total=_integer(get('total', _missing), 'total'),
+    )
+
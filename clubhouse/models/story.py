@@ -0,0 +1,221 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+from .branch import Branch, load_branch
+from .comment import Comment, load_comment
+from .commit import Commit, load_commit
+from .file import File, load_file
+from .label import Label, load_label
+from .linked_file import LinkedFile, load_linked_file
+from .task import Task, load_task
+from .typed_story_link import TypedStoryLink, load_typed_story_link
+
+@attr.s(slots=True)
+class StoryModel(object):
+    app_url = attr.ib(default=None)
+    archived = attr.ib(default=None)
+    blocked = attr.ib(default=None)
+    blocker = attr.ib(default=None)
+    branches = attr.ib(default=None)
+    comments = attr.ib(default=None)
+    commits = attr.ib(default=None)
+    completed = attr.ib(default=None)
+    completed_at = attr.ib(default=None)
+    completed_at_override = attr.ib(default=None)
+    created_at = attr.ib(default=None)
+    deadline = attr.ib(default=None)
+    description = attr.ib(default=None)
+    entity_type = attr.ib(default=None)
+    epic_id = attr.ib(default=None)
+    estimate = attr.ib(default=None)
+    external_id = attr.ib(default=None)
+    files = attr.ib(default=None)
+    follower_ids = attr.ib(default=None)
+    id = attr.ib(default=None)
+    labels = attr.ib(default=None)
+    linked_files = attr.ib(default=None)
+    moved_at = attr.ib(default=None)
+    name = attr.ib(default=None)
+    owner_ids = attr.ib(default=None)
+    position = attr.ib(default=None)
+    project_id = attr.ib(default=None)
+    requested_by_id = attr.ib(default=None)
+    started = attr.ib(default=None)
+    started_at = attr.ib(default=None)
+    started_at_override = attr.ib(default=None)
+    story_links = attr.ib(default=None)
+    story_type = attr.ib(default=None)
+    tasks = attr.ib(default=None)
+    updated_at = attr.ib(default=None)
+    workflow_state_id = attr.ib(default=None)
+
+class Story(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: The clubhouse application url for the story.
+    app_url = fields.String()
+
+    #: True if the story has been archived or not.
+    archived = fields.Boolean()
+
+    #: A true/false boolean indicating if the Story is currently blocked.
+    blocked = fields.Boolean()
+
+    #: A true/false boolean indicating if the Story is currently a blocker of
+    #: another story.
+    blocker = fields.Boolean()
+
+    #: An array of Git branches attached to the story.
+    branches = fields.Nested(Branch, many=True)
+
+    #: An array of comments attached to the story.
+    comments = fields.Nested(Comment, many=True)
+
+    #: An array of commits attached to the story.
+    commits = fields.Nested(Commit, many=True)
+
+    #: A true/false boolean indicating if the Story has been completed.
+    completed = fields.Boolean()
+
+    #: The time/date the Story was completed.
+    completed_at = fields.DateTime(allow_none=True)
+
+    #: A manual override for the time/date the Story was completed.
+    completed_at_override = fields.DateTime(allow_none=True)
+
+    #: The time/date the Story was created.
+    created_at = fields.DateTime()
+
+    #: The due date of the story.
+    deadline = fields.DateTime(allow_none=True)
+
+    #: The description of the story.
+    description = fields.String()
+
+    #: A string description of this resource.
+    entity_type = fields.String()
+
+    #: The ID of the epic the story belongs to.
+    epic_id = fields.Integer(allow_none=True)
+
+    #: The numeric point estimate of the story. Can also be null, which means
+    #: unestimated.
+    estimate = fields.Integer(allow_none=True)
+
+    #: This field can be set to another unique ID. In the case that the Story
+    #: has been imported from another tool, the ID in the other tool can be
+    #: indicated here.
+    external_id = fields.String(allow_none=True)
+
+    #: An array of files attached to the story.
+    files = fields.Nested(File, many=True)
+
+    #: An array of UUIDs of the followers of this story.
+    follower_ids = fields.List(fields.UUID())
+
+    #: The unique identifier of the story.
+    id = fields.Integer()
+
+    #: An array of labels attached to the story.
+    labels = fields.Nested(Label, many=True)
+
+    #: An array of linked files attached to the story.
+    linked_files = fields.Nested(LinkedFile, many=True)
+
+    #: The time/date the Story was last changed workflow-state.
+    moved_at = fields.DateTime(allow_none=True)
+
+    #: The name of the story.
+    name = fields.String()
+
+    #: An array of UUIDs of the owners of this story.
+    owner_ids = fields.List(fields.UUID())
+
+    #: A number representing the position of the story in relation to every
+    #: other story in the current project.
+    position = fields.Integer()
+
+    #: The ID of the project the story belongs to.
+    project_id = fields.Integer()
+
+    #: The ID of the Member that requested the story.
+    requested_by_id = fields.UUID()
+
+    #: A true/false boolean indicating if the Story has been started.
+    started = fields.Boolean()
+
+    #: The time/date the Story was started.
+    started_at = fields.DateTime(allow_none=True)
+
+    #: A manual override for the time/date the Story was started.
+    started_at_override = fields.DateTime(allow_none=True)
+
+    #: An array of story links attached to the story.
+    story_links = fields.Nested(TypedStoryLink, many=True)
+
+    #: The type of story (feature, bug, chore).
+    story_type = fields.String()
+
+    #: An array of tasks connected to the story.
+    tasks = fields.Nested(Task, many=True)
+
+    #: The time/date the Story was updated.
+    updated_at = fields.DateTime(allow_none=True)
+
+    #: The ID of the workflow state the story is currently in.
+    workflow_state_id = fields.Integer()
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return StoryModel(**data)
+
+
+def load_story(data):
+    """ Story().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return StoryModel(
+        app_url=_string(get('app_url', _missing), 'app_url'),
+        archived=_boolean(get('archived', _missing), 'archived'),
+        blocked=_boolean(get('blocked', _missing), 'blocked'),
+        blocker=_boolean(get('blocker', _missing), 'blocker'),
+        branches=_nested(load_branch, get('branches', _missing), 'branches', False, True),
+        comments=_nested(load_comment, get('comments', _missing), 'comments', False, True),
+        commits=_nested(load_commit, get('commits', _missing), 'commits', False, True),
+        completed=_boolean(get('completed', _missing), 'completed'),
+        completed_at=_datetime(get('completed_at', _missing), 'completed_at', True),
+        completed_at_override=_datetime(get('completed_at_override', _missing), 'completed_at_override', True),
+        created_at=_datetime(get('created_at', _missing), 'created_at'),
+        deadline=_datetime(get('deadline', _missing), 'deadline', True),
+        description=_string(get('description', _missing), 'description'),
+        entity_type=_string(get('entity_type', _missing), 'entity_type'),
+        epic_id=_integer(get('epic_id', _missing), 'epic_id', True),
+        estimate=_integer(get('estimate', _missing), 'estimate', True),
+        external_id=_string(get('external_id', _missing), 'external_id', True),
+        files=_nested(load_file, get('files', _missing), 'files', False, True),
+        follower_ids=_list(_uuid, get('follower_ids', _missing), 'follower_ids'),
+        id=_integer(get('id', _missing), 'id'),
+        labels=_nested(load_label, get('labels', _missing), 'labels', False, True),
+        linked_files=_nested(load_linked_file, get('linked_files', _missing), 'linked_files', False, True),
+        moved_at=_datetime(get('moved_at', _missing), 'moved_at', True),
+        name=_string(get('name', _missing), 'name'),
+        owner_ids=_list(_uuid, get('owner_ids', _missing), 'owner_ids'),
+        position=_integer(get('position', _missing), 'position'),
+        project_id=_integer(get('project_id', _missing), 'project_id'),
+        requested_by_id=_uuid(get('requested_by_id', _missing), 'requested_by_id'),
+        started=_boolean(get('started', _missing), 'started'),
+        started_at=_datetime(get('started_at', _missing), 'started_at', True),
+        started_at_override=_datetime(get('started_at_override', _missing), 'started_at_override', True),
+        story_links=_nested(load_typed_story_link, get('story_links', _missing), 'story_links', False, True),
+        story_type=_string(get('story_type', _missing), 'story_type'),
+        tasks=_nested(load_task, get('tasks', _missing), 'tasks', False, True),
+        updated_at=_datetime(get('updated_at', _missing), 'updated_at', True),
+        workflow_state_id=_integer(get('workflow_state_id', _missing), 'workflow_state_id'),
+    )
+
@@ -0,0 +1,91 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+
+@attr.s(slots=True)
+class TaskModel(object):
+    complete = attr.ib(default=None)
+    completed_at = attr.ib(default=None)
+    created_at = attr.ib(default=None)
+    description = attr.ib(default=None)
+    entity_type = attr.ib(default=None)
+    external_id = attr.ib(default=None)
+    id = attr.ib(default=None)
+    mention_ids = attr.ib(default=None)
+    owner_ids = attr.ib(default=None)
+    position = attr.ib(default=None)
+    story_id = attr.ib(default=None)
+    updated_at = attr.ib(default=None)
+
+class Task(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: True/false boolean indicating whether the Task has been completed.
+    complete = fields.Boolean()
+
+    #: The time/date the Task was completed.
+    completed_at = fields.DateTime(allow_none=True)
+
+    #: The time/date the Task was created.
+    created_at = fields.DateTime()
+
+    #: Full text of the Task.
+    description = fields.String()
+
+    #: A string description of this resource.
+    entity_type = fields.String()
+
+    #: This field can be set to another unique ID. In the case that the Task has
+    #: been imported from another tool, the ID in the other tool can be
+    #: indicated here.
+    external_id = fields.String(allow_none=True)
+
+    #: The unique ID of the Task.
+    id = fields.Integer()
+
+    #: An array of UUIDs of Members mentioned in this Task.
+    mention_ids = fields.List(fields.UUID())
+
+    #: An array of UUIDs of the Owners of this Task.
+    owner_ids = fields.List(fields.UUID())
+
+    #: The number corresponding to the Tasks position within a list of Tasks on
+    #: a Story.
+    position = fields.Integer()
+
+    #: The unique identifier of the parent Story.
+    story_id = fields.Integer()
+
+    #: The time/date the Task was updated.
+    updated_at = fields.DateTime(allow_none=True)
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return TaskModel(**data)
+
+
+def load_task(data):
+    """ Task().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return TaskModel(
+        complete=_boolean(get('complete', _missing), 'complete'),
+        completed_at=_datetime(get('completed_at', _missing), 'completed_at', True),
+        created_at=_datetime(get('created_at', _missing), 'created_at'),
+        description=_string(get('description', _missing), 'description'),
+        entity_type=_string(get('entity_type', _missing), 'entity_type'),
+        external_id=_string(get('external_id', _missing), 'external_id', True),
+        id=_integer(get('id', _missing), 'id'),
+        mention_ids=_list(_uuid, get('mention_ids', _missing), 'mention_ids'),
+        owner_ids=_list(_uuid, get('owner_ids', _missing), 'owner_ids'),
+        position=_integer(get('position', _missing), 'position'),
+        story_id=_integer(get('story_id', _missing), 'story_id'),
+        updated_at=_datetime(get('updated_at', _missing), 'updated_at', True),
+    )
+
@@ -0,0 +1,75 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+from .workflow import Workflow, load_workflow
+
+@attr.s(slots=True)
+class TeamModel(object):
+    created_at = attr.ib(default=None)
+    description = attr.ib(default=None)
+    entity_type = attr.ib(default=None)
+    id = attr.ib(default=None)
+    name = attr.ib(default=None)
+    position = attr.ib(default=None)
+    project_ids = attr.ib(default=None)
+    updated_at = attr.ib(default=None)
+    workflow = attr.ib(default=None)
+
+class Team(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: The time/date the Team was created.
+    created_at = fields.DateTime()
+
+    #: The description of the Team.
+    description = fields.String()
+
+    #: A string description of this resource.
+    entity_type = fields.String()
+
+    #: The unique identifier of the Team.
+    id = fields.Integer()
+
+    #: The name of the Team.
+    name = fields.String()
+
+    #: A number representing the position of the Team in relation to every other
+    #: Team within the Organization.
+    position = fields.Integer()
+
+    #: An array of IDs of projects within the Team.
+    project_ids = fields.List(fields.Integer())
+
+    #: The time/date the Team was last updated.
+    updated_at = fields.DateTime()
+
+    #: Details of the workflow associated with the Team.
+    workflow = fields.Nested(Workflow, many=False)
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return TeamModel(**data)
+
+
+def load_team(data):
+    """ Team().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return TeamModel(
+        created_at=_datetime(get('created_at', _missing), 'created_at'),
+        description=_string(get('description', _missing), 'description'),
+        entity_type=_string(get('entity_type', _missing), 'entity_type'),
+        id=_integer(get('id', _missing), 'id'),
+        name=_string(get('name', _missing), 'name'),
+        position=_integer(get('position', _missing), 'position'),
+        project_ids=_list(_integer, get('project_ids', _missing), 'project_ids'),
+        updated_at=_datetime(get('updated_at', _missing), 'updated_at'),
+        workflow=_nested(load_workflow, get('workflow', _missing), 'workflow', False, False),
+    )
+
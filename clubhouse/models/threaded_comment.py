@@ -0,0 +1,80 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+
+@attr.s(slots=True)
+class ThreadedCommentModel(object):
+    author_id = attr.ib(default=None)
+    comments = attr.ib(default=None)
+    created_at = attr.ib(default=None)
+    deleted = attr.ib(default=None)
+    entity_type = attr.ib(default=None)
+    external_id = attr.ib(default=None)
+    id = attr.ib(default=None)
+    mention_ids = attr.ib(default=None)
+    text = attr.ib(default=None)
+    updated_at = attr.ib(default=None)
+
+class ThreadedComment(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: The unique ID of the Member that authored the Comment.
+    author_id = fields.UUID()
+
+    #: A nested array of threaded comments.
+    comments = fields.Nested("self", many=True)
+
+    #: The time/date the Comment was created.
+    created_at = fields.DateTime()
+
+    #: True/false boolean indicating whether the Comment is deleted.
+    deleted = fields.Boolean()
+
+    #: A string description of this resource.
+    entity_type = fields.String()
+
+    #: This field can be set to another unique ID. In the case that the Comment
+    #: has been imported from another tool, the ID in the other tool can be
+    #: indicated here.
+    external_id = fields.String(allow_none=True)
+
+    #: The unique ID of the Comment.
+    id = fields.Integer()
+
+    #: An array of Member IDs that have been mentioned in this Comment
+    mention_ids = fields.List(fields.UUID())
+
+    #: The text of the Comment.
+    text = fields.String()
+
+    #: The time/date the Comment was updated.
+    updated_at = fields.DateTime()
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return ThreadedCommentModel(**data)
+
+
+def load_threaded_comment(data):
+    """ ThreadedComment().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return ThreadedCommentModel(
+        author_id=_uuid(get('author_id', _missing), 'author_id'),
+        comments=_nested(load_threaded_comment, get('comments', _missing), 'comments', False, True),
+        created_at=_datetime(get('created_at', _missing), 'created_at'),
+        deleted=_boolean(get('deleted', _missing), 'deleted'),
+        entity_type=_string(get('entity_type', _missing), 'entity_type'),
+        external_id=_string(get('external_id', _missing), 'external_id', True),
+        id=_integer(get('id', _missing), 'id'),
+        mention_ids=_list(_uuid, get('mention_ids', _missing), 'mention_ids'),
+        text=_string(get('text', _missing), 'text'),
+        updated_at=_datetime(get('updated_at', _missing), 'updated_at'),
+    )
+
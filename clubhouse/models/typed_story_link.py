@@ -0,0 +1,70 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+
+@attr.s(slots=True)
+class TypedStoryLinkModel(object):
+    created_at = attr.ib(default=None)
+    entity_type = attr.ib(default=None)
+    id = attr.ib(default=None)
+    object_id = attr.ib(default=None)
+    subject_id = attr.ib(default=None)
+    type = attr.ib(default=None)
+    updated_at = attr.ib(default=None)
+    verb = attr.ib(default=None)
+
+class TypedStoryLink(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: The time/date when the Story link was created.
+    created_at = fields.DateTime()
+
+    #: A string description of this resource.
+    entity_type = fields.String()
+
+    #: The unique identifier of the Story Link.
+    id = fields.Integer()
+
+    #: The ID of the object Story.
+    object_id = fields.Integer()
+
+    #: The ID of the subject Story.
+    subject_id = fields.Integer()
+
+    #: This indicates whether the Story is the subject or object in the Story
+    #: Link.
+    type = fields.String()
+
+    #: The time/date when the Story link was updated.
+    updated_at = fields.DateTime()
+
+    #: How the subject Story acts on the object Story.  This can be blocks,
+    #: duplicates, or relates to.
+    verb = fields.String()
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return TypedStoryLinkModel(**data)
+
+
+def load_typed_story_link(data):
+    """ TypedStoryLink().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return TypedStoryLinkModel(
+        created_at=_datetime(get('created_at', _missing), 'created_at'),
+        entity_type=_string(get('entity_type', _missing), 'entity_type'),
+        id=_integer(get('id', _missing), 'id'),
+        object_id=_integer(get('object_id', _missing), 'object_id'),
+        subject_id=_integer(get('subject_id', _missing), 'subject_id'),
+        type=_string(get('type', _missing), 'type'),
+        updated_at=_datetime(get('updated_at', _missing), 'updated_at'),
+        verb=_string(get('verb', _missing), 'verb'),
+    )
+
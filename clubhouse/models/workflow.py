@@ -0,0 +1,74 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+from .workflow_state import WorkflowState, load_workflow_state
+
+@attr.s(slots=True)
+class WorkflowModel(object):
+    created_at = attr.ib(default=None)
+    default_state_id = attr.ib(default=None)
+    description = attr.ib(default=None)
+    entity_type = attr.ib(default=None)
+    id = attr.ib(default=None)
+    name = attr.ib(default=None)
+    states = attr.ib(default=None)
+    team_id = attr.ib(default=None)
+    updated_at = attr.ib(default=None)
+
+class Workflow(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: The date the Workflow was created.
+    created_at = fields.DateTime()
+
+    #: The unique ID of the default state that new Stories are entered into.
+    default_state_id = fields.Integer()
+
+    #: A description of the workflow.
+    description = fields.String()
+
+    #: A string description of this resource.
+    entity_type = fields.String()
+
+    #: The unique ID of the Workflow.
+    id = fields.Integer()
+
+    #: The name of the workflow.
+    name = fields.String()
+
+    #: A map of the states in this Workflow.
+    states = fields.Nested(WorkflowState, many=True)
+
+    #: The ID of the team the workflow belongs to.
+    team_id = fields.Integer()
+
+    #: The date the Workflow was updated.
+    updated_at = fields.DateTime()
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return WorkflowModel(**data)
+
+
+def load_workflow(data):
+    """ Workflow().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return WorkflowModel(
+        created_at=_datetime(get('created_at', _missing), 'created_at'),
+        default_state_id=_integer(get('default_state_id', _missing), 'default_state_id'),
+        description=_string(get('description', _missing), 'description'),
+        entity_type=_string(get('entity_type', _missing), 'entity_type'),
+        id=_integer(get('id', _missing), 'id'),
+        name=_string(get('name', _missing), 'name'),
+        states=_nested(load_workflow_state, get('states', _missing), 'states', False, True),
+        team_id=_integer(get('team_id', _missing), 'team_id'),
+        updated_at=_datetime(get('updated_at', _missing), 'updated_at'),
+    )
+
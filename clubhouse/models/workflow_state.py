@@ -0,0 +1,84 @@
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+
+@attr.s(slots=True)
+class WorkflowStateModel(object):
+    color = attr.ib(default=None)
+    created_at = attr.ib(default=None)
+    description = attr.ib(default=None)
+    entity_type = attr.ib(default=None)
+    id = attr.ib(default=None)
+    name = attr.ib(default=None)
+    num_stories = attr.ib(default=None)
+    position = attr.ib(default=None)
+    type = attr.ib(default=None)
+    updated_at = attr.ib(default=None)
+    verb = attr.ib(default=None)
+
+class WorkflowState(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
+    #: The hex color for this Workflow State.
+    color = fields.String()
+
+    #: The time/date the Workflow State was created.
+    created_at = fields.DateTime()
+
+    #: The description of what sort of Stories belong in that Workflow state.
+    description = fields.String()
+
+    #: A string description of this resource.
+    entity_type = fields.String()
+
+    #: The unique ID of the Workflow State.
+    id = fields.Integer()
+
+    #: The Workflow States name.
+    name = fields.String()
+
+    #: The number of Stories currently in that Workflow State.
+    num_stories = fields.Integer()
+
+    #: The position that the Workflow State is in, starting with 0 at the left.
+    position = fields.Integer()
+
+    #: The type of Workflow State (Unstarted, Started, or Finished)
+    type = fields.String()
+
+    #: When the Workflow State was last updated.
+    updated_at = fields.DateTime()
+
+    #: The verb that triggers a move to that Workflow State when making GitHub
+    #: commits.
+    verb = fields.String(allow_none=True)
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        return WorkflowStateModel(**data)
+
+
+def load_workflow_state(data):
+    """ WorkflowState().load(data), without marshmallow's per-field dispatch. """
+    _check_mapping(data)
+    get = data.get
+    return WorkflowStateModel(
+        color=_string(get('color', _missing), 'color'),
+        created_at=_datetime(get('created_at', _missing), 'created_at'),
+        description=_string(get('description', _missing), 'description'),
+        entity_type=_string(get('entity_type', _missing), 'entity_type'),
+        id=_integer(get('id', _missing), 'id'),
+        name=_string(get('name', _missing), 'name'),
+        num_stories=_integer(get('num_stories', _missing), 'num_stories'),
+        position=_integer(get('position', _missing), 'position'),
+        type=_string(get('type', _missing), 'type'),
+        updated_at=_datetime(get('updated_at', _missing), 'updated_at'),
+        verb=_string(get('verb', _missing), 'verb', True),
+    )
+
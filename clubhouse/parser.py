@@ -4,22 +4,36 @@ of their resources that can be used as basis of a client library.
 
 """
 import argparse
+import functools
+import hashlib
+import itertools
+import json
 import logging
+import os
 import sys
 import re
-from typing import Dict
+from typing import Dict, List
 from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
 
-from lxml import html
+from lxml import etree, html
 from unidecode import unidecode
 from jinja2 import BaseLoader, Environment
 
-import dag
+try:
+    from . import dag
+except ImportError:  # run as a script
+    import dag
 
 
 _jinja_env = Environment(loader=BaseLoader(), trim_blocks=True, lstrip_blocks=True)
 logger = logging.getLogger(__name__)
 
+#: compiled once, evaluated for every resource table
+_table_headers = etree.XPath('thead/tr/th/text()')
+_table_rows = etree.XPath('./tbody/tr')
+_field_type = etree.XPath('string(./span)')
+
 
 ENCODINGS_WITH_SMART_QUOTES = [
     "windows-1252",
@@ -28,6 +42,41 @@ ENCODINGS_WITH_SMART_QUOTES = [
 ]
 
 
+#: anything outside of 7-bit ASCII
+_non_ascii = re.compile(r'[^\x00-\x7f]')
+
+
+def transliterate(text: str) -> str:
+    """ Undoes the docs page's mangled smart quotes and reduces to ASCII. """
+    asbytes = bytes(text, ENCODINGS_WITH_SMART_QUOTES[0])
+    return unidecode(str(asbytes, ENCODINGS_WITH_SMART_QUOTES[2]))
+
+
+def memoized_normalizer(func, maxsize=4096):
+    """ Wraps a text normalization function for use by extract().
+
+    Pure-ASCII text is returned untouched without calling func (which
+    must leave ASCII alone); everything else goes through a bounded LRU
+    cache keyed on the raw text. The wrapper exposes the cache's
+    cache_info() and cache_clear().
+    """
+    cached = functools.lru_cache(maxsize=maxsize)(func)
+
+    @functools.wraps(func)
+    def normalize(text):
+        if _non_ascii.search(text) is None:
+            return text
+        return cached(text)
+
+    normalize.cache_info = cached.cache_info
+    normalize.cache_clear = cached.cache_clear
+    return normalize
+
+
+#: the default normalization stage for description cells
+normalize_description = memoized_normalizer(transliterate)
+
+
 def conf_logging(cli_arguments):
     logger = logging.getLogger()
     sfmt = '%(asctime)s : %(levelname)s : %(name)s : %(message)s'
@@ -63,57 +112,201 @@ def add_options(options):
     options.add_argument('-o', '--outfile', type=argparse.FileType('w'),
                          default=sys.stdout,
                          help="path to dump the output, defaults to stdout")
+    options.add_argument('--package', metavar='DIR',
+                         help="generate a lazily imported package with a "
+                              "module per resource in DIR instead of a "
+                              "single module")
+    options.add_argument('--validators', action='store_true',
+                         help="generate a standalone module of "
+                              "validate_* functions, which only check "
+                              "types, nulls and enums, instead of schemas")
+    options.add_argument('--stream', action='store_true',
+                         help="parse incrementally instead of loading the "
+                              "whole page, keeps memory flat")
+    options.add_argument('-j', '--jobs', type=int, default=1,
+                         help="extract and render resources in this many "
+                              "processes (extraction is only parallel "
+                              "without --stream)")
+    options.add_argument('--cache', metavar='PATH',
+                         help="render cache; resources whose fields and "
+                              "dependencies are unchanged since the last "
+                              "run are reused from it instead of rendered")
     return options
 
 
 def execute(parser):
     parser = add_options(parser)
     args = parser.parse_args()
+    if args.validators and args.package:
+        parser.error('--validators is generated as a single module, '
+                     'it cannot be used with --package')
     conf_logging(args)
 
-    parsed = parse(html.parse(args.infile))
-    munged = munge(parsed)
-    rendered = build(munged)
-    with args.outfile as f:
-        f.write(rendered)
-
-
-def parse(tree):
+    executor = None
+    if args.jobs > 1:
+        executor = ProcessPoolExecutor(max_workers=args.jobs)
+
+    try:
+        if args.stream:
+            # iterparse wants bytes, so read from the underlying binary
+            # buffer
+            infile = getattr(args.infile, 'buffer', args.infile)
+            parsed = OrderedDict(parse_stream(infile))
+        else:
+            parsed = parse(html.parse(args.infile), executor=executor)
+        munged = munge(parsed)
+        cache = load_cache(args.cache) if args.cache else None
+        if args.validators:
+            with args.outfile as f:
+                f.write(build_validators(munged))
+        elif args.package:
+            write_package(args.package, build_package(
+                munged, cache=cache, executor=executor))
+        else:
+            rendered = build(munged, cache=cache, executor=executor)
+            with args.outfile as f:
+                f.write(rendered)
+        if args.cache:
+            save_cache(args.cache, cache)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def _map(executor, func, *iterables):
+    """ map() in order, on the executor's processes when there is one. """
+    if executor is None:
+        return list(map(func, *iterables))
+    return list(executor.map(func, *iterables, chunksize=8))
+
+
+def parse(tree, executor=None, normalize=normalize_description):
+    """ Extracts the fields of every resource table in the docs page.
+
+    Descriptions are passed through ``normalize``. With an ``executor``
+    the tables are extracted on its processes, so a normalize other than
+    the default must be picklable; the default isn't, and the workers use
+    their own.
+    """
     resources = tree.xpath('//h1[text()="Resources"]/following-sibling::h2')
     tables = tree.xpath('//h1[text()="Resources"]/following-sibling::table')
     logger.debug('resources: %s', resources)
+    pairs = list(zip(resources, tables))
+    if executor is None:
+        extracted = [extract(rawtable, normalize) for _, rawtable in pairs]
+    else:
+        # elements can't be pickled, so ship each table as markup
+        markups = [etree.tostring(rawtable, with_tail=False)
+                   for _, rawtable in pairs]
+        if normalize is normalize_description:
+            extracted = _map(executor, extract_markup, markups)
+        else:
+            extracted = _map(executor, extract_markup, markups,
+                             itertools.repeat(normalize))
+
     parsed = {}
-    for resource, rawtable in zip(resources, tables):
+    for (resource, _), fields in zip(pairs, extracted):
         resource_name = resource.xpath('string(.)')
         logger.info('resource: %s', resource_name)
-        parsed[resource_name] = extract(rawtable)
+        parsed[resource_name] = fields
 
     logger.debug(parsed)
+    _log_cache_info(normalize)
     return parsed
 
 
-def extract(table):
-    headers = table.xpath('thead/tr/th/text()')
-    fields = table.xpath('./tbody/tr/td[strong]')
-    descriptions = table.xpath('./tbody/tr/td[not(strong)]')
-    logger.debug('headers: %s', [h for h in headers])
-    extracted_fields = [
-        (h.findtext('strong'), h.xpath('string(./span)'))
-        for h in fields
-    ]
-    extracted_descriptions = []
-    for h in descriptions:
-        asbytes = bytes(h.text, ENCODINGS_WITH_SMART_QUOTES[0])
-        extracted_descriptions.append(unidecode(str(asbytes, ENCODINGS_WITH_SMART_QUOTES[2])))
-
-    logger.debug('fields: %s', extracted_fields)
-    logger.debug('descriptions: %s', extracted_descriptions)
-    rv = {f[0]: {"type": f[1], "description": d, "args": ''}
-          for f, d in zip(extracted_fields, extracted_descriptions)}
+def parse_stream(infile, normalize=normalize_description):
+    """ Streaming counterpart of parse().
+
+    Yields (resource name, extracted fields) for every h2 heading
+    following the "Resources" h1 and the table that comes after it, as
+    soon as that table has been read. Elements are cleared and detached
+    once they have been processed, so only one resource table is held in
+    memory at a time.
+    """
+    container = None
+    resource_name = None
+    for _, element in etree.iterparse(infile, events=('end',), html=True):
+        parent = element.getparent()
+        if element is container:
+            break
+        if container is None:
+            if element.tag == 'h1' and element.text == 'Resources':
+                container = parent
+                continue
+        elif parent is container:
+            if element.tag == 'h2':
+                resource_name = element.xpath('string(.)')
+            elif element.tag == 'table' and resource_name is not None:
+                logger.info('resource: %s', resource_name)
+                yield resource_name, extract(element, normalize)
+                resource_name = None
+        else:
+            # nested in a sibling of the h1, freed along with it
+            continue
+        element.clear(keep_tail=True)
+        while element.getprevious() is not None:
+            del parent[0]
+    _log_cache_info(normalize)
+
+
+def _log_cache_info(normalize):
+    if hasattr(normalize, 'cache_info'):
+        logger.debug('description cache: %s', normalize.cache_info())
+
+
+def extract_markup(markup: bytes, normalize=normalize_description):
+    """ extract() for a table serialized with etree.tostring. """
+    return extract(html.fragment_fromstring(markup), normalize)
+
+
+def extract(table, normalize=normalize_description):
+    logger.debug('headers: %s', _table_headers(table))
+    rv = {field: {"type": type_, "description": description, "args": ''}
+          for field, type_, description in extract_rows(table, normalize)}
     logger.debug(rv)
     return rv
 
 
+def extract_rows(table, normalize=normalize_description):
+    """ Yields (field, type, description) for every row of a resource table.
+
+    The field cell is the one holding a <strong> name (and a <span>
+    type), the description cell is the first one without. Both come from
+    the same row, so a row missing either is skipped instead of shifting
+    every following description onto the wrong field. Descriptions are
+    passed through ``normalize``.
+    """
+    for row in _table_rows(table):
+        field_cell = field = description_cell = None
+        for cell in row.iterchildren('td'):
+            strong = cell.find('strong')
+            if strong is not None:
+                if field_cell is None:
+                    field_cell, field = cell, strong.text or ''
+            elif description_cell is None:
+                description_cell = cell
+        if field_cell is None or description_cell is None:
+            logger.debug('skipping row: %s', etree.tostring(row))
+            continue
+
+        description = normalize(description_cell.text or '')
+        yield field, _field_type(field_cell), description
+
+
+def is_timestamp(field: str, description: str) -> bool:
+    """ Whether a field the docs type as Date is sent as a datetime.
+
+    The docs call every timestamp a Date ("The time/date the Story was
+    created."), but the API sends those as ISO 8601 datetimes. So are
+    deadlines, even though the docs describe them as due dates: their
+    own example sends "2016-12-31T12:30:00Z".
+    """
+    return (field.endswith(('_at', '_at_override', '_time', '_update',
+                            'timestamp', 'deadline')) or
+            'time' in description.lower())
+
+
 def munge(datablob: Dict[str, Dict]) -> Dict[str, Dict]:
     #: searches for data between () or [] .. also matches [)..
     nested = re.compile(r'(?:\[|\()(?P<inside>.+)(?:\]|\))')
@@ -127,30 +320,37 @@ def munge(datablob: Dict[str, Dict]) -> Dict[str, Dict]:
 
         graph.add_node_if_not_exists(resource_name)
 
-        for details in resource.values():
+        for field, details in resource.items():
             if 'or null' in details['type']:
                 details['type'] = details['type'].split(' ')[0]
                 details['args'] = 'allow_none=True'
+                details['allow_none'] = True
             elif 'Enum' in details['type']:
                 choices = nested.search(details['type']).group(1).split(',')
                 details['type'] = 'String'
-                details['args'] = 'validate=validate.OneOf({0})'.format(
-                    ', '.join(['"{0}"'.format(c.strip()) for c in choices])
+                details['choices'] = [c.strip() for c in choices]
+                details['args'] = 'validate=validate.OneOf([{0}])'.format(
+                    ', '.join(['"{0}"'.format(c) for c in details['choices']])
                 )
+            if (details['type'] == 'Date' and
+                    is_timestamp(field, details['description'])):
+                details['type'] = 'DateTime'
 
             if not has_nested(details['type']):
                 continue
 
             fieldtype = details['type']
             logger.info('%s: %s\n%s', resource_name, fieldtype, details)
-            if 'Array' in fieldtype:
-                details['args'] = ', many=True'
+            many = 'Array' in fieldtype
+            if many:
                 fieldtype = nested.search(fieldtype).group(1)
 
             if fieldtype not in datablob:
                 # if the field type is not part of the resources, then
-                # we will use marshmallow default fields
-                details['type'] = 'fields.' + fieldtype
+                # it is a list of one of marshmallow's default fields
+                details['type'] = 'List'
+                details['items'] = fieldtype
+                details['args'] = 'fields.{0}()'.format(fieldtype)
                 continue
 
             graph.add_node_if_not_exists(fieldtype)
@@ -167,7 +367,10 @@ def munge(datablob: Dict[str, Dict]) -> Dict[str, Dict]:
                 graph.add_edge(fieldtype, resource_name)
 
             details['type'] = fieldtype
-            details['args'] = ', many=False'
+            details['many'] = many
+            details['args'] = ', many={0}'.format(many)
+            if details.get('allow_none'):
+                details['args'] += ', allow_none=True'
 
 
     ob = OrderedDict()
@@ -177,12 +380,187 @@ def munge(datablob: Dict[str, Dict]) -> Dict[str, Dict]:
     return ob
 
 
-def build(datablob: Dict[str, Dict]):
-    _template = """\
-from marshmallow import Schema, fields, pprint, validate
+_imports = """\
+import uuid
+from collections.abc import Mapping
+
+import attr
+from marshmallow import (
+    Schema, ValidationError, fields, post_load, pprint, utils, validate,
+)
+
+"""
+
+#: shared by every generated loader
+_helpers = """\
+#: stands in for a key that is absent from the data being loaded
+_missing = object()
+
+
+def _invalid(name, message):
+    return ValidationError({name: message if isinstance(message, (dict, list)) else [message]})
+
+
+def _check_mapping(data):
+    if not isinstance(data, Mapping):
+        raise ValidationError({'_schema': ['Invalid input type.']})
+
+
+def _null(name, allow_none):
+    if not allow_none:
+        raise _invalid(name, 'Field may not be null.')
+    return None
+
+
+def _integer(value, name, allow_none=False):
+    if type(value) is int:
+        return value
+    if value is _missing:
+        return None
+    if value is None:
+        return _null(name, allow_none)
+    if value is True or value is False:
+        raise _invalid(name, 'Not a valid integer.')
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        raise _invalid(name, 'Not a valid integer.')
+
+
+def _string(value, name, allow_none=False):
+    if type(value) is str:
+        return value
+    if value is _missing:
+        return None
+    if value is None:
+        return _null(name, allow_none)
+    if not isinstance(value, (str, bytes)):
+        raise _invalid(name, 'Not a valid string.')
+    try:
+        return utils.ensure_text_type(value)
+    except UnicodeDecodeError:
+        raise _invalid(name, 'Not a valid utf-8 string.')
+
+
+def _boolean(value, name, allow_none=False):
+    if value is True or value is False:
+        return value
+    if value is _missing:
+        return None
+    if value is None:
+        return _null(name, allow_none)
+    try:
+        if value in fields.Boolean.truthy:
+            return True
+        if value in fields.Boolean.falsy:
+            return False
+    except TypeError:
+        pass
+    raise _invalid(name, 'Not a valid boolean.')
+
+
+def _uuid(value, name, allow_none=False):
+    if isinstance(value, uuid.UUID):
+        return value
+    if value is _missing:
+        return None
+    if value is None:
+        return _null(name, allow_none)
+    try:
+        if isinstance(value, bytes) and len(value) == 16:
+            return uuid.UUID(bytes=value)
+        return uuid.UUID(value)
+    except (ValueError, AttributeError, TypeError):
+        raise _invalid(name, 'Not a valid UUID.')
+
+
+def _date(value, name, allow_none=False):
+    if value is _missing:
+        return None
+    if value is None:
+        return _null(name, allow_none)
+    if not value:
+        raise _invalid(name, 'Not a valid date.')
+    try:
+        return utils.from_iso_date(value)
+    except (AttributeError, TypeError, ValueError):
+        raise _invalid(name, 'Not a valid date.')
+
+
+def _datetime(value, name, allow_none=False):
+    if value is _missing:
+        return None
+    if value is None:
+        return _null(name, allow_none)
+    if not value:
+        raise _invalid(name, 'Not a valid datetime.')
+    try:
+        return utils.from_iso_datetime(value)
+    except (AttributeError, TypeError, ValueError):
+        raise _invalid(name, 'Not a valid datetime.')
+
+
+def _list(load_item, value, name, allow_none=False):
+    if value is _missing:
+        return None
+    if value is None:
+        return _null(name, allow_none)
+    if not utils.is_collection(value):
+        raise _invalid(name, 'Not a valid list.')
+    return [load_item(item, name) for item in value]
+
+
+def _nested(load, value, name, allow_none=False, many=False):
+    if value is _missing:
+        return None
+    if value is None:
+        return _null(name, allow_none)
+    try:
+        if not many:
+            return load(value)
+        if not utils.is_collection(value):
+            raise ValidationError({'_schema': ['Invalid input type.']})
+        return [load(item) for item in value]
+    except ValidationError as ex:
+        raise _invalid(name, ex.messages)
+
+
+def _deserialize(field, value, name):
+    if value is _missing:
+        return None
+    try:
+        return field.deserialize(value)
+    except ValidationError as ex:
+        raise _invalid(name, ex.messages)
+
+
+def _one_of(value, name, choices):
+    if value is not None and value not in choices:
+        raise _invalid(
+            name, 'Must be one of: {0}.'.format(', '.join(choices)))
+    return value
+
+"""
+
+_header = _imports + _helpers
+
+#: field types the generated loaders convert themselves, anything else is
+#: handed to the schema's marshmallow field
+_LOADER_TYPES = {'Boolean', 'Date', 'DateTime', 'Integer', 'String', 'UUID'}
+
+#: every resource gets a slotted attrs class, which its schema loads into
+_resource_template = """\
+@attr.s(slots=True)
+class {{ resource_name }}Model(object):
+{% for field in resource %}
+    {{ field }} = attr.ib(default=None)
+{% endfor %}
 
-{% for resource_name, resource in resources.items(): %}
 class {{ resource_name }}(Schema):
+    class Meta:
+        # fields the docs don't list are left out, as the API adds some
+        unknown = 'exclude'
+
 {% for field, details in resource.items() %}
     {{ '#: ' ~ details.description | wordwrap(73) | replace('\n', '\n#: ') | indent }}
 {# parses the types and understands how to map to schemas #}
@@ -194,14 +572,378 @@ class {{ resource_name }}(Schema):
 {% endif %}
 
 {% endfor %}
+    @post_load
+    def make_model(self, data, **kwargs):
+        return {{ resource_name }}Model(**data)
+
+{% macro convert(field, details) -%}
+{% set value = "get('" ~ field ~ "', _missing), '" ~ field ~ "'" %}
+{% set allow_none = ', True' if details.allow_none else '' %}
+{% if details.type == '"self"' %}
+_nested(load_{{ resource_name | snake_case }}, {{ value }}{{ allow_none or ', False' }}, {{ details.many }})
+{%- elif details.many is defined %}
+_nested(load_{{ details.type | snake_case }}, {{ value }}{{ allow_none or ', False' }}, {{ details.many }})
+{%- elif details.type == 'List' and details['items'] in loader_types %}
+_list(_{{ details['items'] | lower }}, {{ value }}{{ allow_none }})
+{%- elif details.type in loader_types and details.choices %}
+_one_of(_{{ details.type | lower }}({{ value }}{{ allow_none }}), '{{ field }}', {{ details.choices | tojson }})
+{%- elif details.type in loader_types %}
+_{{ details.type | lower }}({{ value }}{{ allow_none }})
+{%- else %}
+_deserialize({{ resource_name }}._declared_fields['{{ field }}'], {{ value }})
+{%- endif %}
+{%- endmacro %}
+
+def load_{{ resource_name | snake_case }}(data):
+    \"\"\" {{ resource_name }}().load(data), without marshmallow's per-field dispatch. \"\"\"
+    _check_mapping(data)
+    get = data.get
+    return {{ resource_name }}Model(
+{% for field, details in resource.items() %}
+        {{ field }}={{ convert(field, details) }},
+{% endfor %}
+    )
+
+
+"""
+
+
+def snake_case(name: str) -> str:
+    return re.sub(r'(?<!^)(?=[A-Z])', '_', name).lower()
+
+
+_jinja_env.filters['snake_case'] = snake_case
+_resource_rtemplate = _jinja_env.from_string(_resource_template)
+
+#: imports heading each resource's module when generating a package
+_module_template = """\
+import attr
+from marshmallow import Schema, fields, post_load, validate
+
+from ._base import (
+    _boolean, _check_mapping, _date, _datetime, _deserialize, _integer, _list,
+    _missing, _nested, _one_of, _string, _uuid,
+)
+{% for dependency in dependencies %}
+from .{{ dependency | snake_case }} import {{ dependency }}, load_{{ dependency | snake_case }}
+{% endfor %}
+
+
+"""
+
+_package_template = """\
+\"\"\"
+Generated from https://clubhouse.io/api/rest/v2/ by clubhouse/parser.py.
+
+Every resource lives in its own submodule, which is only imported (along
+with marshmallow and the resources it nests) the first time one of its
+names is looked up on this package.
+\"\"\"
+import importlib
+import sys
+
+#: public name -> submodule defining it
+_modules = {
+{% for resource_name in resources %}
+    '{{ resource_name }}': '{{ resource_name | snake_case }}',
+    '{{ resource_name }}Model': '{{ resource_name | snake_case }}',
+    'load_{{ resource_name | snake_case }}': '{{ resource_name | snake_case }}',
+{% endfor %}
+}
+
+__all__ = sorted(_modules)
+
+
+def __getattr__(name):
+    try:
+        module = _modules[name]
+    except KeyError:
+        raise AttributeError(
+            'module {0!r} has no attribute {1!r}'.format(__name__, name))
+    value = getattr(importlib.import_module('.' + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_modules))
+
+
+if sys.version_info < (3, 7):
+    # module level __getattr__ (PEP 562) needs 3.7, load everything now
+    for _name in __all__:
+        __getattr__(_name)
+"""
+
+_module_rtemplate = _jinja_env.from_string(_module_template)
+_package_rtemplate = _jinja_env.from_string(_package_template)
+
+_validators_header = """\
+\"\"\"
+Generated from https://clubhouse.io/api/rest/v2/ by clubhouse/parser.py.
+
+validate_<resource>(data) returns the errors the resource's schema would
+report for a JSON document, as {field: messages}, or {} when it is
+valid. Only types, nulls and enums are checked, unknown fields are
+ignored as the schemas ignore them, and nothing is constructed, so this
+is much cheaper than a load. Values must already have their JSON types:
+"1" is not a valid Integer here.
+\"\"\"
+import re
+from collections.abc import Mapping
+from datetime import date, datetime
+
+#: stands in for a key that is absent from the data being validated
+_missing = object()
+
+_uuid_match = re.compile(
+    r'[0-9a-fA-F]{8}-?(?:[0-9a-fA-F]{4}-?){3}[0-9a-fA-F]{12}$').match
+_date_match = re.compile(r'[0-9]{4}-[0-9]{1,2}-[0-9]{1,2}').fullmatch
+_datetime_match = re.compile(
+    r'([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})[T ]([0-9]{1,2}):([0-9]{1,2})'
+    r'(?::([0-9]{1,2})(?:\\.[0-9]{1,12})?)?'
+    r'(?:Z|[+-][0-9]{2}(?::?[0-9]{2})?)?').fullmatch
+
+
+def _is_date(value):
+    if type(value) is not str or _date_match(value) is None:
+        return False
+    try:
+        date(*map(int, value.split('-')))
+    except ValueError:
+        return False
+    return True
+
+
+def _is_datetime(value):
+    match = type(value) is str and _datetime_match(value)
+    if not match:
+        return False
+    try:
+        datetime(*(int(part or 0) for part in match.groups()))
+    except ValueError:
+        return False
+    return True
+
+
+def _many(validate, value):
+    if type(value) is not list:
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    for index, item in enumerate(value):
+        invalid = validate(item)
+        if invalid:
+            errors[index] = invalid
+    return errors
+
+"""
+
+#: field type -> (python expression that is true for an invalid {0},
+#: error message)
+_VALIDATOR_CHECKS = {
+    'Boolean': ('type({0}) is not bool', 'Not a valid boolean.'),
+    'Date': ('not _is_date({0})', 'Not a valid date.'),
+    'DateTime': ('not _is_datetime({0})', 'Not a valid datetime.'),
+    'Integer': ('type({0}) is not int', 'Not a valid integer.'),
+    'String': ('type({0}) is not str', 'Not a valid string.'),
+    'UUID': ('type({0}) is not str or _uuid_match({0}) is None',
+             'Not a valid UUID.'),
+}
+
+#: a validate_<resource> function per resource, checking one field at a time
+_validator_template = """\
+
+def validate_{{ resource_name | snake_case }}(data):
+    \"\"\" Returns the errors {{ resource_name }}().validate(data) would, {} if none. \"\"\"
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+{% for field, details in resource.items() %}
+{% set target = "errors['" ~ field ~ "']" %}
+{% if details.allow_none %}
+    value = get('{{ field }}')
+    if value is not None:
+{% else %}
+    value = get('{{ field }}', _missing)
+    if value is None:
+        {{ target }} = ['Field may not be null.']
+    elif value is not _missing:
+{% endif %}
+{% if details.many is defined %}
+{% set nested = resource_name if details.type == '"self"' else details.type %}
+{% if details.many %}
+        invalid = _many(validate_{{ nested | snake_case }}, value)
+{% else %}
+        invalid = validate_{{ nested | snake_case }}(value)
+{% endif %}
+        if invalid:
+            {{ target }} = invalid
+{% elif details.type == 'List' and details['items'] in checks %}
+{% set check, message = checks[details['items']] %}
+        if type(value) is not list:
+            {{ target }} = ['Not a valid list.']
+        else:
+            invalid = {index: [{{ message | tojson }}] for index, item in enumerate(value) if {{ check.format('item') }}}
+            if invalid:
+                {{ target }} = invalid
+{% elif details.type in checks %}
+{% set check, message = checks[details.type] %}
+        if {{ check.format('value') }}:
+            {{ target }} = [{{ message | tojson }}]
+{% if details.choices %}
+        elif value not in { {{- details.choices | map('tojson') | join(', ') -}} }:
+            {{ target }} = [{{ ('Must be one of: ' ~ details.choices | join(', ') ~ '.') | tojson }}]
+{% endif %}
+{% else %}
+        pass  # {{ details.type }} is not checked
+{% endif %}
 {% endfor %}
+    return errors
+
+
 """
-    rtemplate = _jinja_env.from_string(_template)
-    _rendered = rtemplate.render(resources=datablob)
+
+_validator_rtemplate = _jinja_env.from_string(_validator_template)
+
+#: bump to throw away render caches written by older versions
+CACHE_VERSION = 1
+
+
+def dependencies(datablob: Dict[str, Dict], resource_name: str) -> List[str]:
+    """ Returns the other resources resource_name nests, as munged. """
+    return sorted({
+        details['type'] for details in datablob[resource_name].values()
+        if details['type'] != resource_name and details['type'] in datablob
+    })
+
+
+def resource_hash(datablob: Dict[str, Dict], resource_name: str) -> str:
+    """ Hashes everything that goes into rendering resource_name. """
+    payload = json.dumps({
+        'resource': datablob[resource_name],
+        'dependencies': dependencies(datablob, resource_name),
+        'template': _resource_template,
+    }, sort_keys=True)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def render_resource(resource_name: str, resource: Dict[str, Dict]) -> str:
+    return _resource_rtemplate.render(
+        resource_name=resource_name, resource=resource,
+        loader_types=_LOADER_TYPES)
+
+
+def load_cache(path: str) -> Dict[str, Dict]:
+    """ Reads a render cache written by save_cache, or returns {}. """
+    try:
+        with open(path) as f:
+            cache = json.load(f)
+    except (IOError, ValueError) as ex:
+        logger.info('not using render cache %s: %s', path, ex)
+        return {}
+    if cache.get('version') != CACHE_VERSION:
+        return {}
+    return cache['resources']
+
+
+def save_cache(path: str, cache: Dict[str, Dict]):
+    with open(path, 'w') as f:
+        json.dump({'version': CACHE_VERSION, 'resources': cache}, f,
+                  indent=1, sort_keys=True)
+
+
+def build(datablob: Dict[str, Dict], cache: Dict[str, Dict] = None,
+          executor=None):
+    """ Renders the munged resources into a python module. """
+    entries = render(datablob, cache=cache, executor=executor)
+    _rendered = _header + ''.join(
+        entry['rendered'] for entry in entries.values())
     logger.debug('%s: ', _rendered)
     return _rendered
 
 
+def build_validators(datablob: Dict[str, Dict]) -> str:
+    """ Renders the munged resources into a module of validate_* functions.
+
+    See _validators_header for what they check.
+    """
+    return _validators_header + ''.join(
+        _validator_rtemplate.render(
+            resource_name=resource_name, resource=resource,
+            checks=_VALIDATOR_CHECKS)
+        for resource_name, resource in datablob.items())
+
+
+def build_package(datablob: Dict[str, Dict], cache: Dict[str, Dict] = None,
+                  executor=None) -> Dict[str, str]:
+    """ Renders the munged resources into a lazily loaded package.
+
+    Returns {file name: source}: an ``__init__.py`` that imports each
+    resource's module on first access, ``_base.py`` with the loader
+    helpers, and one module per resource importing the resources it
+    nests.
+    """
+    entries = render(datablob, cache=cache, executor=executor)
+    files = OrderedDict()
+    files['__init__.py'] = _package_rtemplate.render(resources=entries)
+    files['_base.py'] = _header
+    for resource_name, entry in entries.items():
+        files[snake_case(resource_name) + '.py'] = _module_rtemplate.render(
+            dependencies=entry['dependencies']) + entry['rendered']
+    return files
+
+
+def write_package(directory: str, files: Dict[str, str]):
+    os.makedirs(directory, exist_ok=True)
+    for filename, source in files.items():
+        with open(os.path.join(directory, filename), 'w') as f:
+            f.write(source)
+
+
+def render(datablob: Dict[str, Dict], cache: Dict[str, Dict] = None,
+           executor=None) -> Dict[str, Dict]:
+    """ Renders every resource, returns {resource name: cache entry}.
+
+    If a ``cache`` dict is given, resources whose hash (see
+    resource_hash) matches their cache entry are spliced in from it
+    instead of being re-rendered, and the cache is updated in place with
+    exactly the resources that were built.
+
+    With an ``executor`` the resources left to render are rendered on it;
+    the output keeps the order of ``datablob`` either way.
+    """
+    previous = cache.copy() if cache is not None else {}
+    if cache is not None:
+        cache.clear()
+
+    entries = OrderedDict()
+    stale = []
+    for resource_name in datablob:
+        digest = resource_hash(datablob, resource_name)
+        entry = previous.get(resource_name)
+        if entry is not None and entry['hash'] == digest:
+            logger.debug('%s: unchanged, using cached render', resource_name)
+        else:
+            logger.debug('%s: rendering', resource_name)
+            entry = {
+                'hash': digest,
+                'dependencies': dependencies(datablob, resource_name),
+            }
+            stale.append(resource_name)
+        entries[resource_name] = entry
+
+    renders = _map(executor, render_resource, stale,
+                   [datablob[resource_name] for resource_name in stale])
+    for resource_name, render in zip(stale, renders):
+        entries[resource_name]['rendered'] = render
+    if cache is not None:
+        cache.update(entries)
+
+    logger.info('rendered %d of %d resources', len(stale), len(datablob))
+    return entries
+
+
 def main():
     option_parser = argparse.ArgumentParser()
     option_parser = add_logging_options(option_parser)
@@ -0,0 +1,236 @@
+"""
+An adaptive token bucket that one limiter shares between the threads
+and asyncio tasks making requests with a client::
+
+    limiter = RateLimiter()
+    client = Client(token, rate_limiter=limiter)
+    bulk = client.with_priority(BULK)
+
+Requests wait in priority order, so an INTERACTIVE request is sent
+before any BULK one that is still waiting. A 429 halves the rate and
+holds every request until its Retry-After has passed. Each success adds
+``increase`` back until ``max_rate`` is reached again, but only a tenth
+of it once the rate is within 10% of the one the last 429 came at, so
+the limiter settles just under the server's limit instead of running
+into it over and over.
+"""
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+__all__ = ['BULK', 'INTERACTIVE', 'RateLimiter', 'parse_retry_after']
+
+#: priorities, lower goes first
+INTERACTIVE = 0
+BULK = 1
+
+
+def parse_retry_after(value):
+    """ Seconds to wait from a Retry-After header, None if there is none. """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class _ThreadWaker(object):
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def clear(self):
+        self._event.clear()
+
+    def wake(self):
+        self._event.set()
+
+    def wait(self, timeout):
+        self._event.wait(timeout)
+
+
+class _TaskWaker(object):
+
+    def __init__(self):
+        self._loop = asyncio.get_event_loop()
+        self._event = asyncio.Event()
+
+    def clear(self):
+        self._event.clear()
+
+    def wake(self):
+        # may be called from any thread
+        try:
+            self._loop.call_soon_threadsafe(self._event.set)
+        except RuntimeError:
+            pass  # the loop is closed, nobody is waiting anymore
+
+    async def wait(self, timeout):
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+class RateLimiter(object):
+    """ Lets at most ``rate`` requests a second through, in bursts of up
+    to ``burst``. The defaults follow Clubhouse's limit of 200 requests a
+    minute per token.
+
+    acquire() blocks the calling thread and acquire_async() the calling
+    task until the request may be sent; both return the seconds waited.
+    The client reports each response back with throttled() or
+    succeeded().
+    """
+
+    def __init__(self, rate=200 / 60, burst=10, min_rate=0.1,
+                 increase=None, decrease=0.5):
+        self.max_rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.increase = rate / 100 if increase is None else increase
+        self.decrease = decrease
+
+        self._lock = threading.Lock()
+        self._rate = rate
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        #: the rate the last 429 came at
+        self._ceiling = float('inf')
+        #: heap of [priority, arrival number, waker, enqueued at]
+        self._queue = []
+        self._arrivals = itertools.count()
+
+        self._acquired = dict.fromkeys((INTERACTIVE, BULK), 0)
+        self._waited = dict.fromkeys((INTERACTIVE, BULK), 0.0)
+        self._max_wait = dict.fromkeys((INTERACTIVE, BULK), 0.0)
+        self._max_queue_depth = 0
+        self._throttled = 0
+
+    @property
+    def rate(self):
+        return self._rate
+
+    def acquire(self, priority=INTERACTIVE):
+        item = self._enqueue(priority, _ThreadWaker())
+        try:
+            while True:
+                granted, seconds = self._poll(item)
+                if granted:
+                    return seconds
+                item[2].wait(seconds)
+        finally:
+            self._dequeue(item)
+
+    async def acquire_async(self, priority=INTERACTIVE):
+        item = self._enqueue(priority, _TaskWaker())
+        try:
+            while True:
+                granted, seconds = self._poll(item)
+                if granted:
+                    return seconds
+                await item[2].wait(seconds)
+        finally:
+            self._dequeue(item)
+
+    def throttled(self, retry_after=None):
+        """ The API answered 429: slow down and pause for retry_after. """
+        with self._lock:
+            now = time.monotonic()
+            self._throttled += 1
+            if now >= self._paused_until:
+                # requests in flight are answered 429 together, only the
+                # first one of a pause lowers the rate
+                self._ceiling = self._rate
+                self._rate = max(self.min_rate, self._rate * self.decrease)
+            if retry_after is None:
+                retry_after = 1 / self._rate
+            self._tokens = 0.0
+            self._paused_until = max(self._paused_until, now + retry_after)
+            self._updated = max(self._updated, self._paused_until)
+
+    def succeeded(self):
+        with self._lock:
+            if self._rate >= self.max_rate:
+                return
+            increase = self.increase
+            if self._rate >= self._ceiling * 0.9:
+                increase /= 10
+            self._rate = min(self.max_rate, self._rate + increase)
+
+    def metrics(self):
+        """ Queue depth, waits, and throttling so far. Waits are in
+        seconds, keyed by priority. """
+        with self._lock:
+            depth = dict.fromkeys((INTERACTIVE, BULK), 0)
+            for item in self._queue:
+                depth[item[0]] = depth.get(item[0], 0) + 1
+            return {
+                'rate': self._rate,
+                'queue_depth': depth,
+                'max_queue_depth': self._max_queue_depth,
+                'acquired': dict(self._acquired),
+                'wait_seconds': dict(self._waited),
+                'max_wait_seconds': dict(self._max_wait),
+                'throttled': self._throttled,
+            }
+
+    def _enqueue(self, priority, waker):
+        item = [priority, next(self._arrivals), waker, time.monotonic()]
+        with self._lock:
+            heapq.heappush(self._queue, item)
+            self._max_queue_depth = max(self._max_queue_depth,
+                                        len(self._queue))
+        return item
+
+    def _dequeue(self, item):
+        """ Drops a waiter that gave up (or was cancelled) from the queue. """
+        with self._lock:
+            if item not in self._queue:
+                return
+            head = self._queue[0] is item
+            self._queue.remove(item)
+            heapq.heapify(self._queue)
+            if head and self._queue:
+                self._queue[0][2].wake()
+
+    def _poll(self, item):
+        """ Returns (True, seconds waited) when item may go now, else
+        (False, seconds to wait before polling again, or None to wait for
+        a wake up). """
+        priority, _, waker, enqueued = item
+        with self._lock:
+            waker.clear()
+            if self._queue[0] is not item:
+                return False, None
+            now = time.monotonic()
+            if now < self._paused_until:
+                return False, self._paused_until - now
+            if now > self._updated:
+                self._tokens = min(
+                    self.burst,
+                    self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+            if self._tokens < 1:
+                return False, (1 - self._tokens) / self._rate
+
+            self._tokens -= 1
+            heapq.heappop(self._queue)
+            if self._queue:
+                self._queue[0][2].wake()
+            waited = now - enqueued
+            self._acquired[priority] = self._acquired.get(priority, 0) + 1
+            self._waited[priority] = self._waited.get(priority, 0.0) + waited
+            self._max_wait[priority] = max(
+                self._max_wait.get(priority, 0.0), waited)
+            return True, waited
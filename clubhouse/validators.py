@@ -0,0 +1,2825 @@
+"""
+Generated from https://clubhouse.io/api/rest/v2/ by clubhouse/parser.py.
+
+validate_<resource>(data) returns the errors the resource's schema would
+report for a JSON document, as {field: messages}, or {} when it is
+valid. Only types, nulls and enums are checked, unknown fields are
+ignored as the schemas ignore them, and nothing is constructed, so this
+is much cheaper than a load. Values must already have their JSON types:
+"1" is not a valid Integer here.
+"""
+import re
+from collections.abc import Mapping
+from datetime import date, datetime
+
+#: stands in for a key that is absent from the data being validated
+_missing = object()
+
+_uuid_match = re.compile(
+    r'[0-9a-fA-F]{8}-?(?:[0-9a-fA-F]{4}-?){3}[0-9a-fA-F]{12}$').match
+_date_match = re.compile(r'[0-9]{4}-[0-9]{1,2}-[0-9]{1,2}').fullmatch
+_datetime_match = re.compile(
+    r'([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})[T ]([0-9]{1,2}):([0-9]{1,2})'
+    r'(?::([0-9]{1,2})(?:\.[0-9]{1,12})?)?'
+    r'(?:Z|[+-][0-9]{2}(?::?[0-9]{2})?)?').fullmatch
+
+
+def _is_date(value):
+    if type(value) is not str or _date_match(value) is None:
+        return False
+    try:
+        date(*map(int, value.split('-')))
+    except ValueError:
+        return False
+    return True
+
+
+def _is_datetime(value):
+    match = type(value) is str and _datetime_match(value)
+    if not match:
+        return False
+    try:
+        datetime(*(int(part or 0) for part in match.groups()))
+    except ValueError:
+        return False
+    return True
+
+
+def _many(validate, value):
+    if type(value) is not list:
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    for index, item in enumerate(value):
+        invalid = validate(item)
+        if invalid:
+            errors[index] = invalid
+    return errors
+
+
+def validate_pull_request(data):
+    """ Returns the errors PullRequest().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('branch_id', _missing)
+    if value is None:
+        errors['branch_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['branch_id'] = ["Not a valid integer."]
+    value = get('closed', _missing)
+    if value is None:
+        errors['closed'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['closed'] = ["Not a valid boolean."]
+    value = get('created_at', _missing)
+    if value is None:
+        errors['created_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['created_at'] = ["Not a valid datetime."]
+    value = get('entity_type', _missing)
+    if value is None:
+        errors['entity_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['entity_type'] = ["Not a valid string."]
+    value = get('id', _missing)
+    if value is None:
+        errors['id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['id'] = ["Not a valid integer."]
+    value = get('num_added', _missing)
+    if value is None:
+        errors['num_added'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['num_added'] = ["Not a valid integer."]
+    value = get('num_commits', _missing)
+    if value is None:
+        errors['num_commits'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['num_commits'] = ["Not a valid integer."]
+    value = get('num_modified', _missing)
+    if value is None:
+        errors['num_modified'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['num_modified'] = ["Not a valid integer."]
+    value = get('num_removed', _missing)
+    if value is None:
+        errors['num_removed'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['num_removed'] = ["Not a valid integer."]
+    value = get('number', _missing)
+    if value is None:
+        errors['number'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['number'] = ["Not a valid integer."]
+    value = get('target_branch_id', _missing)
+    if value is None:
+        errors['target_branch_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['target_branch_id'] = ["Not a valid integer."]
+    value = get('title', _missing)
+    if value is None:
+        errors['title'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['title'] = ["Not a valid string."]
+    value = get('updated_at', _missing)
+    if value is None:
+        errors['updated_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['updated_at'] = ["Not a valid datetime."]
+    value = get('url', _missing)
+    if value is None:
+        errors['url'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['url'] = ["Not a valid string."]
+    return errors
+
+
+def validate_category(data):
+    """ Returns the errors Category().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('archived', _missing)
+    if value is None:
+        errors['archived'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['archived'] = ["Not a valid boolean."]
+    value = get('color')
+    if value is not None:
+        if type(value) is not str:
+            errors['color'] = ["Not a valid string."]
+    value = get('created_at', _missing)
+    if value is None:
+        errors['created_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['created_at'] = ["Not a valid datetime."]
+    value = get('entity_type', _missing)
+    if value is None:
+        errors['entity_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['entity_type'] = ["Not a valid string."]
+    value = get('external_id')
+    if value is not None:
+        if type(value) is not str:
+            errors['external_id'] = ["Not a valid string."]
+    value = get('id', _missing)
+    if value is None:
+        errors['id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['id'] = ["Not a valid integer."]
+    value = get('name', _missing)
+    if value is None:
+        errors['name'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['name'] = ["Not a valid string."]
+    value = get('type', _missing)
+    if value is None:
+        errors['type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['type'] = ["Not a valid string."]
+    value = get('updated_at', _missing)
+    if value is None:
+        errors['updated_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['updated_at'] = ["Not a valid datetime."]
+    return errors
+
+
+def validate_comment(data):
+    """ Returns the errors Comment().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('author_id')
+    if value is not None:
+        if type(value) is not str or _uuid_match(value) is None:
+            errors['author_id'] = ["Not a valid UUID."]
+    value = get('created_at', _missing)
+    if value is None:
+        errors['created_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['created_at'] = ["Not a valid datetime."]
+    value = get('entity_type', _missing)
+    if value is None:
+        errors['entity_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['entity_type'] = ["Not a valid string."]
+    value = get('external_id')
+    if value is not None:
+        if type(value) is not str:
+            errors['external_id'] = ["Not a valid string."]
+    value = get('id', _missing)
+    if value is None:
+        errors['id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['id'] = ["Not a valid integer."]
+    value = get('mention_ids', _missing)
+    if value is None:
+        errors['mention_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['mention_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid UUID."] for index, item in enumerate(value) if type(item) is not str or _uuid_match(item) is None}
+            if invalid:
+                errors['mention_ids'] = invalid
+    value = get('position', _missing)
+    if value is None:
+        errors['position'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['position'] = ["Not a valid integer."]
+    value = get('story_id', _missing)
+    if value is None:
+        errors['story_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['story_id'] = ["Not a valid integer."]
+    value = get('text', _missing)
+    if value is None:
+        errors['text'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['text'] = ["Not a valid string."]
+    value = get('updated_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['updated_at'] = ["Not a valid datetime."]
+    return errors
+
+
+def validate_identity(data):
+    """ Returns the errors Identity().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('entity_type', _missing)
+    if value is None:
+        errors['entity_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['entity_type'] = ["Not a valid string."]
+    value = get('name')
+    if value is not None:
+        if type(value) is not str:
+            errors['name'] = ["Not a valid string."]
+    value = get('type')
+    if value is not None:
+        if type(value) is not str:
+            errors['type'] = ["Not a valid string."]
+    return errors
+
+
+def validate_create_category_params(data):
+    """ Returns the errors CreateCategoryParams().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('color', _missing)
+    if value is None:
+        errors['color'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['color'] = ["Not a valid string."]
+    value = get('external_id', _missing)
+    if value is None:
+        errors['external_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['external_id'] = ["Not a valid string."]
+    value = get('name', _missing)
+    if value is None:
+        errors['name'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['name'] = ["Not a valid string."]
+    return errors
+
+
+def validate_create_comment_params(data):
+    """ Returns the errors CreateCommentParams().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('author_id', _missing)
+    if value is None:
+        errors['author_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str or _uuid_match(value) is None:
+            errors['author_id'] = ["Not a valid UUID."]
+    value = get('created_at', _missing)
+    if value is None:
+        errors['created_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['created_at'] = ["Not a valid datetime."]
+    value = get('external_id', _missing)
+    if value is None:
+        errors['external_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['external_id'] = ["Not a valid string."]
+    value = get('text', _missing)
+    if value is None:
+        errors['text'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['text'] = ["Not a valid string."]
+    value = get('updated_at', _missing)
+    if value is None:
+        errors['updated_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['updated_at'] = ["Not a valid datetime."]
+    return errors
+
+
+def validate_create_label_params(data):
+    """ Returns the errors CreateLabelParams().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('color', _missing)
+    if value is None:
+        errors['color'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['color'] = ["Not a valid string."]
+    value = get('external_id', _missing)
+    if value is None:
+        errors['external_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['external_id'] = ["Not a valid string."]
+    value = get('name', _missing)
+    if value is None:
+        errors['name'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['name'] = ["Not a valid string."]
+    return errors
+
+
+def validate_create_story_link_params(data):
+    """ Returns the errors CreateStoryLinkParams().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('object_id', _missing)
+    if value is None:
+        errors['object_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['object_id'] = ["Not a valid integer."]
+    value = get('subject_id', _missing)
+    if value is None:
+        errors['subject_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['subject_id'] = ["Not a valid integer."]
+    value = get('verb', _missing)
+    if value is None:
+        errors['verb'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['verb'] = ["Not a valid string."]
+        elif value not in {"blocks", "duplicates", "relates to"}:
+            errors['verb'] = ["Must be one of: blocks, duplicates, relates to."]
+    return errors
+
+
+def validate_create_task_params(data):
+    """ Returns the errors CreateTaskParams().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('complete', _missing)
+    if value is None:
+        errors['complete'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['complete'] = ["Not a valid boolean."]
+    value = get('created_at', _missing)
+    if value is None:
+        errors['created_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['created_at'] = ["Not a valid datetime."]
+    value = get('description', _missing)
+    if value is None:
+        errors['description'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['description'] = ["Not a valid string."]
+    value = get('external_id', _missing)
+    if value is None:
+        errors['external_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['external_id'] = ["Not a valid string."]
+    value = get('owner_ids', _missing)
+    if value is None:
+        errors['owner_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['owner_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid UUID."] for index, item in enumerate(value) if type(item) is not str or _uuid_match(item) is None}
+            if invalid:
+                errors['owner_ids'] = invalid
+    value = get('updated_at', _missing)
+    if value is None:
+        errors['updated_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['updated_at'] = ["Not a valid datetime."]
+    return errors
+
+
+def validate_threaded_comment(data):
+    """ Returns the errors ThreadedComment().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('author_id', _missing)
+    if value is None:
+        errors['author_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str or _uuid_match(value) is None:
+            errors['author_id'] = ["Not a valid UUID."]
+    value = get('comments', _missing)
+    if value is None:
+        errors['comments'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = _many(validate_threaded_comment, value)
+        if invalid:
+            errors['comments'] = invalid
+    value = get('created_at', _missing)
+    if value is None:
+        errors['created_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['created_at'] = ["Not a valid datetime."]
+    value = get('deleted', _missing)
+    if value is None:
+        errors['deleted'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['deleted'] = ["Not a valid boolean."]
+    value = get('entity_type', _missing)
+    if value is None:
+        errors['entity_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['entity_type'] = ["Not a valid string."]
+    value = get('external_id')
+    if value is not None:
+        if type(value) is not str:
+            errors['external_id'] = ["Not a valid string."]
+    value = get('id', _missing)
+    if value is None:
+        errors['id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['id'] = ["Not a valid integer."]
+    value = get('mention_ids', _missing)
+    if value is None:
+        errors['mention_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['mention_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid UUID."] for index, item in enumerate(value) if type(item) is not str or _uuid_match(item) is None}
+            if invalid:
+                errors['mention_ids'] = invalid
+    value = get('text', _missing)
+    if value is None:
+        errors['text'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['text'] = ["Not a valid string."]
+    value = get('updated_at', _missing)
+    if value is None:
+        errors['updated_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['updated_at'] = ["Not a valid datetime."]
+    return errors
+
+
+def validate_epic_stats(data):
+    """ Returns the errors EpicStats().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('last_story_update')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['last_story_update'] = ["Not a valid datetime."]
+    value = get('num_points', _missing)
+    if value is None:
+        errors['num_points'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['num_points'] = ["Not a valid integer."]
+    value = get('num_points_done', _missing)
+    if value is None:
+        errors['num_points_done'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['num_points_done'] = ["Not a valid integer."]
+    value = get('num_points_started', _missing)
+    if value is None:
+        errors['num_points_started'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['num_points_started'] = ["Not a valid integer."]
+    value = get('num_points_unstarted', _missing)
+    if value is None:
+        errors['num_points_unstarted'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['num_points_unstarted'] = ["Not a valid integer."]
+    value = get('num_stories_done', _missing)
+    if value is None:
+        errors['num_stories_done'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['num_stories_done'] = ["Not a valid integer."]
+    value = get('num_stories_started', _missing)
+    if value is None:
+        errors['num_stories_started'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['num_stories_started'] = ["Not a valid integer."]
+    value = get('num_stories_unestimated', _missing)
+    if value is None:
+        errors['num_stories_unestimated'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['num_stories_unestimated'] = ["Not a valid integer."]
+    value = get('num_stories_unstarted', _missing)
+    if value is None:
+        errors['num_stories_unstarted'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['num_stories_unstarted'] = ["Not a valid integer."]
+    return errors
+
+
+def validate_file(data):
+    """ Returns the errors File().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('content_type', _missing)
+    if value is None:
+        errors['content_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['content_type'] = ["Not a valid string."]
+    value = get('created_at', _missing)
+    if value is None:
+        errors['created_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['created_at'] = ["Not a valid datetime."]
+    value = get('description')
+    if value is not None:
+        if type(value) is not str:
+            errors['description'] = ["Not a valid string."]
+    value = get('entity_type', _missing)
+    if value is None:
+        errors['entity_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['entity_type'] = ["Not a valid string."]
+    value = get('external_id')
+    if value is not None:
+        if type(value) is not str:
+            errors['external_id'] = ["Not a valid string."]
+    value = get('filename', _missing)
+    if value is None:
+        errors['filename'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['filename'] = ["Not a valid string."]
+    value = get('id', _missing)
+    if value is None:
+        errors['id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['id'] = ["Not a valid integer."]
+    value = get('mention_ids', _missing)
+    if value is None:
+        errors['mention_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['mention_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid UUID."] for index, item in enumerate(value) if type(item) is not str or _uuid_match(item) is None}
+            if invalid:
+                errors['mention_ids'] = invalid
+    value = get('name', _missing)
+    if value is None:
+        errors['name'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['name'] = ["Not a valid string."]
+    value = get('size', _missing)
+    if value is None:
+        errors['size'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['size'] = ["Not a valid integer."]
+    value = get('story_ids', _missing)
+    if value is None:
+        errors['story_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['story_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid integer."] for index, item in enumerate(value) if type(item) is not int}
+            if invalid:
+                errors['story_ids'] = invalid
+    value = get('thumbnail_url')
+    if value is not None:
+        if type(value) is not str:
+            errors['thumbnail_url'] = ["Not a valid string."]
+    value = get('updated_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['updated_at'] = ["Not a valid datetime."]
+    value = get('uploader_id', _missing)
+    if value is None:
+        errors['uploader_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str or _uuid_match(value) is None:
+            errors['uploader_id'] = ["Not a valid UUID."]
+    value = get('url')
+    if value is not None:
+        if type(value) is not str:
+            errors['url'] = ["Not a valid string."]
+    return errors
+
+
+def validate_icon(data):
+    """ Returns the errors Icon().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('created_at', _missing)
+    if value is None:
+        errors['created_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['created_at'] = ["Not a valid datetime."]
+    value = get('entity_type', _missing)
+    if value is None:
+        errors['entity_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['entity_type'] = ["Not a valid string."]
+    value = get('id', _missing)
+    if value is None:
+        errors['id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str or _uuid_match(value) is None:
+            errors['id'] = ["Not a valid UUID."]
+    value = get('updated_at', _missing)
+    if value is None:
+        errors['updated_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['updated_at'] = ["Not a valid datetime."]
+    value = get('url', _missing)
+    if value is None:
+        errors['url'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['url'] = ["Not a valid string."]
+    return errors
+
+
+def validate_label_stats(data):
+    """ Returns the errors LabelStats().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('num_epics', _missing)
+    if value is None:
+        errors['num_epics'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['num_epics'] = ["Not a valid integer."]
+    value = get('num_points_completed', _missing)
+    if value is None:
+        errors['num_points_completed'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['num_points_completed'] = ["Not a valid integer."]
+    value = get('num_points_in_progress', _missing)
+    if value is None:
+        errors['num_points_in_progress'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['num_points_in_progress'] = ["Not a valid integer."]
+    value = get('num_points_total', _missing)
+    if value is None:
+        errors['num_points_total'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['num_points_total'] = ["Not a valid integer."]
+    value = get('num_stories_completed', _missing)
+    if value is None:
+        errors['num_stories_completed'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['num_stories_completed'] = ["Not a valid integer."]
+    value = get('num_stories_in_progress', _missing)
+    if value is None:
+        errors['num_stories_in_progress'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['num_stories_in_progress'] = ["Not a valid integer."]
+    value = get('num_stories_total', _missing)
+    if value is None:
+        errors['num_stories_total'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['num_stories_total'] = ["Not a valid integer."]
+    value = get('num_stories_unestimated', _missing)
+    if value is None:
+        errors['num_stories_unestimated'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['num_stories_unestimated'] = ["Not a valid integer."]
+    return errors
+
+
+def validate_linked_file(data):
+    """ Returns the errors LinkedFile().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('content_type')
+    if value is not None:
+        if type(value) is not str:
+            errors['content_type'] = ["Not a valid string."]
+    value = get('created_at', _missing)
+    if value is None:
+        errors['created_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['created_at'] = ["Not a valid datetime."]
+    value = get('description')
+    if value is not None:
+        if type(value) is not str:
+            errors['description'] = ["Not a valid string."]
+    value = get('entity_type', _missing)
+    if value is None:
+        errors['entity_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['entity_type'] = ["Not a valid string."]
+    value = get('id', _missing)
+    if value is None:
+        errors['id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['id'] = ["Not a valid integer."]
+    value = get('mention_ids', _missing)
+    if value is None:
+        errors['mention_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['mention_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid UUID."] for index, item in enumerate(value) if type(item) is not str or _uuid_match(item) is None}
+            if invalid:
+                errors['mention_ids'] = invalid
+    value = get('name', _missing)
+    if value is None:
+        errors['name'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['name'] = ["Not a valid string."]
+    value = get('size')
+    if value is not None:
+        if type(value) is not int:
+            errors['size'] = ["Not a valid integer."]
+    value = get('story_ids', _missing)
+    if value is None:
+        errors['story_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['story_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid integer."] for index, item in enumerate(value) if type(item) is not int}
+            if invalid:
+                errors['story_ids'] = invalid
+    value = get('thumbnail_url')
+    if value is not None:
+        if type(value) is not str:
+            errors['thumbnail_url'] = ["Not a valid string."]
+    value = get('type', _missing)
+    if value is None:
+        errors['type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['type'] = ["Not a valid string."]
+    value = get('updated_at', _missing)
+    if value is None:
+        errors['updated_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['updated_at'] = ["Not a valid datetime."]
+    value = get('uploader_id', _missing)
+    if value is None:
+        errors['uploader_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str or _uuid_match(value) is None:
+            errors['uploader_id'] = ["Not a valid UUID."]
+    value = get('url', _missing)
+    if value is None:
+        errors['url'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['url'] = ["Not a valid string."]
+    return errors
+
+
+def validate_project_stats(data):
+    """ Returns the errors ProjectStats().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('num_points', _missing)
+    if value is None:
+        errors['num_points'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['num_points'] = ["Not a valid integer."]
+    value = get('num_stories', _missing)
+    if value is None:
+        errors['num_stories'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['num_stories'] = ["Not a valid integer."]
+    return errors
+
+
+def validate_repository(data):
+    """ Returns the errors Repository().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('created_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['created_at'] = ["Not a valid datetime."]
+    value = get('entity_type', _missing)
+    if value is None:
+        errors['entity_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['entity_type'] = ["Not a valid string."]
+    value = get('external_id')
+    if value is not None:
+        if type(value) is not str:
+            errors['external_id'] = ["Not a valid string."]
+    value = get('full_name')
+    if value is not None:
+        if type(value) is not str:
+            errors['full_name'] = ["Not a valid string."]
+    value = get('id')
+    if value is not None:
+        if type(value) is not int:
+            errors['id'] = ["Not a valid integer."]
+    value = get('name')
+    if value is not None:
+        if type(value) is not str:
+            errors['name'] = ["Not a valid string."]
+    value = get('type', _missing)
+    if value is None:
+        errors['type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['type'] = ["Not a valid string."]
+    value = get('updated_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['updated_at'] = ["Not a valid datetime."]
+    value = get('url')
+    if value is not None:
+        if type(value) is not str:
+            errors['url'] = ["Not a valid string."]
+    return errors
+
+
+def validate_typed_story_link(data):
+    """ Returns the errors TypedStoryLink().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('created_at', _missing)
+    if value is None:
+        errors['created_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['created_at'] = ["Not a valid datetime."]
+    value = get('entity_type', _missing)
+    if value is None:
+        errors['entity_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['entity_type'] = ["Not a valid string."]
+    value = get('id', _missing)
+    if value is None:
+        errors['id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['id'] = ["Not a valid integer."]
+    value = get('object_id', _missing)
+    if value is None:
+        errors['object_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['object_id'] = ["Not a valid integer."]
+    value = get('subject_id', _missing)
+    if value is None:
+        errors['subject_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['subject_id'] = ["Not a valid integer."]
+    value = get('type', _missing)
+    if value is None:
+        errors['type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['type'] = ["Not a valid string."]
+    value = get('updated_at', _missing)
+    if value is None:
+        errors['updated_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['updated_at'] = ["Not a valid datetime."]
+    value = get('verb', _missing)
+    if value is None:
+        errors['verb'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['verb'] = ["Not a valid string."]
+    return errors
+
+
+def validate_task(data):
+    """ Returns the errors Task().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('complete', _missing)
+    if value is None:
+        errors['complete'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['complete'] = ["Not a valid boolean."]
+    value = get('completed_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['completed_at'] = ["Not a valid datetime."]
+    value = get('created_at', _missing)
+    if value is None:
+        errors['created_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['created_at'] = ["Not a valid datetime."]
+    value = get('description', _missing)
+    if value is None:
+        errors['description'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['description'] = ["Not a valid string."]
+    value = get('entity_type', _missing)
+    if value is None:
+        errors['entity_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['entity_type'] = ["Not a valid string."]
+    value = get('external_id')
+    if value is not None:
+        if type(value) is not str:
+            errors['external_id'] = ["Not a valid string."]
+    value = get('id', _missing)
+    if value is None:
+        errors['id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['id'] = ["Not a valid integer."]
+    value = get('mention_ids', _missing)
+    if value is None:
+        errors['mention_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['mention_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid UUID."] for index, item in enumerate(value) if type(item) is not str or _uuid_match(item) is None}
+            if invalid:
+                errors['mention_ids'] = invalid
+    value = get('owner_ids', _missing)
+    if value is None:
+        errors['owner_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['owner_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid UUID."] for index, item in enumerate(value) if type(item) is not str or _uuid_match(item) is None}
+            if invalid:
+                errors['owner_ids'] = invalid
+    value = get('position', _missing)
+    if value is None:
+        errors['position'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['position'] = ["Not a valid integer."]
+    value = get('story_id', _missing)
+    if value is None:
+        errors['story_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['story_id'] = ["Not a valid integer."]
+    value = get('updated_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['updated_at'] = ["Not a valid datetime."]
+    return errors
+
+
+def validate_story_link(data):
+    """ Returns the errors StoryLink().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('created_at', _missing)
+    if value is None:
+        errors['created_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['created_at'] = ["Not a valid datetime."]
+    value = get('entity_type', _missing)
+    if value is None:
+        errors['entity_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['entity_type'] = ["Not a valid string."]
+    value = get('id', _missing)
+    if value is None:
+        errors['id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['id'] = ["Not a valid integer."]
+    value = get('object_id', _missing)
+    if value is None:
+        errors['object_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['object_id'] = ["Not a valid integer."]
+    value = get('subject_id', _missing)
+    if value is None:
+        errors['subject_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['subject_id'] = ["Not a valid integer."]
+    value = get('updated_at', _missing)
+    if value is None:
+        errors['updated_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['updated_at'] = ["Not a valid datetime."]
+    value = get('verb', _missing)
+    if value is None:
+        errors['verb'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['verb'] = ["Not a valid string."]
+    return errors
+
+
+def validate_workflow_state(data):
+    """ Returns the errors WorkflowState().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('color', _missing)
+    if value is None:
+        errors['color'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['color'] = ["Not a valid string."]
+    value = get('created_at', _missing)
+    if value is None:
+        errors['created_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['created_at'] = ["Not a valid datetime."]
+    value = get('description', _missing)
+    if value is None:
+        errors['description'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['description'] = ["Not a valid string."]
+    value = get('entity_type', _missing)
+    if value is None:
+        errors['entity_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['entity_type'] = ["Not a valid string."]
+    value = get('id', _missing)
+    if value is None:
+        errors['id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['id'] = ["Not a valid integer."]
+    value = get('name', _missing)
+    if value is None:
+        errors['name'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['name'] = ["Not a valid string."]
+    value = get('num_stories', _missing)
+    if value is None:
+        errors['num_stories'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['num_stories'] = ["Not a valid integer."]
+    value = get('position', _missing)
+    if value is None:
+        errors['position'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['position'] = ["Not a valid integer."]
+    value = get('type', _missing)
+    if value is None:
+        errors['type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['type'] = ["Not a valid string."]
+    value = get('updated_at', _missing)
+    if value is None:
+        errors['updated_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['updated_at'] = ["Not a valid datetime."]
+    value = get('verb')
+    if value is not None:
+        if type(value) is not str:
+            errors['verb'] = ["Not a valid string."]
+    return errors
+
+
+def validate_branch(data):
+    """ Returns the errors Branch().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('created_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['created_at'] = ["Not a valid datetime."]
+    value = get('deleted', _missing)
+    if value is None:
+        errors['deleted'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['deleted'] = ["Not a valid boolean."]
+    value = get('entity_type', _missing)
+    if value is None:
+        errors['entity_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['entity_type'] = ["Not a valid string."]
+    value = get('id')
+    if value is not None:
+        if type(value) is not int:
+            errors['id'] = ["Not a valid integer."]
+    value = get('merged_branch_ids', _missing)
+    if value is None:
+        errors['merged_branch_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['merged_branch_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid integer."] for index, item in enumerate(value) if type(item) is not int}
+            if invalid:
+                errors['merged_branch_ids'] = invalid
+    value = get('name', _missing)
+    if value is None:
+        errors['name'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['name'] = ["Not a valid string."]
+    value = get('persistent', _missing)
+    if value is None:
+        errors['persistent'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['persistent'] = ["Not a valid boolean."]
+    value = get('pull_requests', _missing)
+    if value is None:
+        errors['pull_requests'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = _many(validate_pull_request, value)
+        if invalid:
+            errors['pull_requests'] = invalid
+    value = get('repository_id')
+    if value is not None:
+        if type(value) is not int:
+            errors['repository_id'] = ["Not a valid integer."]
+    value = get('updated_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['updated_at'] = ["Not a valid datetime."]
+    value = get('url', _missing)
+    if value is None:
+        errors['url'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['url'] = ["Not a valid string."]
+    return errors
+
+
+def validate_milestone(data):
+    """ Returns the errors Milestone().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('categories', _missing)
+    if value is None:
+        errors['categories'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = _many(validate_category, value)
+        if invalid:
+            errors['categories'] = invalid
+    value = get('completed', _missing)
+    if value is None:
+        errors['completed'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['completed'] = ["Not a valid boolean."]
+    value = get('completed_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['completed_at'] = ["Not a valid datetime."]
+    value = get('completed_at_override')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['completed_at_override'] = ["Not a valid datetime."]
+    value = get('created_at', _missing)
+    if value is None:
+        errors['created_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['created_at'] = ["Not a valid datetime."]
+    value = get('description', _missing)
+    if value is None:
+        errors['description'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['description'] = ["Not a valid string."]
+    value = get('entity_type', _missing)
+    if value is None:
+        errors['entity_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['entity_type'] = ["Not a valid string."]
+    value = get('id', _missing)
+    if value is None:
+        errors['id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['id'] = ["Not a valid integer."]
+    value = get('name', _missing)
+    if value is None:
+        errors['name'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['name'] = ["Not a valid string."]
+    value = get('position', _missing)
+    if value is None:
+        errors['position'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['position'] = ["Not a valid integer."]
+    value = get('started', _missing)
+    if value is None:
+        errors['started'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['started'] = ["Not a valid boolean."]
+    value = get('started_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['started_at'] = ["Not a valid datetime."]
+    value = get('started_at_override')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['started_at_override'] = ["Not a valid datetime."]
+    value = get('state', _missing)
+    if value is None:
+        errors['state'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['state'] = ["Not a valid string."]
+    value = get('updated_at', _missing)
+    if value is None:
+        errors['updated_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['updated_at'] = ["Not a valid datetime."]
+    return errors
+
+
+def validate_commit(data):
+    """ Returns the errors Commit().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('author_email', _missing)
+    if value is None:
+        errors['author_email'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['author_email'] = ["Not a valid string."]
+    value = get('author_id')
+    if value is not None:
+        if type(value) is not str or _uuid_match(value) is None:
+            errors['author_id'] = ["Not a valid UUID."]
+    value = get('author_identity', _missing)
+    if value is None:
+        errors['author_identity'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = validate_identity(value)
+        if invalid:
+            errors['author_identity'] = invalid
+    value = get('created_at', _missing)
+    if value is None:
+        errors['created_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['created_at'] = ["Not a valid datetime."]
+    value = get('entity_type', _missing)
+    if value is None:
+        errors['entity_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['entity_type'] = ["Not a valid string."]
+    value = get('hash', _missing)
+    if value is None:
+        errors['hash'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['hash'] = ["Not a valid string."]
+    value = get('id')
+    if value is not None:
+        if type(value) is not int:
+            errors['id'] = ["Not a valid integer."]
+    value = get('merged_branch_ids', _missing)
+    if value is None:
+        errors['merged_branch_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['merged_branch_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid integer."] for index, item in enumerate(value) if type(item) is not int}
+            if invalid:
+                errors['merged_branch_ids'] = invalid
+    value = get('message', _missing)
+    if value is None:
+        errors['message'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['message'] = ["Not a valid string."]
+    value = get('repository_id')
+    if value is not None:
+        if type(value) is not int:
+            errors['repository_id'] = ["Not a valid integer."]
+    value = get('timestamp', _missing)
+    if value is None:
+        errors['timestamp'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['timestamp'] = ["Not a valid datetime."]
+    value = get('updated_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['updated_at'] = ["Not a valid datetime."]
+    value = get('url', _missing)
+    if value is None:
+        errors['url'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['url'] = ["Not a valid string."]
+    return errors
+
+
+def validate_create_story_params(data):
+    """ Returns the errors CreateStoryParams().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('comments', _missing)
+    if value is None:
+        errors['comments'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = _many(validate_create_comment_params, value)
+        if invalid:
+            errors['comments'] = invalid
+    value = get('completed_at_override', _missing)
+    if value is None:
+        errors['completed_at_override'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['completed_at_override'] = ["Not a valid datetime."]
+    value = get('created_at', _missing)
+    if value is None:
+        errors['created_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['created_at'] = ["Not a valid datetime."]
+    value = get('deadline')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['deadline'] = ["Not a valid datetime."]
+    value = get('description', _missing)
+    if value is None:
+        errors['description'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['description'] = ["Not a valid string."]
+    value = get('epic_id')
+    if value is not None:
+        if type(value) is not int:
+            errors['epic_id'] = ["Not a valid integer."]
+    value = get('estimate')
+    if value is not None:
+        if type(value) is not int:
+            errors['estimate'] = ["Not a valid integer."]
+    value = get('external_id', _missing)
+    if value is None:
+        errors['external_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['external_id'] = ["Not a valid string."]
+    value = get('file_ids', _missing)
+    if value is None:
+        errors['file_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['file_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid integer."] for index, item in enumerate(value) if type(item) is not int}
+            if invalid:
+                errors['file_ids'] = invalid
+    value = get('follower_ids', _missing)
+    if value is None:
+        errors['follower_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['follower_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid UUID."] for index, item in enumerate(value) if type(item) is not str or _uuid_match(item) is None}
+            if invalid:
+                errors['follower_ids'] = invalid
+    value = get('labels', _missing)
+    if value is None:
+        errors['labels'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = _many(validate_create_label_params, value)
+        if invalid:
+            errors['labels'] = invalid
+    value = get('linked_file_ids', _missing)
+    if value is None:
+        errors['linked_file_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['linked_file_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid integer."] for index, item in enumerate(value) if type(item) is not int}
+            if invalid:
+                errors['linked_file_ids'] = invalid
+    value = get('name', _missing)
+    if value is None:
+        errors['name'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['name'] = ["Not a valid string."]
+    value = get('owner_ids', _missing)
+    if value is None:
+        errors['owner_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['owner_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid UUID."] for index, item in enumerate(value) if type(item) is not str or _uuid_match(item) is None}
+            if invalid:
+                errors['owner_ids'] = invalid
+    value = get('project_id', _missing)
+    if value is None:
+        errors['project_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['project_id'] = ["Not a valid integer."]
+    value = get('requested_by_id', _missing)
+    if value is None:
+        errors['requested_by_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str or _uuid_match(value) is None:
+            errors['requested_by_id'] = ["Not a valid UUID."]
+    value = get('started_at_override', _missing)
+    if value is None:
+        errors['started_at_override'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['started_at_override'] = ["Not a valid datetime."]
+    value = get('story_links', _missing)
+    if value is None:
+        errors['story_links'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = _many(validate_create_story_link_params, value)
+        if invalid:
+            errors['story_links'] = invalid
+    value = get('story_type', _missing)
+    if value is None:
+        errors['story_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['story_type'] = ["Not a valid string."]
+        elif value not in {"bug", "chore", "feature"}:
+            errors['story_type'] = ["Must be one of: bug, chore, feature."]
+    value = get('tasks', _missing)
+    if value is None:
+        errors['tasks'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = _many(validate_create_task_params, value)
+        if invalid:
+            errors['tasks'] = invalid
+    value = get('updated_at', _missing)
+    if value is None:
+        errors['updated_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['updated_at'] = ["Not a valid datetime."]
+    value = get('workflow_state_id', _missing)
+    if value is None:
+        errors['workflow_state_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['workflow_state_id'] = ["Not a valid integer."]
+    return errors
+
+
+def validate_profile(data):
+    """ Returns the errors Profile().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('deactivated', _missing)
+    if value is None:
+        errors['deactivated'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['deactivated'] = ["Not a valid boolean."]
+    value = get('display_icon', _missing)
+    if value is None:
+        errors['display_icon'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = validate_icon(value)
+        if invalid:
+            errors['display_icon'] = invalid
+    value = get('email_address')
+    if value is not None:
+        if type(value) is not str:
+            errors['email_address'] = ["Not a valid string."]
+    value = get('entity_type', _missing)
+    if value is None:
+        errors['entity_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['entity_type'] = ["Not a valid string."]
+    value = get('gravatar_hash')
+    if value is not None:
+        if type(value) is not str:
+            errors['gravatar_hash'] = ["Not a valid string."]
+    value = get('id', _missing)
+    if value is None:
+        errors['id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str or _uuid_match(value) is None:
+            errors['id'] = ["Not a valid UUID."]
+    value = get('mention_name', _missing)
+    if value is None:
+        errors['mention_name'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['mention_name'] = ["Not a valid string."]
+    value = get('name', _missing)
+    if value is None:
+        errors['name'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['name'] = ["Not a valid string."]
+    value = get('two_factor_auth_activated', _missing)
+    if value is None:
+        errors['two_factor_auth_activated'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['two_factor_auth_activated'] = ["Not a valid boolean."]
+    return errors
+
+
+def validate_label(data):
+    """ Returns the errors Label().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('archived', _missing)
+    if value is None:
+        errors['archived'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['archived'] = ["Not a valid boolean."]
+    value = get('color')
+    if value is not None:
+        if type(value) is not str:
+            errors['color'] = ["Not a valid string."]
+    value = get('created_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['created_at'] = ["Not a valid datetime."]
+    value = get('entity_type', _missing)
+    if value is None:
+        errors['entity_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['entity_type'] = ["Not a valid string."]
+    value = get('external_id')
+    if value is not None:
+        if type(value) is not str:
+            errors['external_id'] = ["Not a valid string."]
+    value = get('id', _missing)
+    if value is None:
+        errors['id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['id'] = ["Not a valid integer."]
+    value = get('name', _missing)
+    if value is None:
+        errors['name'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['name'] = ["Not a valid string."]
+    value = get('stats', _missing)
+    if value is None:
+        errors['stats'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = validate_label_stats(value)
+        if invalid:
+            errors['stats'] = invalid
+    value = get('updated_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['updated_at'] = ["Not a valid datetime."]
+    return errors
+
+
+def validate_project(data):
+    """ Returns the errors Project().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('abbreviation')
+    if value is not None:
+        if type(value) is not str:
+            errors['abbreviation'] = ["Not a valid string."]
+    value = get('archived', _missing)
+    if value is None:
+        errors['archived'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['archived'] = ["Not a valid boolean."]
+    value = get('color')
+    if value is not None:
+        if type(value) is not str:
+            errors['color'] = ["Not a valid string."]
+    value = get('created_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['created_at'] = ["Not a valid datetime."]
+    value = get('days_to_thermometer', _missing)
+    if value is None:
+        errors['days_to_thermometer'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['days_to_thermometer'] = ["Not a valid integer."]
+    value = get('description')
+    if value is not None:
+        if type(value) is not str:
+            errors['description'] = ["Not a valid string."]
+    value = get('entity_type', _missing)
+    if value is None:
+        errors['entity_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['entity_type'] = ["Not a valid string."]
+    value = get('external_id')
+    if value is not None:
+        if type(value) is not str:
+            errors['external_id'] = ["Not a valid string."]
+    value = get('follower_ids', _missing)
+    if value is None:
+        errors['follower_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['follower_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid UUID."] for index, item in enumerate(value) if type(item) is not str or _uuid_match(item) is None}
+            if invalid:
+                errors['follower_ids'] = invalid
+    value = get('id', _missing)
+    if value is None:
+        errors['id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['id'] = ["Not a valid integer."]
+    value = get('iteration_length', _missing)
+    if value is None:
+        errors['iteration_length'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['iteration_length'] = ["Not a valid integer."]
+    value = get('name', _missing)
+    if value is None:
+        errors['name'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['name'] = ["Not a valid string."]
+    value = get('show_thermometer', _missing)
+    if value is None:
+        errors['show_thermometer'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['show_thermometer'] = ["Not a valid boolean."]
+    value = get('start_time', _missing)
+    if value is None:
+        errors['start_time'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['start_time'] = ["Not a valid datetime."]
+    value = get('stats', _missing)
+    if value is None:
+        errors['stats'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = validate_project_stats(value)
+        if invalid:
+            errors['stats'] = invalid
+    value = get('team_id', _missing)
+    if value is None:
+        errors['team_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['team_id'] = ["Not a valid integer."]
+    value = get('updated_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['updated_at'] = ["Not a valid datetime."]
+    return errors
+
+
+def validate_workflow(data):
+    """ Returns the errors Workflow().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('created_at', _missing)
+    if value is None:
+        errors['created_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['created_at'] = ["Not a valid datetime."]
+    value = get('default_state_id', _missing)
+    if value is None:
+        errors['default_state_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['default_state_id'] = ["Not a valid integer."]
+    value = get('description', _missing)
+    if value is None:
+        errors['description'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['description'] = ["Not a valid string."]
+    value = get('entity_type', _missing)
+    if value is None:
+        errors['entity_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['entity_type'] = ["Not a valid string."]
+    value = get('id', _missing)
+    if value is None:
+        errors['id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['id'] = ["Not a valid integer."]
+    value = get('name', _missing)
+    if value is None:
+        errors['name'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['name'] = ["Not a valid string."]
+    value = get('states', _missing)
+    if value is None:
+        errors['states'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = _many(validate_workflow_state, value)
+        if invalid:
+            errors['states'] = invalid
+    value = get('team_id', _missing)
+    if value is None:
+        errors['team_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['team_id'] = ["Not a valid integer."]
+    value = get('updated_at', _missing)
+    if value is None:
+        errors['updated_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['updated_at'] = ["Not a valid datetime."]
+    return errors
+
+
+def validate_member(data):
+    """ Returns the errors Member().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('created_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['created_at'] = ["Not a valid datetime."]
+    value = get('disabled', _missing)
+    if value is None:
+        errors['disabled'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['disabled'] = ["Not a valid boolean."]
+    value = get('entity_type', _missing)
+    if value is None:
+        errors['entity_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['entity_type'] = ["Not a valid string."]
+    value = get('id', _missing)
+    if value is None:
+        errors['id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str or _uuid_match(value) is None:
+            errors['id'] = ["Not a valid UUID."]
+    value = get('profile', _missing)
+    if value is None:
+        errors['profile'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = validate_profile(value)
+        if invalid:
+            errors['profile'] = invalid
+    value = get('role', _missing)
+    if value is None:
+        errors['role'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['role'] = ["Not a valid string."]
+    value = get('updated_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['updated_at'] = ["Not a valid datetime."]
+    return errors
+
+
+def validate_story(data):
+    """ Returns the errors Story().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('app_url', _missing)
+    if value is None:
+        errors['app_url'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['app_url'] = ["Not a valid string."]
+    value = get('archived', _missing)
+    if value is None:
+        errors['archived'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['archived'] = ["Not a valid boolean."]
+    value = get('blocked', _missing)
+    if value is None:
+        errors['blocked'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['blocked'] = ["Not a valid boolean."]
+    value = get('blocker', _missing)
+    if value is None:
+        errors['blocker'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['blocker'] = ["Not a valid boolean."]
+    value = get('branches', _missing)
+    if value is None:
+        errors['branches'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = _many(validate_branch, value)
+        if invalid:
+            errors['branches'] = invalid
+    value = get('comments', _missing)
+    if value is None:
+        errors['comments'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = _many(validate_comment, value)
+        if invalid:
+            errors['comments'] = invalid
+    value = get('commits', _missing)
+    if value is None:
+        errors['commits'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = _many(validate_commit, value)
+        if invalid:
+            errors['commits'] = invalid
+    value = get('completed', _missing)
+    if value is None:
+        errors['completed'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['completed'] = ["Not a valid boolean."]
+    value = get('completed_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['completed_at'] = ["Not a valid datetime."]
+    value = get('completed_at_override')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['completed_at_override'] = ["Not a valid datetime."]
+    value = get('created_at', _missing)
+    if value is None:
+        errors['created_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['created_at'] = ["Not a valid datetime."]
+    value = get('deadline')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['deadline'] = ["Not a valid datetime."]
+    value = get('description', _missing)
+    if value is None:
+        errors['description'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['description'] = ["Not a valid string."]
+    value = get('entity_type', _missing)
+    if value is None:
+        errors['entity_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['entity_type'] = ["Not a valid string."]
+    value = get('epic_id')
+    if value is not None:
+        if type(value) is not int:
+            errors['epic_id'] = ["Not a valid integer."]
+    value = get('estimate')
+    if value is not None:
+        if type(value) is not int:
+            errors['estimate'] = ["Not a valid integer."]
+    value = get('external_id')
+    if value is not None:
+        if type(value) is not str:
+            errors['external_id'] = ["Not a valid string."]
+    value = get('files', _missing)
+    if value is None:
+        errors['files'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = _many(validate_file, value)
+        if invalid:
+            errors['files'] = invalid
+    value = get('follower_ids', _missing)
+    if value is None:
+        errors['follower_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['follower_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid UUID."] for index, item in enumerate(value) if type(item) is not str or _uuid_match(item) is None}
+            if invalid:
+                errors['follower_ids'] = invalid
+    value = get('id', _missing)
+    if value is None:
+        errors['id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['id'] = ["Not a valid integer."]
+    value = get('labels', _missing)
+    if value is None:
+        errors['labels'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = _many(validate_label, value)
+        if invalid:
+            errors['labels'] = invalid
+    value = get('linked_files', _missing)
+    if value is None:
+        errors['linked_files'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = _many(validate_linked_file, value)
+        if invalid:
+            errors['linked_files'] = invalid
+    value = get('moved_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['moved_at'] = ["Not a valid datetime."]
+    value = get('name', _missing)
+    if value is None:
+        errors['name'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['name'] = ["Not a valid string."]
+    value = get('owner_ids', _missing)
+    if value is None:
+        errors['owner_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['owner_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid UUID."] for index, item in enumerate(value) if type(item) is not str or _uuid_match(item) is None}
+            if invalid:
+                errors['owner_ids'] = invalid
+    value = get('position', _missing)
+    if value is None:
+        errors['position'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['position'] = ["Not a valid integer."]
+    value = get('project_id', _missing)
+    if value is None:
+        errors['project_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['project_id'] = ["Not a valid integer."]
+    value = get('requested_by_id', _missing)
+    if value is None:
+        errors['requested_by_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str or _uuid_match(value) is None:
+            errors['requested_by_id'] = ["Not a valid UUID."]
+    value = get('started', _missing)
+    if value is None:
+        errors['started'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['started'] = ["Not a valid boolean."]
+    value = get('started_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['started_at'] = ["Not a valid datetime."]
+    value = get('started_at_override')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['started_at_override'] = ["Not a valid datetime."]
+    value = get('story_links', _missing)
+    if value is None:
+        errors['story_links'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = _many(validate_typed_story_link, value)
+        if invalid:
+            errors['story_links'] = invalid
+    value = get('story_type', _missing)
+    if value is None:
+        errors['story_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['story_type'] = ["Not a valid string."]
+    value = get('tasks', _missing)
+    if value is None:
+        errors['tasks'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = _many(validate_task, value)
+        if invalid:
+            errors['tasks'] = invalid
+    value = get('updated_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['updated_at'] = ["Not a valid datetime."]
+    value = get('workflow_state_id', _missing)
+    if value is None:
+        errors['workflow_state_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['workflow_state_id'] = ["Not a valid integer."]
+    return errors
+
+
+def validate_story_slim(data):
+    """ Returns the errors StorySlim().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('app_url', _missing)
+    if value is None:
+        errors['app_url'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['app_url'] = ["Not a valid string."]
+    value = get('archived', _missing)
+    if value is None:
+        errors['archived'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['archived'] = ["Not a valid boolean."]
+    value = get('blocked', _missing)
+    if value is None:
+        errors['blocked'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['blocked'] = ["Not a valid boolean."]
+    value = get('blocker', _missing)
+    if value is None:
+        errors['blocker'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['blocker'] = ["Not a valid boolean."]
+    value = get('comment_ids', _missing)
+    if value is None:
+        errors['comment_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['comment_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid integer."] for index, item in enumerate(value) if type(item) is not int}
+            if invalid:
+                errors['comment_ids'] = invalid
+    value = get('completed', _missing)
+    if value is None:
+        errors['completed'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['completed'] = ["Not a valid boolean."]
+    value = get('completed_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['completed_at'] = ["Not a valid datetime."]
+    value = get('completed_at_override')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['completed_at_override'] = ["Not a valid datetime."]
+    value = get('created_at', _missing)
+    if value is None:
+        errors['created_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['created_at'] = ["Not a valid datetime."]
+    value = get('deadline')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['deadline'] = ["Not a valid datetime."]
+    value = get('entity_type', _missing)
+    if value is None:
+        errors['entity_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['entity_type'] = ["Not a valid string."]
+    value = get('epic_id')
+    if value is not None:
+        if type(value) is not int:
+            errors['epic_id'] = ["Not a valid integer."]
+    value = get('estimate')
+    if value is not None:
+        if type(value) is not int:
+            errors['estimate'] = ["Not a valid integer."]
+    value = get('external_id')
+    if value is not None:
+        if type(value) is not str:
+            errors['external_id'] = ["Not a valid string."]
+    value = get('file_ids', _missing)
+    if value is None:
+        errors['file_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['file_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid integer."] for index, item in enumerate(value) if type(item) is not int}
+            if invalid:
+                errors['file_ids'] = invalid
+    value = get('follower_ids', _missing)
+    if value is None:
+        errors['follower_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['follower_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid UUID."] for index, item in enumerate(value) if type(item) is not str or _uuid_match(item) is None}
+            if invalid:
+                errors['follower_ids'] = invalid
+    value = get('id', _missing)
+    if value is None:
+        errors['id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['id'] = ["Not a valid integer."]
+    value = get('labels', _missing)
+    if value is None:
+        errors['labels'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = _many(validate_label, value)
+        if invalid:
+            errors['labels'] = invalid
+    value = get('linked_file_ids', _missing)
+    if value is None:
+        errors['linked_file_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['linked_file_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid integer."] for index, item in enumerate(value) if type(item) is not int}
+            if invalid:
+                errors['linked_file_ids'] = invalid
+    value = get('moved_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['moved_at'] = ["Not a valid datetime."]
+    value = get('name', _missing)
+    if value is None:
+        errors['name'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['name'] = ["Not a valid string."]
+    value = get('owner_ids', _missing)
+    if value is None:
+        errors['owner_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['owner_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid UUID."] for index, item in enumerate(value) if type(item) is not str or _uuid_match(item) is None}
+            if invalid:
+                errors['owner_ids'] = invalid
+    value = get('position', _missing)
+    if value is None:
+        errors['position'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['position'] = ["Not a valid integer."]
+    value = get('project_id', _missing)
+    if value is None:
+        errors['project_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['project_id'] = ["Not a valid integer."]
+    value = get('requested_by_id', _missing)
+    if value is None:
+        errors['requested_by_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str or _uuid_match(value) is None:
+            errors['requested_by_id'] = ["Not a valid UUID."]
+    value = get('started', _missing)
+    if value is None:
+        errors['started'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['started'] = ["Not a valid boolean."]
+    value = get('started_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['started_at'] = ["Not a valid datetime."]
+    value = get('started_at_override')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['started_at_override'] = ["Not a valid datetime."]
+    value = get('story_links', _missing)
+    if value is None:
+        errors['story_links'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = _many(validate_typed_story_link, value)
+        if invalid:
+            errors['story_links'] = invalid
+    value = get('story_type', _missing)
+    if value is None:
+        errors['story_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['story_type'] = ["Not a valid string."]
+    value = get('task_ids', _missing)
+    if value is None:
+        errors['task_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['task_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid integer."] for index, item in enumerate(value) if type(item) is not int}
+            if invalid:
+                errors['task_ids'] = invalid
+    value = get('updated_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['updated_at'] = ["Not a valid datetime."]
+    value = get('workflow_state_id', _missing)
+    if value is None:
+        errors['workflow_state_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['workflow_state_id'] = ["Not a valid integer."]
+    return errors
+
+
+def validate_story_search(data):
+    """ Returns the errors StorySearch().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('app_url', _missing)
+    if value is None:
+        errors['app_url'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['app_url'] = ["Not a valid string."]
+    value = get('archived', _missing)
+    if value is None:
+        errors['archived'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['archived'] = ["Not a valid boolean."]
+    value = get('blocked', _missing)
+    if value is None:
+        errors['blocked'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['blocked'] = ["Not a valid boolean."]
+    value = get('blocker', _missing)
+    if value is None:
+        errors['blocker'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['blocker'] = ["Not a valid boolean."]
+    value = get('completed', _missing)
+    if value is None:
+        errors['completed'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['completed'] = ["Not a valid boolean."]
+    value = get('completed_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['completed_at'] = ["Not a valid datetime."]
+    value = get('completed_at_override')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['completed_at_override'] = ["Not a valid datetime."]
+    value = get('created_at', _missing)
+    if value is None:
+        errors['created_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['created_at'] = ["Not a valid datetime."]
+    value = get('deadline')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['deadline'] = ["Not a valid datetime."]
+    value = get('description', _missing)
+    if value is None:
+        errors['description'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['description'] = ["Not a valid string."]
+    value = get('entity_type', _missing)
+    if value is None:
+        errors['entity_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['entity_type'] = ["Not a valid string."]
+    value = get('epic_id')
+    if value is not None:
+        if type(value) is not int:
+            errors['epic_id'] = ["Not a valid integer."]
+    value = get('estimate')
+    if value is not None:
+        if type(value) is not int:
+            errors['estimate'] = ["Not a valid integer."]
+    value = get('external_id')
+    if value is not None:
+        if type(value) is not str:
+            errors['external_id'] = ["Not a valid string."]
+    value = get('follower_ids', _missing)
+    if value is None:
+        errors['follower_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['follower_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid UUID."] for index, item in enumerate(value) if type(item) is not str or _uuid_match(item) is None}
+            if invalid:
+                errors['follower_ids'] = invalid
+    value = get('id', _missing)
+    if value is None:
+        errors['id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['id'] = ["Not a valid integer."]
+    value = get('labels', _missing)
+    if value is None:
+        errors['labels'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = _many(validate_label, value)
+        if invalid:
+            errors['labels'] = invalid
+    value = get('moved_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['moved_at'] = ["Not a valid datetime."]
+    value = get('name', _missing)
+    if value is None:
+        errors['name'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['name'] = ["Not a valid string."]
+    value = get('owner_ids', _missing)
+    if value is None:
+        errors['owner_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['owner_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid UUID."] for index, item in enumerate(value) if type(item) is not str or _uuid_match(item) is None}
+            if invalid:
+                errors['owner_ids'] = invalid
+    value = get('position', _missing)
+    if value is None:
+        errors['position'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['position'] = ["Not a valid integer."]
+    value = get('project_id', _missing)
+    if value is None:
+        errors['project_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['project_id'] = ["Not a valid integer."]
+    value = get('requested_by_id', _missing)
+    if value is None:
+        errors['requested_by_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str or _uuid_match(value) is None:
+            errors['requested_by_id'] = ["Not a valid UUID."]
+    value = get('started', _missing)
+    if value is None:
+        errors['started'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['started'] = ["Not a valid boolean."]
+    value = get('started_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['started_at'] = ["Not a valid datetime."]
+    value = get('started_at_override')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['started_at_override'] = ["Not a valid datetime."]
+    value = get('story_links', _missing)
+    if value is None:
+        errors['story_links'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = _many(validate_typed_story_link, value)
+        if invalid:
+            errors['story_links'] = invalid
+    value = get('story_type', _missing)
+    if value is None:
+        errors['story_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['story_type'] = ["Not a valid string."]
+    value = get('updated_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['updated_at'] = ["Not a valid datetime."]
+    value = get('workflow_state_id', _missing)
+    if value is None:
+        errors['workflow_state_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['workflow_state_id'] = ["Not a valid integer."]
+    return errors
+
+
+def validate_epic(data):
+    """ Returns the errors Epic().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('archived', _missing)
+    if value is None:
+        errors['archived'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['archived'] = ["Not a valid boolean."]
+    value = get('comments', _missing)
+    if value is None:
+        errors['comments'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = _many(validate_threaded_comment, value)
+        if invalid:
+            errors['comments'] = invalid
+    value = get('completed', _missing)
+    if value is None:
+        errors['completed'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['completed'] = ["Not a valid boolean."]
+    value = get('completed_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['completed_at'] = ["Not a valid datetime."]
+    value = get('completed_at_override')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['completed_at_override'] = ["Not a valid datetime."]
+    value = get('created_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['created_at'] = ["Not a valid datetime."]
+    value = get('deadline')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['deadline'] = ["Not a valid datetime."]
+    value = get('description', _missing)
+    if value is None:
+        errors['description'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['description'] = ["Not a valid string."]
+    value = get('entity_type', _missing)
+    if value is None:
+        errors['entity_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['entity_type'] = ["Not a valid string."]
+    value = get('external_id')
+    if value is not None:
+        if type(value) is not str:
+            errors['external_id'] = ["Not a valid string."]
+    value = get('follower_ids', _missing)
+    if value is None:
+        errors['follower_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['follower_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid UUID."] for index, item in enumerate(value) if type(item) is not str or _uuid_match(item) is None}
+            if invalid:
+                errors['follower_ids'] = invalid
+    value = get('id', _missing)
+    if value is None:
+        errors['id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['id'] = ["Not a valid integer."]
+    value = get('labels', _missing)
+    if value is None:
+        errors['labels'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = _many(validate_label, value)
+        if invalid:
+            errors['labels'] = invalid
+    value = get('milestone_id')
+    if value is not None:
+        if type(value) is not int:
+            errors['milestone_id'] = ["Not a valid integer."]
+    value = get('name', _missing)
+    if value is None:
+        errors['name'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['name'] = ["Not a valid string."]
+    value = get('owner_ids', _missing)
+    if value is None:
+        errors['owner_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['owner_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid UUID."] for index, item in enumerate(value) if type(item) is not str or _uuid_match(item) is None}
+            if invalid:
+                errors['owner_ids'] = invalid
+    value = get('position', _missing)
+    if value is None:
+        errors['position'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['position'] = ["Not a valid integer."]
+    value = get('project_ids', _missing)
+    if value is None:
+        errors['project_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['project_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid integer."] for index, item in enumerate(value) if type(item) is not int}
+            if invalid:
+                errors['project_ids'] = invalid
+    value = get('requested_by_id', _missing)
+    if value is None:
+        errors['requested_by_id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str or _uuid_match(value) is None:
+            errors['requested_by_id'] = ["Not a valid UUID."]
+    value = get('started', _missing)
+    if value is None:
+        errors['started'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not bool:
+            errors['started'] = ["Not a valid boolean."]
+    value = get('started_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['started_at'] = ["Not a valid datetime."]
+    value = get('started_at_override')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['started_at_override'] = ["Not a valid datetime."]
+    value = get('state', _missing)
+    if value is None:
+        errors['state'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['state'] = ["Not a valid string."]
+    value = get('stats', _missing)
+    if value is None:
+        errors['stats'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = validate_epic_stats(value)
+        if invalid:
+            errors['stats'] = invalid
+    value = get('updated_at')
+    if value is not None:
+        if not _is_datetime(value):
+            errors['updated_at'] = ["Not a valid datetime."]
+    return errors
+
+
+def validate_team(data):
+    """ Returns the errors Team().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('created_at', _missing)
+    if value is None:
+        errors['created_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['created_at'] = ["Not a valid datetime."]
+    value = get('description', _missing)
+    if value is None:
+        errors['description'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['description'] = ["Not a valid string."]
+    value = get('entity_type', _missing)
+    if value is None:
+        errors['entity_type'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['entity_type'] = ["Not a valid string."]
+    value = get('id', _missing)
+    if value is None:
+        errors['id'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['id'] = ["Not a valid integer."]
+    value = get('name', _missing)
+    if value is None:
+        errors['name'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['name'] = ["Not a valid string."]
+    value = get('position', _missing)
+    if value is None:
+        errors['position'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['position'] = ["Not a valid integer."]
+    value = get('project_ids', _missing)
+    if value is None:
+        errors['project_ids'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not list:
+            errors['project_ids'] = ['Not a valid list.']
+        else:
+            invalid = {index: ["Not a valid integer."] for index, item in enumerate(value) if type(item) is not int}
+            if invalid:
+                errors['project_ids'] = invalid
+    value = get('updated_at', _missing)
+    if value is None:
+        errors['updated_at'] = ['Field may not be null.']
+    elif value is not _missing:
+        if not _is_datetime(value):
+            errors['updated_at'] = ["Not a valid datetime."]
+    value = get('workflow', _missing)
+    if value is None:
+        errors['workflow'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = validate_workflow(value)
+        if invalid:
+            errors['workflow'] = invalid
+    return errors
+
+
+def validate_search_results(data):
+    """ Returns the errors SearchResults().validate(data) would, {} if none. """
+    if not isinstance(data, Mapping):
+        return {'_schema': ['Invalid input type.']}
+    errors = {}
+    get = data.get
+    value = get('data', _missing)
+    if value is None:
+        errors['data'] = ['Field may not be null.']
+    elif value is not _missing:
+        invalid = _many(validate_story_search, value)
+        if invalid:
+            errors['data'] = invalid
+    value = get('next', _missing)
+    if value is None:
+        errors['next'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not str:
+            errors['next'] = ["Not a valid string."]
+    value = get('total', _missing)
+    if value is None:
+        errors['total'] = ['Field may not be null.']
+    elif value is not _missing:
+        if type(value) is not int:
+            errors['total'] = ["Not a valid integer."]
+    return errors
+
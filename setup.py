@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
-from distutils.core import setup
-from setuptools import setup
+from setuptools import find_packages, setup
 
 
 VERSION = '0.1.0'
@@ -18,12 +17,16 @@ setup(
     url='https://github.com/mahmoudimus/clubhouse',
     packages=find_packages(exclude=['tests', '*.test', '*.test.*']),
     include_package_data=True,
-    zip_safe=False
+    zip_safe=False,
     install_requires=[
         'marshmallow>=3.0,<4',
         'attrs>=17.4.0,<17.5',
         'requests>=2.0,<3.0',
     ],
+    extras_require={
+        # clubhouse.client.AsyncClient
+        'async': ['aiohttp>=3.3,<4'],
+    },
     license='MIT',
     classifiers=[
         'Intended Audience :: Developers',
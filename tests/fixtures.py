@@ -0,0 +1,179 @@
+"""
+Data shared by the tests and the benchmarks: a synthetic Clubhouse-style
+API docs page for the generator, payloads synthesized from the generated
+schemas, and a story as the API sends it.
+"""
+import random
+import uuid
+
+#: the scalar field types the docs use
+SCALARS = ('Integer', 'String', 'Boolean', 'Date', 'UUID')
+
+#: survives the page's cp1252 -> iso-8859-2 round trip in parser.py
+NON_ASCII = 'Naïve café déjà vu'
+
+
+def field_type(rng, name, earlier, nesting, enums, nullable):
+    """ Picks the type cell for one field of resource ``name``. """
+    roll = rng.random()
+    if earlier and roll < nesting:
+        nested = rng.choice(earlier)
+        return 'Array [{0}]'.format(nested) if rng.random() < 0.5 \
+            else nested
+    roll = rng.random()
+    if roll < enums:
+        choices = ['{0}_{1}'.format(name.lower(), i)
+                   for i in range(rng.randint(2, 5))]
+        return 'Enum ({0})'.format(', '.join(choices))
+    scalar = rng.choice(SCALARS)
+    if rng.random() < 0.1:
+        return 'Array [{0}]'.format(scalar)
+    if rng.random() < nullable:
+        return '{0} or null'.format(scalar)
+    return scalar
+
+
+def generate(resources=40, fields=20, nesting=0.1, enums=0.05,
+             nullable=0.2, non_ascii=0.05, seed=0):
+    """ Returns the markup of a docs page.
+
+    ``resources`` x ``fields`` rows are generated. ``nesting``,
+    ``enums``, ``nullable`` and ``non_ascii`` are the fraction of fields
+    that reference another resource, are an Enum, are "or null", and
+    have a non-ASCII description respectively. The same ``seed`` always
+    gives the same page.
+    """
+    rng = random.Random(seed)
+    out = [
+        '<html><head><meta charset="utf-8"><title>Clubhouse API</title>'
+        '</head><body><h1>Introduction</h1><p>Synthetic docs.</p>'
+        '<table><tr><td>not a resource</td></tr></table>'
+        '<h1>Resources</h1>'
+    ]
+    names = []
+    for r in range(resources):
+        name = 'Resource{0}'.format(r)
+        out.append('<h2>{0}</h2><p>A {0} resource.</p><table><thead><tr>'
+                   '<th>Field</th><th>Description</th></tr></thead><tbody>'
+                   .format(name))
+        for f in range(fields):
+            type_ = field_type(rng, name, names, nesting, enums, nullable)
+            description = 'Description of field {0}.'.format(f)
+            if rng.random() < non_ascii:
+                description = '{0} {1}'.format(NON_ASCII, description)
+            out.append('<tr><td><strong>field_{0}</strong> <span>{1}</span>'
+                       '</td><td>{2}</td></tr>'
+                       .format(f, type_, description))
+        out.append('</tbody></table>')
+        names.append(name)
+    out.append('</body></html>')
+    return ''.join(out)
+
+
+def synthetic_value(field, rng):
+    """ A valid payload value for a field of clubhouse.models. """
+    name = type(field).__name__
+    if name == 'Nested':
+        schema = field.nested
+        if schema == 'self':
+            return [] if field.many else None
+        payload = synthetic_payload(schema, rng, depth=1)
+        return [payload] * rng.randint(0, 3) if field.many else payload
+    if name == 'List':
+        inner = getattr(field, 'inner', None) or field.container
+        return [synthetic_value(inner, rng) for _ in range(rng.randint(0, 3))]
+    if field.validators:
+        return rng.choice(list(field.validators[0].choices))
+    return {
+        'Integer': lambda: rng.randint(0, 1 << 20),
+        'String': lambda: 'text %d' % rng.randint(0, 1000),
+        'Boolean': lambda: rng.choice([True, False]),
+        'Date': lambda: '2018-%02d-%02d' % (rng.randint(1, 12),
+                                            rng.randint(1, 28)),
+        'DateTime': lambda: '2018-%02d-%02dT%02d:%02d:%02dZ' % (
+            rng.randint(1, 12), rng.randint(1, 28), rng.randint(0, 23),
+            rng.randint(0, 59), rng.randint(0, 59)),
+        'UUID': lambda: str(uuid.UUID(int=rng.getrandbits(128))),
+    }[name]()
+
+
+def synthetic_payload(schema, rng, depth=0):
+    payload = {}
+    for name, field in schema._declared_fields.items():
+        if depth and type(field).__name__ == 'Nested':
+            continue
+        payload[name] = synthetic_value(field, rng)
+    return payload
+
+
+#: a made-up story shaped like a GET /stories/{id} response: timestamps,
+#: deadline included, are datetimes as in the API docs' examples, and it
+#: has fields the docs don't list
+EXAMPLE_STORY = {
+    'app_url': 'https://app.clubhouse.io/example/story/1234',
+    'archived': False,
+    'blocked': False,
+    'blocker': False,
+    'branches': [],
+    'comments': [{
+        'author_id': '5a3bfb2e-5e0f-4a2a-a2e1-2a8e5f5e3b51',
+        'created_at': '2018-06-05T14:01:02Z',
+        'entity_type': 'story-comment',
+        'external_id': None,
+        'id': 2345,
+        'mention_ids': [],
+        'position': 1,
+        'reactions': [],
+        'story_id': 1234,
+        'text': 'Seen this on staging too.',
+        'updated_at': '2018-06-05T14:01:02Z',
+    }],
+    'commits': [],
+    'completed': False,
+    'completed_at': None,
+    'completed_at_override': None,
+    'created_at': '2018-06-04T09:15:36Z',
+    'cycle_time': 0,
+    'deadline': '2018-06-29T17:00:00Z',
+    'description': 'The export times out for workspaces with 10k stories.',
+    'entity_type': 'story',
+    'epic_id': 12,
+    'estimate': 3,
+    'external_id': None,
+    'external_tickets': [],
+    'files': [],
+    'follower_ids': ['5a3bfb2e-5e0f-4a2a-a2e1-2a8e5f5e3b51'],
+    'group_mention_ids': [],
+    'id': 1234,
+    'labels': [{
+        'archived': False,
+        'color': '#e75569',
+        'created_at': '2018-01-10T11:00:00Z',
+        'entity_type': 'label',
+        'external_id': None,
+        'id': 56,
+        'name': 'export',
+        'updated_at': '2018-01-10T11:00:00Z',
+    }],
+    'lead_time': 0,
+    'linked_files': [],
+    'member_mention_ids': [],
+    'mention_ids': [],
+    'moved_at': '2018-06-04T10:00:00.123Z',
+    'name': 'Exporting a large workspace times out',
+    'owner_ids': [],
+    'position': 65536,
+    'previous_iteration_ids': [],
+    'project_id': 7,
+    'pull_requests': [],
+    'requested_by_id': '5a3bfb2e-5e0f-4a2a-a2e1-2a8e5f5e3b51',
+    'started': True,
+    'started_at': '2018-06-04T10:00:00.123Z',
+    'started_at_override': None,
+    'stats': {'num_related_documents': 0},
+    'story_links': [],
+    'story_type': 'bug',
+    'tasks': [],
+    'updated_at': '2018-06-05T14:01:02Z',
+    'workflow_state_id': 500000011,
+}
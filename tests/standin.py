@@ -0,0 +1,220 @@
+"""
+A local stand-in for the Clubhouse API for the client tests and
+benchmarks. It serves canned resources over keep-alive HTTP/1.1,
+gzipped when asked to, after an optional fixed ``latency``, and counts
+the connections and requests it sees, and the most requests it was
+answering at once (``peak``)::
+
+    with StandIn({'stories': {1: {'id': 1, 'name': 'x'}}}) as server:
+        client = Client('token', api_url=server.url)
+        client.get_story(1)
+
+With a ``rate_limit`` of (requests a second, burst) it answers requests
+over that limit with a 429 and a Retry-After of a second, as the API
+does per token.
+
+Resources carry an ETag, and a request whose If-None-Match still matches
+it is answered 304 with no body.
+
+A list instead of an {id: body} dict is served in pages like a search,
+``page_size`` at a time with a ``next`` token for the following page.
+
+POST to a resource adds a body under the next id, PUT updates one and
+DELETE removes it.
+"""
+import gzip
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs, urlsplit
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # headers and body go out in separate writes, which Nagle's algorithm
+    # would hold back on a kept-alive connection
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.standin.count('connections')
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.server.standin.count('requests')
+        self.server.standin.enter()
+        try:
+            self.respond()
+        finally:
+            self.server.standin.leave()
+
+    def respond(self):
+        if self.server.standin.latency:
+            time.sleep(self.server.standin.latency)
+        if not self.server.standin.take_token():
+            self.server.standin.count('throttled')
+            return self.send_json(429, {'message': 'Too many requests.'},
+                                  {'Retry-After': '1'})
+        url = urlsplit(self.path)
+        path = url.path[len('/api/v2/'):].strip('/')
+        resources = self.server.standin.resources.get(path)
+        if isinstance(resources, list):
+            return self.send_page(resources, parse_qs(url.query))
+        parts = path.split('/')
+        resources = self.server.standin.resources.get(parts[0])
+        if resources is None or len(parts) > 2:
+            return self.send_json(404, {'message': 'Resource not found.'})
+        if len(parts) == 1:
+            return self.send_current(list(resources.values()))
+        try:
+            body = resources[int(parts[1])]
+        except (KeyError, ValueError):
+            return self.send_json(404, {'message': 'Resource not found.'})
+        self.send_current(body)
+
+    def do_POST(self):
+        self.write()
+
+    def do_PUT(self):
+        self.write()
+
+    def do_DELETE(self):
+        self.write()
+
+    def write(self):
+        self.server.standin.count('requests')
+        length = int(self.headers.get('Content-Length', 0))
+        body = json.loads(self.rfile.read(length).decode('utf-8') or 'null')
+        path = urlsplit(self.path).path[len('/api/v2/'):]
+        parts = path.strip('/').split('/')
+        resources = self.server.standin.resources.get(parts[0])
+        if resources is None or len(parts) > 2:
+            return self.send_json(404, {'message': 'Resource not found.'})
+        if self.command == 'POST':
+            resource_id = max(resources, default=0) + 1
+            resources[resource_id] = dict(body, id=resource_id)
+            return self.send_json(201, resources[resource_id])
+        try:
+            resource_id = int(parts[1])
+            current = resources[resource_id]
+        except (IndexError, KeyError, ValueError):
+            return self.send_json(404, {'message': 'Resource not found.'})
+        if self.command == 'PUT':
+            current.update(body)
+            return self.send_json(200, current)
+        del resources[resource_id]
+        self.send_response(204)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def send_current(self, body):
+        etag = '"{0}"'.format(hashlib.sha1(
+            json.dumps(body, sort_keys=True).encode('utf-8')).hexdigest())
+        if self.headers.get('If-None-Match') == etag:
+            self.server.standin.count('not_modified')
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.send_json(200, body, {'ETag': etag})
+
+    def send_page(self, results, query):
+        page_size = int(query.get('page_size', ['25'])[0])
+        start = int(query.get('next', ['0'])[0])
+        end = start + page_size
+        page = {'data': results[start:end], 'total': len(results)}
+        if end < len(results):
+            page['next'] = str(end)
+        self.send_json(200, page)
+
+    def send_json(self, status, body, headers=()):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        for name, value in dict(headers).items():
+            self.send_header(name, value)
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            data = gzip.compress(data, 1)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class StandIn(object):
+    """ Serves {resource path: {id: JSON body}} on a free local port. """
+
+    def __init__(self, resources, latency=0, rate_limit=None):
+        self.resources = resources
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.counters = {'connections': 0, 'requests': 0, 'throttled': 0,
+                         'not_modified': 0, 'peak': 0}
+        self._in_flight = 0
+        if rate_limit is not None:
+            self._tokens = float(rate_limit[1])
+            self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._server = _Server(('127.0.0.1', 0), _Handler)
+        self._server.standin = self
+        self.url = 'http://127.0.0.1:{0}/api/v2'.format(
+            self._server.server_address[1])
+
+    def count(self, name):
+        with self._lock:
+            self.counters[name] += 1
+
+    def enter(self):
+        with self._lock:
+            self._in_flight += 1
+            self.counters['peak'] = max(self.counters['peak'],
+                                        self._in_flight)
+
+    def leave(self):
+        with self._lock:
+            self._in_flight -= 1
+
+    def take_token(self):
+        if self.rate_limit is None:
+            return True
+        rate, burst = self.rate_limit
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(burst,
+                               self._tokens + (now - self._updated) * rate)
+            self._updated = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def reset(self):
+        with self._lock:
+            self.counters = dict.fromkeys(self.counters, 0)
+
+    def start(self):
+        thread = threading.Thread(target=self._server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
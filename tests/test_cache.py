@@ -0,0 +1,136 @@
+import pytest
+
+from clubhouse import models
+from clubhouse.cache import CacheEntry, ResponseCache
+from clubhouse.client import Client, ClubhouseError
+from tests.standin import StandIn
+
+STORIES = {story_id: {'id': story_id, 'name': 'Story {0}'.format(story_id)}
+           for story_id in range(1, 6)}
+
+
+@pytest.fixture
+def server():
+    with StandIn({'stories': {story_id: dict(story)
+                              for story_id, story in STORIES.items()},
+                  'projects': {7: {'id': 7, 'name': 'Export'}}}) as server:
+        yield server
+
+
+def cached_client(server, **options):
+    return Client('token', api_url=server.url,
+                  cache=ResponseCache(ttls={'stories': 60}, **options))
+
+
+def entry(path, token='token'):
+    return (path, '', token), CacheEntry(path, None, None, 0)
+
+
+def test_fresh_hit_sends_nothing(server):
+    with cached_client(server) as client:
+        story = client.get_story(1)
+        assert client.get_story(1) is story
+    assert server.counters['requests'] == 1
+
+
+def test_stale_entry_is_revalidated(server, monkeypatch):
+    loads = []
+
+    def load_story(data):
+        loads.append(data)
+        return models.Story().load(data)
+
+    monkeypatch.setattr(models, 'load_story', load_story)
+    with cached_client(server) as client:
+        client.cache.ttls['stories'] = 0
+        story = client.get_story(1)
+        assert client.get_story(1) is story
+        assert server.counters['not_modified'] == 1
+        assert len(loads) == 1
+
+        server.resources['stories'][1]['name'] = 'Renamed'
+        assert client.get_story(1).name == 'Renamed'
+        assert len(loads) == 2
+    assert server.counters['requests'] == 3
+
+
+def test_lru_evicts_at_maxsize(server):
+    with cached_client(server, maxsize=3) as client:
+        for story_id in (1, 2, 3):
+            client.get_story(story_id)
+        client.get_story(1)
+        client.get_story(4)
+        assert len(client.cache) == 3
+        server.reset()
+        # 2 was the least recently used
+        for story_id in (1, 3, 4):
+            client.get_story(story_id)
+        assert server.counters['requests'] == 0
+        client.get_story(2)
+        assert server.counters['requests'] == 1
+
+
+def test_update_invalidates_the_story(server):
+    with cached_client(server) as client:
+        client.get_story(1)
+        client.get_story(2)
+        client.update_story(1, {'name': 'Renamed'})
+        server.reset()
+        assert client.get_story(1).name == 'Renamed'
+        client.get_story(2)
+    assert server.counters['requests'] == 1
+
+
+def test_delete_invalidates_the_story(server):
+    with cached_client(server) as client:
+        client.get_story(1)
+        client.delete_story(1)
+        with pytest.raises(ClubhouseError) as excinfo:
+            client.get_story(1)
+    assert excinfo.value.status_code == 404
+
+
+def test_create_invalidates_story_lists(server):
+    with cached_client(server) as client:
+        client.get_story(1)
+        client.get_project(7)
+        client.cache.set(*entry('/projects/7/stories'))
+        client.cache.set(*entry('/stories'))
+        client.create_story({'name': 'New', 'project_id': 7})
+        assert sorted(key[0] for key in client.cache._entries) == [
+            '/projects/7', '/stories/1']
+
+
+def test_ttl_goes_by_the_resource_a_path_returns():
+    cache = ResponseCache(ttl=5, ttls={'stories': 1})
+    assert cache.ttl('/projects') == 60
+    assert cache.ttl('/projects/7') == 60
+    assert cache.ttl('/projects/7/stories') == 1
+    assert cache.ttl('/stories/1') == 1
+    assert cache.ttl('/epics/3') == 5
+    assert cache.ttl('/search/stories') is None
+
+
+def test_invalidate_drops_lists_and_parents():
+    cache = ResponseCache()
+    for path in ['/stories/1', '/stories/2', '/stories', '/projects/7',
+                 '/projects/7/stories', '/stories/1/comments/3']:
+        cache.set(*entry(path))
+    cache.set(*entry('/stories/1', token='other'))
+
+    cache.invalidate('/stories/1')
+    assert sorted(key[0] for key in cache._entries) == [
+        '/projects/7', '/stories/1/comments/3', '/stories/2']
+
+    cache.invalidate('/stories/2/comments')
+    assert sorted(key[0] for key in cache._entries) == [
+        '/projects/7', '/stories/1/comments/3']
+
+
+def test_tokens_do_not_share_entries(server):
+    cache = ResponseCache(ttls={'stories': 60})
+    with Client('token', api_url=server.url, cache=cache) as client, \
+            Client('other', api_url=server.url, cache=cache) as other:
+        assert client.get_story(1) is not other.get_story(1)
+    assert server.counters['requests'] == 2
+    assert len(cache) == 2
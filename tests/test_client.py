@@ -0,0 +1,110 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from clubhouse.client import AsyncClient, Client, ClubhouseError
+from tests.fixtures import EXAMPLE_STORY
+from tests.standin import StandIn
+
+STORIES = {story_id: dict(EXAMPLE_STORY, id=story_id)
+           for story_id in range(1, 21)}
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_get_story():
+    with StandIn({'stories': {1234: EXAMPLE_STORY}}) as server, \
+            Client('token', api_url=server.url) as client:
+        story = client.get_story(1234)
+    assert story.id == 1234
+    assert story.started_at == datetime(2018, 6, 4, 10, 0, 0, 123000,
+                                        tzinfo=timezone.utc)
+    assert story.labels[0].created_at.year == 2018
+
+
+def test_error_status_raises():
+    with StandIn({'stories': STORIES}) as server, \
+            Client('token', api_url=server.url) as client:
+        with pytest.raises(ClubhouseError) as excinfo:
+            client.get_story(404)
+    assert excinfo.value.status_code == 404
+    assert 'Resource not found.' in excinfo.value.body
+
+
+def test_async_get_stories_in_id_order_with_bounded_concurrency():
+    story_ids = sorted(STORIES, reverse=True)
+
+    async def get_stories(url):
+        async with AsyncClient('token', api_url=url,
+                               concurrency=4) as client:
+            return await client.get_stories(story_ids)
+
+    with StandIn({'stories': STORIES}, latency=0.02) as server:
+        stories = run(get_stories(server.url))
+    assert [story.id for story in stories] == story_ids
+    assert server.counters['requests'] == len(story_ids)
+    assert 1 < server.counters['peak'] <= 4
+
+
+def test_async_error_status_raises():
+    async def get_stories(url):
+        async with AsyncClient('token', api_url=url) as client:
+            return await client.get_stories([1, 404, 2])
+
+    with StandIn({'stories': STORIES}) as server:
+        with pytest.raises(ClubhouseError) as excinfo:
+            run(get_stories(server.url))
+    assert excinfo.value.status_code == 404
+
+
+RESULTS = [{'id': story_id, 'name': 'Story {0}'.format(story_id)}
+           for story_id in range(1, 56)]
+
+
+def test_search_stories_yields_every_page():
+    with StandIn({'search/stories': RESULTS}) as server, \
+            Client('token', api_url=server.url) as client:
+        stories = list(client.search_stories('is:story', page_size=10))
+    assert [story.id for story in stories] == [
+        result['id'] for result in RESULTS]
+    assert server.counters['requests'] == 6
+
+
+def test_search_stories_stops_paging_when_closed():
+    with StandIn({'search/stories': RESULTS}, latency=0.01) as server, \
+            Client('token', api_url=server.url) as client:
+        for story in client.search_stories('is:story', page_size=10):
+            break
+        # give a prefetch that was still running time to land
+        time.sleep(0.05)
+        assert story.id == 1
+        assert server.counters['requests'] <= 2
+
+
+def test_async_search_stories():
+    async def search(url, limit=None):
+        async with AsyncClient('token', api_url=url) as client:
+            stories = []
+            pages = client.search_stories('is:story', page_size=10)
+            async for story in pages:
+                stories.append(story)
+                if len(stories) == limit:
+                    break
+            await pages.aclose()
+            return stories
+
+    with StandIn({'search/stories': RESULTS}) as server:
+        stories = run(search(server.url))
+        assert [story.id for story in stories] == [
+            result['id'] for result in RESULTS]
+        server.reset()
+        assert [story.id for story in run(search(server.url, 1))] == [1]
+        assert server.counters['requests'] <= 2
@@ -0,0 +1,277 @@
+import random
+import threading
+import time
+
+import pytest
+
+from clubhouse.dag import (
+    CompactDAG, DAG, DAGValidationError, ReachabilityIndex, condense,
+    find_cycles, strongly_connected_components,
+)
+
+
+def test_reachability_index_rebuilds_after_graph_is_replaced():
+    d = DAG()
+    d.from_edges([(1, 2)], nodes=[1, 2, 3])
+    index = ReachabilityIndex(d)
+    assert index.reaches(1, 2)
+
+    d.from_edges([(3, 2)], nodes=[1, 2, 3])
+    assert not index.reaches(1, 2)
+    assert index.reaches(3, 2)
+
+
+def test_reachability_index_rebuilds_after_reset():
+    d = DAG()
+    d.from_dict({'a': ['b'], 'b': []})
+    index = ReachabilityIndex(d)
+    d.reset_graph()
+    d.from_dict({'a': [], 'b': ['a']})
+    assert index.reaches('b', 'a')
+    assert not index.reaches('a', 'b')
+
+
+def test_reachability_index_add_edge():
+    d = DAG()
+    d.from_edges([('a', 'b')], nodes=['a', 'b', 'c'])
+    index = ReachabilityIndex(d)
+    index.add_edge('b', 'c')
+    assert index.reaches('a', 'c')
+    assert d.predecessors('c') == ['b']
+    assert 'c' not in d.ind_nodes()
+    with pytest.raises(DAGValidationError):
+        index.add_edge('c', 'a')
+    # the index and a fresh one agree
+    assert (sorted(index.all_downstreams('a')) ==
+            sorted(ReachabilityIndex(d).all_downstreams('a')))
+
+
+def test_compact_dag_matches_dag():
+    d = DAG()
+    d.from_dict({'a': ['b', 'c'], 'b': ['d'], 'c': ['d'], 'd': []})
+    compact = CompactDAG(d.graph)
+    assert compact.topological_sort() == d.topological_sort()
+    assert compact.predecessors('d') == sorted(d.predecessors('d'))
+    assert compact.all_downstreams('a') == d.all_downstreams('a')
+    assert compact.ind_nodes() == d.ind_nodes()
+
+
+def random_edges(rng, nodes, count):
+    edges = set()
+    while len(edges) < count:
+        i, j = sorted(rng.sample(range(len(nodes)), 2))
+        edges.add((nodes[i], nodes[j]))
+    return sorted(edges)
+
+
+def test_order_only_depends_on_node_insertion_order():
+    rng = random.Random(0)
+    nodes = ['node{0}'.format(i) for i in range(200)]
+    edges = random_edges(rng, nodes, 600)
+    orders = set()
+    generations = set()
+    for _ in range(5):
+        rng.shuffle(edges)
+        d = DAG()
+        d.from_edges(edges, nodes=nodes)
+        order = d.topological_sort()
+        assert CompactDAG(d.graph).topological_sort() == order
+        orders.add(tuple(order))
+        generations.add(tuple(map(tuple, d.topological_generations())))
+    assert len(orders) == len(generations) == 1
+
+
+def test_ind_nodes_stay_in_graph_order():
+    d = DAG()
+    d.from_dict({'a': ['b'], 'b': [], 'c': []})
+    d.delete_edge('a', 'b')
+    assert d.ind_nodes() == ['a', 'b', 'c']
+    assert d.ind_nodes() == d.freeze().ind_nodes()
+
+    d.add_edge('c', 'a')
+    d.delete_node('c')
+    assert d.ind_nodes() == ['a', 'b']
+    d.rename_edges('a', 'z')
+    assert d.ind_nodes() == ['b', 'z'] == list(d.graph)
+
+
+def test_reachability_index_lists_nodes_in_topological_order():
+    d = DAG()
+    d.from_edges([('a', 'b')], nodes=['a', 'b', 'c'])
+    index = ReachabilityIndex(d)
+    index.add_node('x')
+    index.add_edge('c', 'x')
+    index.add_edge('x', 'a')
+    assert index.all_downstreams('c') == d.all_downstreams('c')
+    assert index.all_downstreams('c') == ['x', 'a', 'b']
+    assert index.all_upstreams('b') == ['c', 'x', 'a']
+
+
+def test_add_edge_rejects_cycles_and_leaves_graph_unchanged():
+    d = DAG()
+    d.from_dict({'a': ['b'], 'b': ['c'], 'c': [], 'd': []})
+    graph = {node: set(edges) for node, edges in d.graph.items()}
+    order = d.topological_sort()
+    for ind_node, dep_node in [('c', 'a'), ('b', 'a'), ('a', 'a')]:
+        with pytest.raises(DAGValidationError):
+            d.add_edge(ind_node, dep_node)
+        assert d.graph == graph
+        assert d.topological_sort() == order
+        assert d.predecessors('a') == []
+        assert d.ind_nodes() == ['a', 'd']
+
+    d.add_edge('d', 'a')
+    assert d.topological_sort() == ['d', 'a', 'b', 'c']
+    with pytest.raises(KeyError):
+        d.add_edge('a', 'missing')
+
+
+def test_from_edges_consumes_a_stream_once():
+    consumed = []
+
+    def edges():
+        for edge in [('a', 'b'), ('b', 'c'), ('a', 'c')]:
+            consumed.append(edge)
+            yield edge
+
+    d = DAG()
+    d.from_edges(edges(), nodes=['d'])
+    assert len(consumed) == 3
+    assert list(d.graph) == ['d', 'a', 'b', 'c']
+    assert d.topological_sort() == ['d', 'a', 'b', 'c']
+    assert sorted(d.predecessors('c')) == ['a', 'b']
+
+
+def test_from_edges_reports_cycles_and_leaves_graph_empty():
+    d = DAG()
+    d.from_dict({'x': []})
+    edges = iter([('a', 'b'), ('b', 'c'), ('c', 'a'), ('c', 'd')])
+    with pytest.raises(DAGValidationError) as excinfo:
+        d.from_edges(edges)
+    assert "cycles: [['a', 'b', 'c']]" in str(excinfo.value)
+    assert d.size() == 0
+    assert d.ind_nodes() == []
+    assert d.topological_sort() == []
+
+    with pytest.raises(DAGValidationError):
+        d.from_dict({'a': ['a']})
+    assert d.size() == 0
+    with pytest.raises(KeyError):
+        d.from_dict({'a': ['missing']})
+
+
+def test_topological_generations():
+    d = DAG()
+    d.from_dict({'a': ['b', 'c'], 'b': ['d'], 'c': ['d'], 'd': [], 'e': []})
+    assert list(d.topological_generations()) == [
+        ['a', 'e'], ['b', 'c'], ['d']]
+    with pytest.raises(ValueError):
+        list(d.topological_generations({'a': {'b'}, 'b': {'a'}}))
+
+
+def test_run_parallel_respects_dependencies_and_max_workers():
+    d = DAG()
+    d.from_edges(
+        [('root', 'leaf{0}'.format(i)) for i in range(12)] +
+        [('leaf{0}'.format(i), 'sink') for i in range(12)])
+    lock = threading.Lock()
+    running = set()
+    finished = set()
+    peak = []
+
+    def work(node):
+        with lock:
+            assert set(d.predecessors(node)) <= finished
+            running.add(node)
+            peak.append(len(running))
+        time.sleep(0.005)
+        with lock:
+            running.remove(node)
+            finished.add(node)
+        return node.upper()
+
+    results = d.run_parallel(work, max_workers=3)
+    assert results == {node: node.upper() for node in d.graph}
+    assert max(peak) == 3
+
+
+def test_run_parallel_reraises_first_failure():
+    d = DAG()
+    d.from_dict({'a': ['b'], 'b': ['c'], 'c': [], 'd': ['e'], 'e': []})
+    called = []
+
+    def work(node):
+        called.append(node)
+        if node in ('b', 'e'):
+            raise ValueError(node)
+
+    with pytest.raises(ValueError) as excinfo:
+        d.run_parallel(work, max_workers=1)
+    assert str(excinfo.value) == 'b'
+    assert 'c' not in called
+    assert 'e' not in called
+
+
+def all_paths(graph):
+    """ Every path of the DAG, found by brute force. """
+    stack = [[node] for node in graph]
+    while stack:
+        path = stack.pop()
+        yield path
+        for downstream_node in graph[path[-1]]:
+            stack.append(path + [downstream_node])
+
+
+def test_critical_path_matches_exhaustive_search():
+    rng = random.Random(1)
+    for _ in range(20):
+        nodes = list(range(10))
+        d = DAG()
+        d.from_edges(random_edges(rng, nodes, 15), nodes=nodes)
+        weights = {node: rng.choice([None, 0, 1, 2, 5]) for node in nodes}
+        del weights[0]
+
+        def cost(path):
+            return sum(weights.get(node) or 0 for node in path)
+
+        paths = list(all_paths(d.graph))
+        total = max(map(cost, paths))
+        result = d.critical_path(weights)
+        assert result.total == total
+        assert result.path in paths
+        assert cost(result.path) == total
+        assert result.slack == {
+            node: total - max(cost(path) for path in paths if node in path)
+            for node in nodes}
+
+
+def test_critical_path_of_empty_graph():
+    assert DAG().critical_path({}) == ([], 0, {})
+
+
+#: a -> b -> a and a -> b -> c -> a are nested in one component, d loops
+#: on itself and e only appears as an edge target
+CYCLIC = {'a': ['b'], 'b': ['c', 'a'], 'c': ['a', 'd'], 'd': ['d', 'e']}
+
+
+def test_strongly_connected_components():
+    components = strongly_connected_components(CYCLIC)
+    assert [sorted(component) for component in components] == [
+        ['a', 'b', 'c'], ['d'], ['e']]
+    assert strongly_connected_components({}) == []
+
+
+def test_find_cycles():
+    assert [sorted(cycle) for cycle in find_cycles(CYCLIC)] == [
+        ['a', 'b', 'c'], ['d']]
+    assert find_cycles({'a': ['b'], 'b': []}) == []
+
+
+def test_condense():
+    dag, cycles = condense(CYCLIC)
+    nodes = [tuple(sorted(node)) for node in dag.topological_sort()]
+    assert nodes == [('a', 'b', 'c'), ('d',), ('e',)]
+    assert [len(generation)
+            for generation in dag.topological_generations()] == [1, 1, 1]
+    assert [sorted(cycle) for cycle in cycles] == [['a', 'b', 'c'], ['d']]
+    assert all(node not in dag.graph[node] for node in dag.graph)
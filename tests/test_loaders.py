@@ -0,0 +1,78 @@
+import random
+from datetime import datetime, timezone
+
+import pytest
+from marshmallow import ValidationError
+
+from clubhouse import models
+from tests.fixtures import EXAMPLE_STORY, synthetic_payload
+
+STORIES = [synthetic_payload(models.Story, random.Random(seed))
+           for seed in range(50)]
+
+
+def invalid_payloads(payload):
+    """ Copies of payload that both load paths must reject. """
+    yield 'not a mapping'
+    yield dict(payload, id='not a number')
+    yield dict(payload, id=None)
+    yield dict(payload, name=1)
+    yield dict(payload, archived='maybe')
+    yield dict(payload, created_at='yesterday')
+    yield dict(payload, requested_by_id='not a uuid')
+    yield dict(payload, owner_ids='not a list')
+    yield dict(payload, labels=[{'id': 'x'}])
+
+
+@pytest.mark.parametrize('payload', STORIES)
+def test_load_story_matches_schema(payload):
+    assert models.load_story(payload) == models.Story().load(payload)
+
+
+def test_load_example_story():
+    story = models.load_story(EXAMPLE_STORY)
+    assert story == models.Story().load(EXAMPLE_STORY)
+    assert story.created_at == datetime(2018, 6, 4, 9, 15, 36,
+                                        tzinfo=timezone.utc)
+    assert story.deadline == datetime(2018, 6, 29, 17,
+                                      tzinfo=timezone.utc)
+    assert story.comments[0].updated_at.hour == 14
+    assert story.labels[0].name == 'export'
+
+
+@pytest.mark.parametrize('load', [
+    models.ThreadedComment().load, models.load_threaded_comment,
+])
+def test_load_datetime(load):
+    comment = load({'created_at': '2018-01-01T10:00:00Z'})
+    assert comment.created_at == datetime(2018, 1, 1, 10,
+                                          tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize('load', [
+    models.Story().load, models.load_story,
+    models.ThreadedComment().load, models.load_threaded_comment,
+])
+def test_unknown_fields_are_excluded(load):
+    model = load({'id': 1, 'unknown_field': 1})
+    assert model.id == 1
+    assert not hasattr(model, 'unknown_field')
+
+
+@pytest.mark.parametrize('load', [models.Story().load, models.load_story])
+@pytest.mark.parametrize('invalid', list(invalid_payloads(STORIES[0])))
+def test_load_story_rejects_invalid(load, invalid):
+    with pytest.raises(ValidationError):
+        load(invalid)
+
+
+def test_load_enum():
+    params = {'name': 'x', 'story_type': 'bug'}
+    assert (models.load_create_story_params(params) ==
+            models.CreateStoryParams().load(params))
+
+    # Story has no enum fields, CreateStoryParams.story_type is one
+    for load in (models.CreateStoryParams().load,
+                 models.load_create_story_params):
+        with pytest.raises(ValidationError):
+            load(dict(params, story_type='epic'))
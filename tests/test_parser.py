@@ -0,0 +1,68 @@
+import os
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from lxml import html
+
+from clubhouse import parser
+from tests import fixtures
+
+PARSER = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, 'clubhouse',
+    'parser.py')
+
+
+@pytest.fixture(scope='module')
+def docs(tmpdir_factory):
+    path = tmpdir_factory.mktemp('docs').join('docs.html')
+    path.write_binary(fixtures.generate(
+        resources=60, fields=10, nesting=0.3).encode('utf-8'))
+    return str(path)
+
+
+def generate(docs, *options, hash_seed='random'):
+    env = dict(os.environ, PYTHONHASHSEED=hash_seed)
+    return subprocess.check_output(
+        [sys.executable, PARSER, docs, '-l', 'warning'] + list(options),
+        env=env)
+
+
+def test_output_does_not_depend_on_hash_seed(docs):
+    outputs = {generate(docs, hash_seed=seed) for seed in ('1', '2', '3')}
+    assert len(outputs) == 1
+
+
+@pytest.mark.parametrize('options', [
+    ['--stream'],
+    ['-j', '3'],
+    ['--cache', 'CACHE'],
+    ['--cache', 'CACHE', '-j', '3'],
+    ['--stream', '--cache', 'CACHE'],
+])
+def test_output_does_not_depend_on_mode(docs, tmpdir, options):
+    expected = generate(docs)
+    cache = str(tmpdir.join('cache'))
+    options = [cache if option == 'CACHE' else option for option in options]
+    assert generate(docs, *options) == expected
+    if cache in options:
+        # and again, rendered from the cache this time
+        assert generate(docs, *options) == expected
+
+    outfile = tmpdir.join('out.py')
+    generate(docs, '-o', str(outfile), *options)
+    assert outfile.read_binary() == expected
+
+
+def test_normalize_is_forwarded(docs):
+    with open(docs, 'rb') as infile:
+        expected = parser.parse(html.parse(infile), normalize=str.upper)
+    assert any(field['description'].isupper()
+               for fields in expected.values() for field in fields.values())
+
+    with open(docs, 'rb') as infile:
+        assert dict(parser.parse_stream(infile, str.upper)) == expected
+    with open(docs, 'rb') as infile, ProcessPoolExecutor(2) as executor:
+        assert parser.parse(html.parse(infile), executor=executor,
+                            normalize=str.upper) == expected
@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import time
+from email.utils import formatdate
+
+import pytest
+
+from clubhouse.ratelimit import (
+    BULK, INTERACTIVE, RateLimiter, parse_retry_after,
+)
+
+
+def queued(limiter):
+    return sum(limiter.metrics()['queue_depth'].values())
+
+
+def wait_for_queue(limiter, depth):
+    deadline = time.monotonic() + 2
+    while queued(limiter) < depth:
+        assert time.monotonic() < deadline, 'waiters never queued'
+        time.sleep(0.001)
+
+
+def test_interactive_goes_before_queued_bulk():
+    limiter = RateLimiter(rate=50, burst=1)
+    limiter.throttled(0.2)
+    served = []
+
+    def acquire(priority):
+        limiter.acquire(priority)
+        served.append(priority)
+
+    threads = []
+    for depth, priority in enumerate([BULK, BULK, INTERACTIVE], 1):
+        thread = threading.Thread(target=acquire, args=(priority,))
+        thread.daemon = True
+        thread.start()
+        threads.append(thread)
+        wait_for_queue(limiter, depth)
+    for thread in threads:
+        thread.join(5)
+        assert not thread.is_alive()
+    assert served == [INTERACTIVE, BULK, BULK]
+
+
+def test_throttled_holds_requests_and_halves_rate_once_per_pause():
+    limiter = RateLimiter(rate=100, burst=10)
+    start = time.monotonic()
+    limiter.throttled(0.1)
+    limiter.throttled(0.1)
+    assert limiter.rate == 50
+    limiter.acquire()
+    assert time.monotonic() - start >= 0.1
+    assert limiter.metrics()['throttled'] == 2
+
+    # the pause is over, so the next 429 lowers the rate again
+    limiter.throttled(0)
+    assert limiter.rate == 25
+
+
+def test_succeeded_recovers_to_max_rate():
+    limiter = RateLimiter(rate=10, increase=1)
+    limiter.throttled(0)
+    assert limiter.rate == 5
+    for _ in range(4):
+        limiter.succeeded()
+    assert limiter.rate == 9
+    # within 10% of the rate the 429 came at, it only creeps up
+    limiter.succeeded()
+    assert limiter.rate == pytest.approx(9.1)
+    for _ in range(20):
+        limiter.succeeded()
+    assert limiter.rate == limiter.max_rate
+
+
+def test_cancelled_acquire_async_wakes_the_next_waiter():
+    limiter = RateLimiter(rate=50, burst=1)
+    limiter.throttled(0.1)
+
+    async def cancel_head():
+        head = asyncio.ensure_future(limiter.acquire_async(INTERACTIVE))
+        behind = asyncio.ensure_future(limiter.acquire_async(BULK))
+        await asyncio.sleep(0.01)
+        assert queued(limiter) == 2
+        head.cancel()
+        await asyncio.wait_for(behind, 2)
+        with pytest.raises(asyncio.CancelledError):
+            await head
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(cancel_head())
+    finally:
+        loop.close()
+    assert queued(limiter) == 0
+    assert limiter.metrics()['acquired'] == {INTERACTIVE: 0, BULK: 1}
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('120', 120.0),
+    ('1.5', 1.5),
+    ('-5', 0.0),
+    (formatdate(0, usegmt=True), 0.0),
+    ('soon', None),
+    ('', None),
+    (None, None),
+])
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    value = formatdate(time.time() + 60, usegmt=True)
+    assert 58 <= parse_retry_after(value) <= 60
@@ -0,0 +1,59 @@
+import pytest
+
+from clubhouse import models, validators
+
+
+@pytest.mark.parametrize('value', ['2018-01-01', '2018-1-5'])
+def test_valid_date(value):
+    assert validators._is_date(value)
+
+
+@pytest.mark.parametrize('value', [
+    '2018-01-01garbage', '2018-13-45', '2018-02-30', '2018-01-01T10:00:00Z',
+    '', 20180101, None,
+])
+def test_invalid_date(value):
+    assert not validators._is_date(value)
+
+
+@pytest.mark.parametrize('deadline', ['2016-12-31T12:30:00Z', None])
+def test_valid_deadline(deadline):
+    payload = {'deadline': deadline}
+    assert validators.validate_story(payload) == {}
+    assert models.Story().validate(payload) == {}
+
+
+@pytest.mark.parametrize('deadline', [
+    '2018-06-29', '2018-02-30T10:00:00Z', '', 20180101,
+])
+def test_invalid_deadline(deadline):
+    payload = {'deadline': deadline}
+    assert validators.validate_story(payload) == {
+        'deadline': ['Not a valid datetime.']}
+    assert set(models.Story().validate(payload)) == {'deadline'}
+
+
+@pytest.mark.parametrize('created_at', [
+    '2018-01-01T10:00:00Z', '2018-01-01T10:00:00.123+02:00',
+    '2018-01-01 10:00',
+])
+def test_valid_datetime(created_at):
+    payload = {'created_at': created_at}
+    assert validators.validate_story(payload) == {}
+    assert models.Story().validate(payload) == {}
+
+
+@pytest.mark.parametrize('created_at', [
+    '2018-01-01', '2018-01-01T25:00:00Z', '2018-02-30T10:00:00Z',
+    '2018-01-01T10:00:00Zgarbage', '', None,
+])
+def test_invalid_datetime(created_at):
+    payload = {'created_at': created_at}
+    assert set(validators.validate_story(payload)) == {'created_at'}
+    assert set(models.Story().validate(payload)) == {'created_at'}
+
+
+def test_unknown_fields_are_ignored():
+    payload = {'id': 1, 'unknown_field': 1}
+    assert validators.validate_story(payload) == {}
+    assert models.Story().validate(payload) == {}